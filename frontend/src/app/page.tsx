@@ -64,6 +64,7 @@ const CAPABILITIES = [
   { id: "nillion", name: "Privacy" },
   { id: "pyth", name: "Pyth" },
   { id: "chainlink", name: "Chainlink" },
+  { id: "portfolio", name: "Portfolio" },
   { id: "onramp", name: "Onramp" }
 ];
 
@@ -294,7 +295,10 @@ export default function VeritasPlayground() {
     try {
       const ws = new WebSocket(`${WS_BASE_URL}/agents/${id}/ws?token=${encodeURIComponent(cdpId.trim())}`);
       wsRef.current = ws;
-      ws.onmessage = (e) => setLogs(prev => [...prev, JSON.parse(e.data)]);
+      ws.onmessage = (e) => {
+        const { events } = JSON.parse(e.data);
+        setLogs(prev => [...prev, ...events]);
+      };
       ws.onerror = (e) => {
         console.error('WebSocket error:', e);
       };
@@ -339,8 +343,8 @@ export default function VeritasPlayground() {
 
       const ws = new WebSocket(`${WS_BASE_URL}/agents/${id}/ws?token=${encodeURIComponent(cdpId.trim())}`);
       ws.onmessage = (e) => {
-        const log = JSON.parse(e.data);
-        setPersistentLogs(prev => ({ ...prev, [id]: [...(prev[id] || []), log] }));
+        const { events } = JSON.parse(e.data);
+        setPersistentLogs(prev => ({ ...prev, [id]: [...(prev[id] || []), ...events] }));
       };
       ws.onerror = (e) => {
         console.error('WebSocket error:', e);
@@ -1,35 +1,23 @@
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Awaitable, Dict, List, Optional, Callable, Tuple
 import os
 import json
 import asyncio
+import contextvars
 import uuid
 from datetime import datetime
 from .logger import VeritasLogger
 from .attestor import VeritasAttestor
 from .brain import BrainFactory
-from .database import get_db_context, SessionModel, LogModel
-from .tools import (
-    VeritasCapability,
-    VeritasTool,
-    WalletCapability,
-    TradeCapability,
-    TokenCapability,
-    ERC721Capability,
-    BasenameCapability,
-    SocialCapability,
-    PaymentCapability,
-    CreatorCapability,
-    PrivacyCapability,
-    AaveCapability,
-    CompoundCapability,
-    PythCapability,
-    OnrampCapability,
-    ChainlinkCapability,
-)
+from .config import settings
+from .rpc_pool import CHAIN_READ_TTL, cached_call, get_async_web3, get_web3
+from .database import get_db_context, insert_logs, SessionModel
+from .tools import CAP_MAP, VeritasCapability, VeritasTool
 from eth_account import Account
-from web3 import Web3
 from cdp import CdpClient
 
+# Set while a tool runs, so actions nested inside it (adapter-wrapped tools) reuse its slot
+_holding_tool_slot = contextvars.ContextVar("_holding_tool_slot", default=False)
+
 
 class VeritasAgent:
     """
@@ -51,7 +39,11 @@ class VeritasAgent:
         self.id = str(uuid.uuid4())
         self.name = name
         self.network = network
-        self.logger = VeritasLogger()
+        spill_path = None
+        if settings.LOG_SPILL_DIR:
+            os.makedirs(settings.LOG_SPILL_DIR, exist_ok=True)
+            spill_path = os.path.join(settings.LOG_SPILL_DIR, f"{self.id}.jsonl")
+        self.logger = VeritasLogger(spill_path=spill_path)
         self.capabilities: Dict[str, VeritasCapability] = {}
         self.tools: Dict[str, VeritasTool] = {}
         self.status = "idle"
@@ -63,13 +55,13 @@ class VeritasAgent:
         else:
             self.account = Account.create()
 
-        # Web3 setup for balance checks
-        RPC_URLS = {
-            "base-sepolia": "https://sepolia.base.org",
-            "base-mainnet": "https://base-mainnet.public.blastapi.io",
-        }
-        rpc_url = RPC_URLS.get(network, RPC_URLS["base-sepolia"])
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+        # Web3 clients shared with every other agent on this network; tools await the async one
+        self.w3 = get_web3(network)
+        self.async_w3 = get_async_web3(network)
+        self._chain_reads: Dict[str, Tuple[float, asyncio.Future]] = {}
+        # Bounds concurrent tool executions to what the shared RPC pools can serve
+        self.rpc_concurrency = settings.RPC_CONCURRENCY
+        self._tool_slots = asyncio.Semaphore(self.rpc_concurrency)
 
         # Infrastructure Setup
         self.client_credentials = {}
@@ -95,12 +87,37 @@ class VeritasAgent:
             self.tools[tool.name] = tool
         print(f"[VeritasAgent] Loaded capability: {capability.name}")
 
+    async def chain_read(self, key: str, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Chain read shared by this agent's tools, reused for CHAIN_READ_TTL seconds."""
+        return await cached_call(self._chain_reads, key, CHAIN_READ_TTL, coro_factory)
+
+    async def next_tx_params(self) -> Tuple[int, int]:
+        """(gasPrice, nonce) for a tool transaction.
+
+        The nonce comes from the attestor's counter, so it is only read from the node once;
+        call attestor.reset_nonce() if the transaction is not sent. If this raises, no nonce
+        is held.
+        """
+        gas_price, nonce = await asyncio.gather(
+            self.chain_read("gas_price", lambda: self.async_w3.eth.gas_price),
+            self.attestor.reserve_nonce(),
+            return_exceptions=True,
+        )
+        if isinstance(gas_price, BaseException):
+            if not isinstance(nonce, BaseException):
+                self.attestor.reset_nonce()  # don't leave a gap in the shared counter
+            raise gas_price
+        if isinstance(nonce, BaseException):
+            raise nonce
+        return gas_price, nonce
+
     async def call_tool(self, tool_name: str, **kwargs):
         """Execute a tool by name with automatic auditing."""
         if tool_name not in self.tools:
             raise ValueError(f"Tool not found: {tool_name}")
 
         tool = self.tools[tool_name]
+        tool.validate_args(kwargs)
         return await self.execute_action(tool_name, tool.func, **kwargs)
 
     async def shutdown(self):
@@ -108,6 +125,8 @@ class VeritasAgent:
         self.status = "shutdown"
         if hasattr(self.client, "close"):
             await self.client.close()
+        if hasattr(self.brain, "aclose"):
+            await self.brain.aclose()
 
     async def execute_action(self, tool_name: str, func: Callable, *args, **kwargs):
         """Execute a tool action with automatic logging."""
@@ -116,11 +135,21 @@ class VeritasAgent:
 
         import inspect
 
-        if inspect.iscoroutinefunction(wrapped):
-            return await wrapped(*args, basis_id=basis_id, **kwargs)
-        else:
+        if _holding_tool_slot.get():
+            if inspect.iscoroutinefunction(wrapped):
+                return await wrapped(*args, basis_id=basis_id, **kwargs)
             return wrapped(*args, basis_id=basis_id, **kwargs)
 
+        async with self._tool_slots:
+            token = _holding_tool_slot.set(True)
+            try:
+                if inspect.iscoroutinefunction(wrapped):
+                    return await wrapped(*args, basis_id=basis_id, **kwargs)
+                else:
+                    return wrapped(*args, basis_id=basis_id, **kwargs)
+            finally:
+                _holding_tool_slot.reset(token)
+
     async def run_mission(self, objective: str, max_steps: int = 5) -> str:
         """Execute a mission autonomously: Observe -> Think -> Act (Loop)."""
         print(f"[VeritasAgent] Starting autonomous mission: {objective}")
@@ -135,7 +164,7 @@ class VeritasAgent:
                 {"name": t.name, "description": t.description, "parameters": t.parameters}
                 for t in self.tools.values()
             ]
-            recent_logs = [log.model_dump(mode="json") for log in self.logger.get_logs()[-3:]]
+            recent_logs = [log.to_payload() for log in self.logger.recent_logs(3)]
 
             system_prompt = f"""You are an autonomous crypto agent named {self.name}.
  Objective: {objective}
@@ -347,7 +376,7 @@ class PersistentVeritasAgent(VeritasAgent):
             {"name": t.name, "description": t.description, "parameters": t.parameters}
             for t in self.tools.values()
         ]
-        recent_logs = [log.model_dump(mode="json") for log in self.logger.get_logs()[-3:]]
+        recent_logs = [log.to_payload() for log in self.logger.recent_logs(3)]
 
         system_prompt = f"""You are an autonomous crypto agent named {self.name}.
 You are running in PERSISTENT MODE - you run continuously until stopped.
@@ -410,7 +439,7 @@ INSTRUCTIONS:
 
                 async with get_db_context() as db:
                     session = SessionModel(
-                        id=str(uuid.uuid4()),
+                        id=os.urandom(16).hex(),
                         agent_id=self.id,
                         objective=objective,
                         status="completed",
@@ -419,19 +448,9 @@ INSTRUCTIONS:
                     )
                     db.add(session)
 
-                    for log in logs:
-                        db_log = LogModel(
-                            id=str(uuid.uuid4()),
-                            session_id=session.id,
-                            basis_id=log.basis_id,
-                            event_type=log.event_type,
-                            tool_name=log.tool_name,
-                            input_params={},
-                            output_result=str(log.output_result) if log.output_result else None,
-                            timestamp=log.timestamp,
-                            merkle_leaf=log.merkle_leaf if hasattr(log, "merkle_leaf") else "",
-                        )
-                        db.add(db_log)
+                    # Session row must exist before its logs (FK); autoflush is off
+                    await db.flush()
+                    await insert_logs(db, session.id, logs)
 
                     await db.commit()
                     print(f"[PersistentAgent] Session saved: {session.id}")
@@ -514,7 +533,7 @@ INSTRUCTIONS:
             "current_objective": self.current_objective,
             "condition_monitors": self.condition_monitors,
             "checkpointed_at": datetime.utcnow().isoformat(),
-            "logs": [log.model_dump(mode="json") for log in self.logger.get_logs()],
+            "logs": [log.to_payload() for log in self.logger.get_logs()],
             "session_root": self.logger.get_current_root(),
         }
 
@@ -594,23 +613,6 @@ async def create_persistent_agent(
     )
 
     # Load capabilities
-    CAP_MAP = {
-        "wallet": WalletCapability,
-        "token": TokenCapability,
-        "trading": TradeCapability,
-        "nft": ERC721Capability,
-        "basename": BasenameCapability,
-        "social": SocialCapability,
-        "payments": PaymentCapability,
-        "creator": CreatorCapability,
-        "privacy": PrivacyCapability,
-        "aave": AaveCapability,
-        "compound": CompoundCapability,
-        "pyth": PythCapability,
-        "onramp": OnrampCapability,
-        "chainlink": ChainlinkCapability,
-    }
-
     for cap_name in capabilities:
         if cap_name in CAP_MAP:
             agent.load_capability(CAP_MAP[cap_name](agent))
@@ -0,0 +1,175 @@
+"""Redis pub/sub bus so several API workers can share agent events and control.
+
+Agent instances (wallets, brain clients, run loops) cannot move between processes,
+so each persistent agent is owned by the worker that started it. Redis carries:
+
+- ``agent:{id}:events``  log/status events, fanned out to every worker's WS clients
+- ``agent:{id}:control`` stop/send requests, handled by whichever worker owns the agent
+- ``agent:{id}:owner``   ownership key with a TTL, refreshed while the agent runs
+"""
+
+import asyncio
+import logging
+import uuid
+from typing import Awaitable, Callable, Optional, Set
+
+import orjson
+import redis.asyncio as redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+logger = logging.getLogger(__name__)
+
+OWNER_TTL = 30  # seconds
+HEARTBEAT_INTERVAL = 10  # seconds
+RECONNECT_DELAY = 1  # seconds, doubled per failed attempt
+MAX_RECONNECT_DELAY = 30  # seconds
+
+
+class RedisBus:
+    """Publishes events/control messages and dispatches the ones this worker receives."""
+
+    def __init__(
+        self,
+        url: str,
+        on_event: Callable[[str, bytes], None],
+        on_control: Callable[[str, dict], Awaitable[None]],
+    ):
+        self.url = url
+        self.worker_id = uuid.uuid4().hex
+        self._on_event = on_event
+        self._on_control = on_control
+        self._redis: Optional[redis.Redis] = None
+        self._outbox: asyncio.Queue = asyncio.Queue()
+        self._owned: Set[str] = set()
+        self._tasks: list = []
+        self._control_tasks: Set[asyncio.Task] = set()
+
+    async def start(self):
+        self._redis = redis.from_url(self.url)
+        await self._redis.ping()  # fail fast so the API falls back to worker-local events
+        subscribed = asyncio.get_running_loop().create_future()
+        self._tasks = [
+            asyncio.create_task(self._reader(subscribed)),
+            asyncio.create_task(self._publisher()),
+            asyncio.create_task(self._heartbeat()),
+        ]
+        await subscribed
+
+    async def close(self):
+        for task in [*self._tasks, *self._control_tasks]:
+            task.cancel()
+        for agent_id in list(self._owned):
+            await self.release(agent_id)
+        if self._redis is not None:
+            await self._redis.aclose()
+
+    def publish_event(self, agent_id: str, payload: bytes):
+        """Queue an already-serialized event; the publisher task pipelines the sends."""
+        self._outbox.put_nowait((f"agent:{agent_id}:events", payload))
+
+    async def send_control(self, agent_id: str, message: dict) -> bool:
+        """Forward a control message to the owning worker. False if nobody owns the agent."""
+        try:
+            if await self._redis.get(f"agent:{agent_id}:owner") is None:
+                return False
+            await self._redis.publish(f"agent:{agent_id}:control", orjson.dumps(message))
+        except RedisConnectionError:
+            logger.exception("Failed to send %s to agent %s", message.get("action"), agent_id)
+            return False
+        return True
+
+    async def claim(self, agent_id: str) -> bool:
+        """Take ownership of an agent unless another live worker already has it."""
+        claimed = await self._redis.set(
+            f"agent:{agent_id}:owner", self.worker_id, nx=True, ex=OWNER_TTL
+        )
+        if claimed:
+            self._owned.add(agent_id)
+        return bool(claimed)
+
+    async def release(self, agent_id: str):
+        self._owned.discard(agent_id)
+        key = f"agent:{agent_id}:owner"
+        try:
+            if await self._redis.get(key) == self.worker_id.encode():
+                await self._redis.delete(key)
+        except RedisConnectionError:
+            # The key expires on its own once heartbeats stop
+            logger.exception("Failed to release ownership of agent %s", agent_id)
+
+    async def _reader(self, subscribed: asyncio.Future):
+        """Dispatch bus messages, resubscribing with backoff if the connection drops."""
+        delay = RECONNECT_DELAY
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.psubscribe("agent:*:events", "agent:*:control")
+                if not subscribed.done():
+                    subscribed.set_result(None)
+                delay = RECONNECT_DELAY
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        self._dispatch(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if not subscribed.done():
+                    subscribed.set_exception(e)
+                    return
+                logger.warning("Redis subscription lost (%s); resubscribing in %ss", e, delay)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    def _dispatch(self, message: dict):
+        _, agent_id, kind = message["channel"].decode().split(":", 2)
+        try:
+            if kind == "events":
+                self._on_event(agent_id, message["data"])
+            elif agent_id in self._owned:
+                # Handlers may stop an agent; run them aside so event fan-out isn't held up
+                task = asyncio.create_task(
+                    self._run_control(agent_id, orjson.loads(message["data"]))
+                )
+                self._control_tasks.add(task)
+                task.add_done_callback(self._control_tasks.discard)
+        except Exception:
+            logger.exception("Failed to handle %s message for agent %s", kind, agent_id)
+
+    async def _run_control(self, agent_id: str, message: dict):
+        try:
+            await self._on_control(agent_id, message)
+        except Exception:
+            logger.exception("Failed to handle control message for agent %s", agent_id)
+
+    async def _publisher(self):
+        while True:
+            batch = [await self._outbox.get()]
+            while not self._outbox.empty():
+                batch.append(self._outbox.get_nowait())
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for channel, payload in batch:
+                        pipe.publish(channel, payload)
+                    await pipe.execute()
+            except Exception:
+                logger.exception("Failed to publish %d agent events", len(batch))
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            await self.refresh_ownership()
+
+    async def refresh_ownership(self):
+        """Extend the owner-key TTL of every agent this worker runs."""
+        for agent_id in list(self._owned):
+            try:
+                await self._redis.set(
+                    f"agent:{agent_id}:owner", self.worker_id, xx=True, ex=OWNER_TTL
+                )
+            except Exception:
+                logger.exception("Failed to refresh ownership of agent %s", agent_id)
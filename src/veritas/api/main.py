@@ -1,28 +1,77 @@
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Request
+from fastapi import BackgroundTasks, FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import select, update
+from sqlalchemy.orm import raiseload, selectinload
 from .schemas import AgentCreate, MissionRequest, AgentResponse, MissionResponse
+from .bus import RedisBus
 from ..agent import VeritasAgent, PersistentVeritasAgent
-from ..database import AgentModel, SessionModel, LogModel, get_db_context, init_db, close_db
+from ..logger import ActionLog
+from ..tools import CAP_MAP
+from .. import crypto
+from ..config import settings
+from ..rpc_pool import close_async_web3
+from ..database import (
+    AgentModel,
+    SessionModel,
+    get_db_context,
+    get_db_ro,
+    init_db,
+    close_db,
+    insert_logs,
+)
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
 import uuid
 import asyncio
+import hmac
+import logging
 import os
-from typing import Dict, List, Any
+import queue
+import time
+import orjson
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple, Any
 from web3 import Web3
 
 load_dotenv()
 
+# Environment-derived settings are fixed for the life of the process; read them once
+# instead of on every request/connection.
+WEBSOCKET_TOKEN = (
+    (os.getenv("WEBSOCKET_TOKEN") or os.getenv("CDP_API_KEY_ID") or "").strip("\"'").encode()
+)
+# Parsed rather than bool()'d so the compose files' ENABLE_MAINNET=false really disables it
+ENABLE_MAINNET = os.getenv("ENABLE_MAINNET", "").strip().lower() in ("1", "true", "yes")
+
+logger = logging.getLogger("veritas.api")
+
+# Records from every veritas.* logger go through a queue; a background listener
+# thread does the actual stderr writes so they never block the event loop.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_handler, respect_handler_level=True)
+
+
+def _configure_logging() -> None:
+    pkg_logger = logging.getLogger("veritas")
+    if not any(isinstance(h, QueueHandler) for h in pkg_logger.handlers):
+        pkg_logger.addHandler(QueueHandler(_log_queue))
+    pkg_logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
+    pkg_logger.propagate = False
+
+
 limiter = Limiter(key_func=get_remote_address)
 
-app = FastAPI(title="Veritas Agent OS API")
+app = FastAPI(title="Veritas Agent OS API", default_response_class=ORJSONResponse)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[call-arg]
-app.add_middleware(SlowAPIMiddleware)
+# No SlowAPIMiddleware: there are no default limits, so it would only wrap every request
+# in BaseHTTPMiddleware. The @limiter.limit decorators enforce the per-route limits.
 
 # SECURITY: Only allow specific origins
 # For development: localhost:3001 (frontend)
@@ -35,53 +84,124 @@ allowed_origins = [
 if os.getenv("CORS_ORIGINS"):
     allowed_origins.extend(os.getenv("CORS_ORIGINS").split(","))
 
+# CORSMiddleware is pure ASGI and sits outermost, so preflights are answered before
+# reaching any route. A long max_age lets browsers skip repeat preflights entirely
+# (Chromium caps this at 2h).
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
     allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
     allow_headers=["Content-Type", "Authorization"],
     allow_credentials=True,
+    max_age=7200,
 )
 
 
+def _json_default(obj: Any) -> Any:
+    """orjson fallback for pydantic models (e.g. ActionLog) embedded in payloads."""
+    if isinstance(obj, ActionLog):
+        return obj.to_payload()
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class VeritasJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also serializes pydantic models found in the content."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+
 @app.on_event("startup")
 async def startup():
+    _configure_logging()
+    _log_listener.start()
+    crypto.warmup()
     await init_db()
+    await _start_bus()
 
 
 @app.on_event("shutdown")
 async def shutdown():
+    if manager.bus is not None:
+        await manager.bus.close()
+    await close_async_web3()
     await close_db()
+    _log_listener.stop()
 
 
 class ConnectionManager:
+    """Per-socket bounded queues drained by writer tasks that batch events into one frame."""
+
+    QUEUE_SIZE = 256
+    MAX_BATCH = 64
+
     def __init__(self):
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+        # Keyed by id(websocket) so disconnect is an O(1) pop rather than a list scan
+        self.active_connections: Dict[
+            str, Dict[int, Tuple[WebSocket, asyncio.Queue, asyncio.Task]]
+        ] = {}
+        # Set at startup when REDIS_URL is configured; events then go via Redis so
+        # clients connected to any worker see them
+        self.bus: Optional[RedisBus] = None
 
     async def connect(self, agent_id: str, websocket: WebSocket):
         await websocket.accept()
-        if agent_id not in self.active_connections:
-            self.active_connections[agent_id] = []
-        self.active_connections[agent_id].append(websocket)
+        queue_: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        writer = asyncio.create_task(self._writer(agent_id, websocket, queue_))
+        self.active_connections.setdefault(agent_id, {})[id(websocket)] = (
+            websocket,
+            queue_,
+            writer,
+        )
 
     def disconnect(self, agent_id: str, websocket: WebSocket):
-        if agent_id in self.active_connections:
-            self.active_connections[agent_id].remove(websocket)
-
-    async def broadcast(self, agent_id: str, message: dict):
-        if agent_id in self.active_connections:
-            dead_connections = []
-            for connection in self.active_connections[agent_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception as e:
-                    # Log error and mark connection for removal
-                    print(f"[WebSocket] Failed to send to agent {agent_id}: {e}")
-                    dead_connections.append(connection)
-
-            # Clean up dead connections
-            for conn in dead_connections:
-                self.disconnect(agent_id, conn)
+        connections = self.active_connections.get(agent_id)
+        if connections is None:
+            return
+        entry = connections.pop(id(websocket), None)
+        if not connections:
+            del self.active_connections[agent_id]
+        if entry is not None and entry[2] is not asyncio.current_task():
+            entry[2].cancel()
+
+    def enqueue(self, agent_id: str, message: Any):
+        if self.bus is None and agent_id not in self.active_connections:
+            return
+
+        # Serialize once for all subscribers; writers splice the pre-encoded events
+        # into their batch frame. uvicorn negotiates permessage-deflate, which pays off
+        # now that frames carry whole batches of text-heavy log JSON.
+        payload = orjson.dumps(message, default=_json_default)
+        if self.bus is not None:
+            self.bus.publish_event(agent_id, payload)
+        else:
+            self.deliver(agent_id, payload)
+
+    def deliver(self, agent_id: str, payload: bytes):
+        """Hand a serialized event to this worker's sockets for the agent."""
+        connections = self.active_connections.get(agent_id)
+        if not connections:
+            return
+        for _, queue_, _ in connections.values():
+            if queue_.full():
+                # Drop the oldest event rather than let a stalled client grow memory
+                queue_.get_nowait()
+            queue_.put_nowait(payload)
+
+    async def _writer(self, agent_id: str, websocket: WebSocket, queue_: asyncio.Queue):
+        while True:
+            batch = [await queue_.get()]
+            while len(batch) < self.MAX_BATCH and not queue_.empty():
+                batch.append(queue_.get_nowait())
+            frame = b'{"events":[' + b",".join(batch) + b"]}"
+            try:
+                await websocket.send_text(frame.decode())
+            except Exception as e:
+                print(f"[WebSocket] Failed to send to agent {agent_id}: {e}")
+                self.disconnect(agent_id, websocket)
+                return
 
 
 manager = ConnectionManager()
@@ -89,6 +209,37 @@ active_agents: Dict[str, VeritasAgent] = {}
 persistent_agents: Dict[str, Any] = {}
 
 
+async def _start_bus():
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        return
+    bus = RedisBus(redis_url, on_event=manager.deliver, on_control=_handle_control)
+    try:
+        await bus.start()
+    except Exception as e:
+        logger.warning("Redis unavailable (%s); agent events stay in this worker", e)
+        await bus.close()
+        return
+    manager.bus = bus
+
+
+async def _stop_local_agent(agent_id: str):
+    agent = persistent_agents.pop(agent_id)
+    await agent.stop()
+    if manager.bus is not None:
+        await manager.bus.release(agent_id)
+
+
+async def _handle_control(agent_id: str, message: dict):
+    """Apply a stop/send request forwarded by another worker to an agent running here."""
+    if agent_id not in persistent_agents:
+        return
+    if message.get("action") == "stop":
+        await _stop_local_agent(agent_id)
+    elif message.get("action") == "send":
+        await persistent_agents[agent_id].send_message(message["message"])
+
+
 @app.get("/")
 async def root():
     return {"status": "online", "version": "0.1.0"}
@@ -110,22 +261,21 @@ async def debug_agents():
 
 @app.get("/agents")
 async def list_agents():
-    async with get_db_context() as db:
-        agents = await db.execute(select(AgentModel).order_by(AgentModel.created_at.desc()))
-        result = []
-        for a in agents.scalars().all():
-            created = a.created_at.isoformat() if a.created_at else None
-            result.append(
-                {
-                    "id": a.id,
-                    "name": a.name,
-                    "address": a.address,
-                    "network": a.network,
-                    "status": a.status or "active",
-                    "created_at": created,
-                }
-            )
-        return result
+    async with get_db_ro() as db:
+        agents = await db.scalars(select(AgentModel).order_by(AgentModel.created_at.desc()))
+        result = [
+            {
+                "id": a.id,
+                "name": a.name,
+                "address": a.address,
+                "network": a.network,
+                "status": a.status or "active",
+                "created_at": a.created_at,
+            }
+            for a in agents.all()
+        ]
+        # Returned as a Response so FastAPI skips jsonable_encoder; orjson encodes datetimes
+        return VeritasJSONResponse(content=result)
 
 
 @app.post("/debug/clear-agents")
@@ -136,53 +286,90 @@ async def clear_agents():
 
 
 def load_agent_capabilities(agent, capabilities):
-    from ..tools import (
-        WalletCapability,
-        TradeCapability,
-        TokenCapability,
-        ERC721Capability,
-        BasenameCapability,
-        SocialCapability,
-        PaymentCapability,
-        CreatorCapability,
-        PrivacyCapability,
-        AaveCapability,
-        CompoundCapability,
-        PythCapability,
-        OnrampCapability,
-        ChainlinkCapability,
-    )
+    for cap_name in capabilities:
+        cap_cls = CAP_MAP.get(cap_name)
+        if cap_cls is not None:
+            agent.load_capability(cap_cls(agent))
 
-    CAP_MAP = {
-        "wallet": WalletCapability,
-        "trading": TradeCapability,
-        "token": TokenCapability,
-        "erc20": TokenCapability,  # Alias for token
-        "nft": ERC721Capability,
-        "basename": BasenameCapability,
-        "identity": BasenameCapability,  # Alias for basename
-        "social": SocialCapability,
-        "payments": PaymentCapability,
-        "creator": CreatorCapability,
-        "privacy": PrivacyCapability,
-        "aave": AaveCapability,
-        "defi": AaveCapability,  # Alias for aave
-        "compound": CompoundCapability,
-        "pyth": PythCapability,
-        "onramp": OnrampCapability,
-        "chainlink": ChainlinkCapability,
-        "data": ChainlinkCapability,  # Alias for chainlink
-    }
 
-    for cap_name in capabilities:
-        if cap_name in CAP_MAP:
-            agent.load_capability(CAP_MAP[cap_name](agent))
+FAUCET_TIMEOUT = 8  # seconds to wait for faucet funds before activating anyway
+
+
+async def _get_balance(agent: VeritasAgent) -> int:
+    # web3's HTTPProvider is blocking; keep the RPC round trip off the event loop
+    return await asyncio.to_thread(agent.w3.eth.get_balance, agent.account.address)
+
+
+async def _wait_for_balance(agent: VeritasAgent, min_balance: int, interval: float = 0.5) -> int:
+    """Poll the wallet until it holds at least min_balance wei; returns the balance."""
+    while True:
+        balance = await _get_balance(agent)
+        if balance >= min_balance:
+            return balance
+        await asyncio.sleep(interval)
+
+
+async def _faucet_and_activate(agent_id: str, agent: VeritasAgent):
+    """Top up a fresh testnet wallet from the CDP faucet, then mark the agent active."""
+    try:
+        wei_bal = await _get_balance(agent)
+        min_balance = Web3.to_wei(0.001, "ether")
+        if wei_bal < min_balance:
+            print(
+                f"[API] Wallet {agent.account.address} has {Web3.from_wei(wei_bal, 'ether')} ETH. Requesting faucet..."
+            )
+            # Fire the faucet requests together and stop as soon as the balance is met
+            faucet_calls = [
+                asyncio.create_task(
+                    agent.client.evm.request_faucet(
+                        address=agent.account.address,
+                        network="base-sepolia",
+                        token="eth",
+                    )
+                )
+                for _ in range(3)
+            ]
+            try:
+                new_bal = await asyncio.wait_for(
+                    _wait_for_balance(agent, min_balance), timeout=FAUCET_TIMEOUT
+                )
+                print(f"[API] Faucet success: {Web3.from_wei(new_bal, 'ether')} ETH")
+            except asyncio.TimeoutError:
+                print(f"[API] Faucet did not fund {agent.account.address} within {FAUCET_TIMEOUT}s")
+            finally:
+                for call in faucet_calls:
+                    call.cancel()
+                await asyncio.gather(*faucet_calls, return_exceptions=True)
+    except Exception as fe:
+        print(f"[API] Faucet skipped: {fe}")
+
+    try:
+        async with get_db_context() as db:
+            await db.execute(
+                update(AgentModel).where(AgentModel.id == agent_id).values(status="active")
+            )
+            await db.commit()
+    except Exception:
+        logger.exception("Failed to activate agent %s", agent_id)
+        return
+
+    # Shaped like a log entry so the dashboard's log stream can render it
+    manager.enqueue(
+        agent_id,
+        {
+            "type": "status_change",
+            "status": "active",
+            "event_type": "STATUS",
+            "tool_name": "provisioning",
+            "timestamp": time.time(),
+        },
+    )
 
 
-@app.post("/agents", response_model=AgentResponse)
+@app.post("/agents", response_model=AgentResponse, status_code=202)
 @limiter.limit("5/minute")
-async def create_agent(request: Request, config: AgentCreate):
-    if config.network != "base-sepolia" and not os.getenv("ENABLE_MAINNET"):
+async def create_agent(request: Request, config: AgentCreate, background_tasks: BackgroundTasks):
+    if config.network != "base-sepolia" and not ENABLE_MAINNET:
         raise HTTPException(
             status_code=400,
             detail="Mainnet deployment is currently disabled for beta. Use 'base-sepolia'.",
@@ -200,30 +387,11 @@ async def create_agent(request: Request, config: AgentCreate):
             minimax_api_key=config.minimax_api_key,
         )
 
-        if config.network == "base-sepolia":
-            try:
-                wei_bal = agent.w3.eth.get_balance(agent.account.address)
-                min_balance = Web3.to_wei(0.001, "ether")
-                if wei_bal < min_balance:
-                    print(
-                        f"[API] Wallet {agent.account.address} has {Web3.from_wei(wei_bal, 'ether')} ETH. Requesting faucet..."
-                    )
-                    for _ in range(3):
-                        await agent.client.evm.request_faucet(
-                            address=agent.account.address,
-                            network="base-sepolia",
-                            token="eth",
-                        )
-                        await asyncio.sleep(2)
-                        new_bal = agent.w3.eth.get_balance(agent.account.address)
-                        if new_bal >= min_balance:
-                            print(f"[API] Faucet success: {Web3.from_wei(new_bal, 'ether')} ETH")
-                            break
-            except Exception as fe:
-                print(f"[API] Faucet skipped: {fe}")
+        # Testnet wallets are funded from the faucet after we respond
+        needs_faucet = config.network == "base-sepolia"
 
         def on_new_log(log_entry):
-            asyncio.create_task(manager.broadcast(agent_id, log_entry.model_dump(mode="json")))
+            manager.enqueue(agent_id, log_entry.to_payload())
 
         agent.logger.listeners.append(on_new_log)
 
@@ -237,6 +405,7 @@ async def create_agent(request: Request, config: AgentCreate):
                 brain_provider=config.brain_provider,
                 address=agent.account.address,
                 private_key=config.private_key,
+                status="provisioning" if needs_faucet else "active",
                 capabilities=config.capabilities,
                 config={
                     "cdp_api_key_id": config.cdp_api_key_id,
@@ -247,6 +416,9 @@ async def create_agent(request: Request, config: AgentCreate):
             db.add(db_agent)
             await db.commit()
 
+        if needs_faucet:
+            background_tasks.add_task(_faucet_and_activate, agent_id, agent)
+
         return {
             "id": agent_id,
             "name": agent.name,
@@ -256,10 +428,24 @@ async def create_agent(request: Request, config: AgentCreate):
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception:
-        import traceback
+        # Full traceback goes to the server log only; clients get a generic message
+        logger.exception("create_agent failed for %s", agent_id)
+        raise HTTPException(status_code=500, detail="Failed to create agent")
+
 
-        error_msg = traceback.format_exc()
-        raise HTTPException(status_code=500, detail=error_msg)
+_WS_AUTH_LOG_INTERVAL = 1.0  # seconds
+_last_ws_auth_log = 0.0
+
+
+def _log_ws_auth_failure(websocket: WebSocket, agent_id: str, reason: str):
+    # At most one line per interval so a client hammering bad tokens can't flood the log
+    global _last_ws_auth_log
+    now = time.monotonic()
+    if now - _last_ws_auth_log < _WS_AUTH_LOG_INTERVAL:
+        return
+    _last_ws_auth_log = now
+    client_host = websocket.client.host if websocket.client else "unknown"
+    logger.warning("WebSocket auth failed for agent %s: %s from %s", agent_id, reason, client_host)
 
 
 @app.websocket("/agents/{agent_id}/ws")
@@ -271,35 +457,31 @@ async def websocket_endpoint(websocket: WebSocket, agent_id: str):
     if token:
         token = token.strip("\"'")
 
-    # Get expected token from environment variable
-    expected_token = os.getenv("WEBSOCKET_TOKEN") or os.getenv("CDP_API_KEY_ID")
-    if expected_token:
-        expected_token = expected_token.strip("\"'")
-
-    # Log authentication attempt
-    client_host = websocket.client.host if websocket.client else "unknown"
     if not token:
-        print(
-            f"[WebSocket] Authentication failed for agent {agent_id}: missing token from {client_host}"
-        )
-        await websocket.close(code=403, reason="Missing authentication token")
+        _log_ws_auth_failure(websocket, agent_id, "missing token")
+        await websocket.close(code=1008)
         return
 
-    if token != expected_token:
-        print(
-            f"[WebSocket] Authentication failed for agent {agent_id}: invalid token from {client_host}"
-        )
-        print(f"[WebSocket] Expected: {expected_token[:20]}... Received: {token[:20]}...")
-        await websocket.close(code=403, reason="Invalid authentication token")
+    # Constant-time comparison so the token can't be recovered from response timing
+    if not hmac.compare_digest(token.encode(), WEBSOCKET_TOKEN):
+        _log_ws_auth_failure(websocket, agent_id, "invalid token")
+        await websocket.close(code=1008)
         return
 
     # Authentication successful
+    client_host = websocket.client.host if websocket.client else "unknown"
     print(f"[WebSocket] Authentication successful for agent {agent_id} from {client_host}")
     await manager.connect(agent_id, websocket)
     try:
+        # Inbound frames are ignored; read raw ASGI messages so nothing gets decoded
+        # and just wait for the disconnect. Liveness is left to uvicorn's ping/pong.
         while True:
-            await websocket.receive_text()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(agent_id, websocket)
         print(f"[WebSocket] Client disconnected from agent {agent_id}")
 
@@ -307,12 +489,14 @@ async def websocket_endpoint(websocket: WebSocket, agent_id: str):
 @app.post("/agents/{agent_id}/run", response_model=MissionResponse)
 @limiter.limit("10/minute")
 async def run_mission(request: Request, agent_id: str, mission_req: MissionRequest):
-    agent = None
+    # One session for the whole request. The read transaction is committed before the
+    # mission runs so no pooled connection is held across the (long) LLM loop.
+    async with get_db_context() as db:
+        agent = None
 
-    if agent_id in active_agents:
-        agent = active_agents[agent_id]
-    else:
-        async with get_db_context() as db:
+        if agent_id in active_agents:
+            agent = active_agents[agent_id]
+        else:
             db_agent = await db.get(AgentModel, agent_id)
             if not db_agent:
                 raise HTTPException(status_code=404, detail="Agent not found")
@@ -336,28 +520,30 @@ async def run_mission(request: Request, agent_id: str, mission_req: MissionReque
             load_agent_capabilities(agent, db_agent.capabilities or [])
 
             def on_new_log(log_entry):
-                asyncio.create_task(manager.broadcast(agent_id, log_entry.model_dump(mode="json")))
+                manager.enqueue(agent_id, log_entry.to_payload())
 
             agent.logger.listeners.append(on_new_log)
 
-    session_id = str(uuid.uuid4())
+            # End the read transaction; the connection goes back to the pool
+            await db.commit()
 
-    try:
-        root = await agent.run_mission(mission_req.objective)
+        session_id = os.urandom(16).hex()
 
-        # Try to attest on-chain, but don't fail if wallet has no ETH
-        tx_hash = None
         try:
-            tx_hash = await agent.attestor.attest_root(merkle_root=root, agent_id=agent.name)
-        except Exception as att_err:
-            if "insufficient funds" in str(att_err).lower():
-                print(f"[API] Attestation skipped: Agent wallet has no ETH for gas")
-            else:
-                print(f"[API] Attestation failed: {att_err}")
+            root = await agent.run_mission(mission_req.objective)
 
-        logs = agent.logger.get_logs()
+            # Try to attest on-chain, but don't fail if wallet has no ETH
+            tx_hash = None
+            try:
+                tx_hash = await agent.attestor.attest_root(merkle_root=root, agent_id=agent.name)
+            except Exception as att_err:
+                if "insufficient funds" in str(att_err).lower():
+                    print(f"[API] Attestation skipped: Agent wallet has no ETH for gas")
+                else:
+                    print(f"[API] Attestation failed: {att_err}")
+
+            logs = agent.logger.get_logs()
 
-        async with get_db_context() as db:
             session = SessionModel(
                 id=session_id,
                 agent_id=agent_id,
@@ -368,41 +554,33 @@ async def run_mission(request: Request, agent_id: str, mission_req: MissionReque
             )
             db.add(session)
 
-            for log in logs:
-                db_log = LogModel(
-                    id=str(uuid.uuid4()),
-                    session_id=session_id,
-                    basis_id=log.basis_id,
-                    event_type=log.event_type,
-                    tool_name=log.tool_name,
-                    input_params={},
-                    output_result=str(log.output_result) if log.output_result else None,
-                    timestamp=log.timestamp,
-                    merkle_leaf=log.merkle_leaf if hasattr(log, "merkle_leaf") else "",
-                )
-                db.add(db_log)
+            # Session row must exist before its logs (FK); autoflush is off
+            await db.flush()
+            await insert_logs(db, session_id, logs)
 
             await db.commit()
 
-        return {
-            "status": "success",
-            "session_root": root,
-            "attestation_tx": tx_hash,
-            "logs": [log.model_dump(mode="json") for log in logs],
-        }
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        import traceback
-
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+            return VeritasJSONResponse(
+                content={
+                    "status": "success",
+                    "session_root": root,
+                    "attestation_tx": tx_hash,
+                    "logs": logs,
+                }
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception:
+            logger.exception("run_mission failed for %s", agent_id)
+            raise HTTPException(status_code=500, detail="Mission failed")
 
 
 @app.post("/agents/{agent_id}/start")
 async def start_persistent_agent(request: Request, agent_id: str, body: dict | None = None):
     if agent_id in persistent_agents:
         raise HTTPException(status_code=400, detail="Agent already running")
+    if manager.bus is not None and not await manager.bus.claim(agent_id):
+        raise HTTPException(status_code=400, detail="Agent already running")
 
     try:
         async with get_db_context() as db:
@@ -434,7 +612,7 @@ async def start_persistent_agent(request: Request, agent_id: str, body: dict | N
             load_agent_capabilities(persistent_agent, db_agent.capabilities or [])
 
             def on_new_log(log_entry):
-                asyncio.create_task(manager.broadcast(agent_id, log_entry.model_dump(mode="json")))
+                manager.enqueue(agent_id, log_entry.to_payload())
 
             persistent_agent.logger.listeners.append(on_new_log)
 
@@ -448,43 +626,46 @@ async def start_persistent_agent(request: Request, agent_id: str, body: dict | N
                 "name": persistent_agent.name,
             }
     except HTTPException:
+        if manager.bus is not None:
+            await manager.bus.release(agent_id)
         raise
-    except Exception as e:
-        import traceback
-
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        if manager.bus is not None:
+            await manager.bus.release(agent_id)
+        logger.exception("start_persistent_agent failed for %s", agent_id)
+        raise HTTPException(status_code=500, detail="Failed to start agent")
 
 
 @app.post("/agents/{agent_id}/stop")
 async def stop_persistent_agent(agent_id: str):
-    if agent_id not in persistent_agents:
+    if agent_id in persistent_agents:
+        await _stop_local_agent(agent_id)
+    elif manager.bus is None or not await manager.bus.send_control(agent_id, {"action": "stop"}):
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    agent = persistent_agents[agent_id]
-    await agent.stop()
-    del persistent_agents[agent_id]
-
     async with get_db_context() as db:
-        db_agent = await db.get(AgentModel, agent_id)
-        if db_agent:
-            object.__setattr__(db_agent, "status", "stopped")  # noqa: F841
-            await db.commit()
+        await db.execute(
+            update(AgentModel).where(AgentModel.id == agent_id).values(status="stopped")
+        )
+        await db.commit()
 
     return {"status": "stopped", "agent_id": agent_id}
 
 
 @app.post("/agents/{agent_id}/send")
 async def send_message_to_agent(agent_id: str, body: dict):
-    if agent_id not in persistent_agents:
+    running_here = agent_id in persistent_agents
+    if not running_here and manager.bus is None:
         raise HTTPException(status_code=404, detail="Agent not found")
 
     message = body.get("message", "")
     if not message:
         raise HTTPException(status_code=400, detail="Message required")
 
-    agent = persistent_agents[agent_id]
-    await agent.send_message(message)
+    if running_here:
+        await persistent_agents[agent_id].send_message(message)
+    elif not await manager.bus.send_control(agent_id, {"action": "send", "message": message}):
+        raise HTTPException(status_code=404, detail="Agent not found")
 
     return {"status": "message_sent", "agent_id": agent_id}
 
@@ -496,41 +677,38 @@ async def stop_agent(agent_id: str):
         del active_agents[agent_id]
 
     if agent_id in persistent_agents:
-        agent = persistent_agents[agent_id]
-        await agent.stop()
-        del persistent_agents[agent_id]
+        await _stop_local_agent(agent_id)
+    elif manager.bus is not None:
+        await manager.bus.send_control(agent_id, {"action": "stop"})
 
     async with get_db_context() as db:
-        agent = await db.get(AgentModel, agent_id)
-        if agent:
-            object.__setattr__(agent, "status", "terminated")  # type: ignore[attr-defined]
-            await db.commit()
+        await db.execute(
+            update(AgentModel).where(AgentModel.id == agent_id).values(status="terminated")
+        )
+        await db.commit()
 
     return {"status": "terminated"}
 
 
 @app.get("/agents/{agent_id}/history")
 async def get_agent_history(agent_id: str):
-    from ..database import SessionModel, LogModel, AgentModel
-
-    async with get_db_context() as db:
+    async with get_db_ro() as db:
         # First check if agent exists
         agent = await db.get(AgentModel, agent_id)
         if not agent:
             raise HTTPException(status_code=404, detail="Agent not found")
 
-        sessions = await db.execute(
-            SessionModel.__table__.select().where(SessionModel.agent_id == agent_id)
-        )
-        sessions = sessions.fetchall()
+        # Load every session's logs in one extra SELECT ... IN rather than a query per session
+        sessions = (
+            await db.scalars(
+                select(SessionModel)
+                .where(SessionModel.agent_id == agent_id)
+                .options(selectinload(SessionModel.logs), raiseload("*"))
+            )
+        ).all()
 
         history = []
         for session in sessions:
-            logs = await db.execute(
-                LogModel.__table__.select().where(LogModel.session_id == session.id)
-            )
-            logs = logs.fetchall()
-
             history.append(
                 {
                     "session_id": session.id,
@@ -538,7 +716,7 @@ async def get_agent_history(agent_id: str):
                     "status": session.status,
                     "session_root": session.session_root,
                     "attestation_tx": session.attestation_tx,
-                    "created_at": session.created_at.isoformat() if session.created_at else None,
+                    "created_at": session.created_at,
                     "logs": [
                         {
                             "event_type": log.event_type,
@@ -546,9 +724,9 @@ async def get_agent_history(agent_id: str):
                             "output_result": log.output_result,
                             "timestamp": log.timestamp,
                         }
-                        for log in logs
+                        for log in session.logs
                     ],
                 }
             )
 
-        return {"agent_id": agent_id, "sessions": history}
+        return VeritasJSONResponse(content={"agent_id": agent_id, "sessions": history})
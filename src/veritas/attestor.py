@@ -1,13 +1,35 @@
 from eth_abi import encode
-from typing import Optional, Any
-from web3 import Web3
+from eth_utils import keccak
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from functools import lru_cache
+import asyncio
+import statistics
 import time
 import json
+import logging
 import os
 
+from .config import settings
+from .rpc_pool import async_web3_for_url, cached_call
+
+logger = logging.getLogger(__name__)
+
 # Constants
 EAS_CONTRACT_ADDRESS = "0x4200000000000000000000000000000000000021"
 DEFAULT_SCHEMA_UID = "0x4ee2145e253098e581a38bdbb7f7c81eae64b6d9d5868063c71b562779056441"
+BLOCK_NUMBER_TTL = 1.0  # seconds; well under Base's 2s block time
+_STRING_OFFSET = (3 * 32).to_bytes(32, "big")  # agentId data follows the three head words
+
+# EAS.attest(AttestationRequest): calldata is encoded directly, without the contract wrapper
+_ATTEST_SELECTOR = keccak(text="attest((bytes32,(address,uint64,bool,bytes32,bytes,uint256)))")[:4]
+_ATTEST_ARG_TYPES = ["(bytes32,(address,uint64,bool,bytes32,bytes,uint256))"]
+
+
+@lru_cache(maxsize=1)
+def _load_eas_abi() -> list:
+    abi_path = os.path.join(os.path.dirname(__file__), "eas_abi.json")
+    with open(abi_path, "r") as f:
+        return json.load(f)
 
 
 class VeritasAttestor:
@@ -15,6 +37,12 @@ class VeritasAttestor:
     Handles on-chain attestations using EAS on Base (Base Sepolia/Mainnet).
     """
 
+    # AttestationRequestData fields before `data`: recipient, expirationTime, revocable, refUID.
+    # Shared immutable constants; each attestation only appends (data, value).
+    _ZERO_ADDR = "0x" + "00" * 20
+    _ZERO_REFUID = bytes(32)
+    _REQUEST_HEAD = (_ZERO_ADDR, 0, True, _ZERO_REFUID)
+
     NETWORK_CONFIG = {
         "base-sepolia": {"chainId": 84532, "rpc": "https://base-sepolia.drpc.org"},
         "base-mainnet": {"chainId": 8453, "rpc": "https://mainnet.base.org"},
@@ -24,11 +52,90 @@ class VeritasAttestor:
         self.client = client
         self.account = account
         self.network_id = network_id
-        self.schema_uid = os.getenv("EAS_SCHEMA_UID", DEFAULT_SCHEMA_UID)
+        self.schema_uid = settings.EAS_SCHEMA_UID or DEFAULT_SCHEMA_UID
+        self.eas_abi = _load_eas_abi()
+
+        # RPC client is shared per endpoint; attest() calldata is encoded locally
+        config = self.NETWORK_CONFIG.get(network_id, self.NETWORK_CONFIG["base-sepolia"])
+        self.chain_id = config["chainId"]
+        self.w3 = async_web3_for_url(config["rpc"])
+        self.address = account.address
+
+        # ABI-encoded agentId string (length word + padded bytes) per agent_id
+        self._payload_tails: Dict[str, bytes] = {}
+
+        # (block_number, maxFeePerGas, maxPriorityFeePerGas), resampled once per block
+        self._fee_cache: Optional[Tuple[int, int, int]] = None
+
+        # Short-lived results of per-block reads, shared by concurrent attestations
+        self._rpc_cache: Dict[str, Tuple[float, asyncio.Future]] = {}
+
+        # Local nonce counter: read from the node once, then incremented in-process
+        self._nonce_lock = asyncio.Lock()
+        self._next_nonce: Optional[int] = None
+
+    def _encode_payload(self, root_bytes: bytes, agent_id: str, timestamp: int) -> bytes:
+        """abi.encode(bytes32 merkleRoot, string agentId, uint256 timestamp).
+
+        The layout is fixed: merkleRoot in word 0, the string offset (always 0x60) in word 1
+        and the timestamp in word 2, then the length-prefixed, zero-padded string. The tail
+        only depends on agent_id, so it is built once per agent and the payload is a join.
+        """
+        if len(root_bytes) != 32:
+            raise ValueError(f"Merkle root must be 32 bytes, got {len(root_bytes)}")
+
+        tail = self._payload_tails.get(agent_id)
+        if tail is None:
+            raw = agent_id.encode("utf-8")
+            tail = len(raw).to_bytes(32, "big") + raw + bytes(-len(raw) % 32)
+            self._payload_tails[agent_id] = tail
 
-        abi_path = os.path.join(os.path.dirname(__file__), "eas_abi.json")
-        with open(abi_path, "r") as f:
-            self.eas_abi = json.load(f)
+        return b"".join((root_bytes, _STRING_OFFSET, timestamp.to_bytes(32, "big"), tail))
+
+    async def _cached_rpc(
+        self, key: str, ttl: float, coro_factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return a cached RPC result, or fetch it once for all concurrent callers.
+
+        Only for chain reads that are safe to reuse within a block (never the nonce).
+        """
+        return await cached_call(self._rpc_cache, key, ttl, coro_factory)
+
+    async def _fees(self, block_number: int) -> Tuple[int, int]:
+        """EIP-1559 (maxFeePerGas, maxPriorityFeePerGas) from eth_feeHistory, cached per block."""
+        if self._fee_cache is None or self._fee_cache[0] != block_number:
+            history = await self._cached_rpc(
+                f"fee_history:{block_number}",
+                BLOCK_NUMBER_TTL,
+                lambda: self.w3.eth.fee_history(5, "latest", [50]),
+            )
+            prio_fee = int(statistics.median(reward[0] for reward in history["reward"]))
+            max_fee = 2 * history["baseFeePerGas"][-1] + prio_fee
+            self._fee_cache = (block_number, max_fee, prio_fee)
+        return self._fee_cache[1], self._fee_cache[2]
+
+    async def _reserve_nonce(self) -> int:
+        """Hand out the next nonce, syncing from the node's pending count when unset."""
+        async with self._nonce_lock:
+            if self._next_nonce is None:
+                self._next_nonce = await self.w3.eth.get_transaction_count(
+                    self.address, "pending"
+                )
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+
+    async def reserve_nonce(self) -> int:
+        """Next nonce for this account, shared with the agent's own tool transactions.
+
+        Drawing every transaction from one counter keeps tool sends and attestations from
+        reusing a nonce.
+        """
+        return await self._reserve_nonce()
+
+    def reset_nonce(self) -> None:
+        """Forget the local counter (e.g. after a failed send); the next reservation resyncs."""
+        self._next_nonce = None
 
     async def attest_root(
         self, merkle_root: str, schema_uid: Optional[str] = None, agent_id: str = "veritas-agent"
@@ -37,58 +144,74 @@ class VeritasAttestor:
         Attests a Merkle Root to the EAS contract.
         """
         uid = schema_uid or self.schema_uid
-        clean_root = merkle_root[2:] if merkle_root.startswith("0x") else merkle_root
-        root_bytes = bytes.fromhex(clean_root)
+        # A 32-byte root is the last 64 hex chars, with or without the 0x prefix
+        root_bytes = bytes.fromhex(merkle_root[-64:])
         timestamp = int(time.time())
 
-        # Encode data: bytes32 merkleRoot, string agentId, uint256 timestamp
-        encoded_payload = encode(
-            ["bytes32", "string", "uint256"], [root_bytes, agent_id, timestamp]
-        )
-
-        config = self.NETWORK_CONFIG.get(self.network_id, self.NETWORK_CONFIG["base-sepolia"])
-        w3 = Web3(Web3.HTTPProvider(config["rpc"]))
-
-        if not w3.is_connected():
-            raise ConnectionError(f"Could not connect to RPC: {config['rpc']}")
+        encoded_payload = self._encode_payload(root_bytes, agent_id, timestamp)
 
-        eas_contract = w3.eth.contract(address=EAS_CONTRACT_ADDRESS, abi=self.eas_abi)
+        # AsyncWeb3 keeps every RPC on the event loop, so concurrent attestations overlap.
+        # Returns the tx hash without waiting for inclusion.
+        w3 = self.w3
 
         # Construct AttestationRequest
-        request = (
-            uid,
-            (
-                "0x0000000000000000000000000000000000000000",  # recipient
-                0,  # expirationTime
-                True,  # revocable
-                b"\x00" * 32,  # refUID
-                encoded_payload,
-                0,  # value
-            ),
-        )
+        request = (bytes.fromhex(uid[-64:]), self._REQUEST_HEAD + (encoded_payload, 0))
+        calldata = _ATTEST_SELECTOR + encode(_ATTEST_ARG_TYPES, [request])
 
         try:
-            nonce = w3.eth.get_transaction_count(self.account.address, "pending")
-            tx_params = {
-                "chainId": config["chainId"],
+            # Fees only refresh on a new block; the nonce normally comes from the local counter
+            block_number, nonce = await asyncio.gather(
+                self._cached_rpc("block_number", BLOCK_NUMBER_TTL, lambda: w3.eth.block_number),
+                self._reserve_nonce(),
+            )
+            max_fee, prio_fee = await self._fees(block_number)
+
+            # Fixed gas limit and known calldata: no estimateGas or contract wrapper needed
+            tx_data = {
+                "type": 2,
+                "chainId": self.chain_id,
                 "gas": 300000,
-                "gasPrice": int(w3.eth.gas_price * 1.1),
+                "maxFeePerGas": max_fee,
+                "maxPriorityFeePerGas": prio_fee,
                 "nonce": nonce,
-                "from": self.account.address,
+                "to": EAS_CONTRACT_ADDRESS,
+                "value": 0,
+                "data": calldata,
             }
 
-            tx_data = eas_contract.functions.attest(request).build_transaction(tx_params)
-
-            # 1. Simulate
-            w3.eth.call(tx_data)
+            # 1. Simulate (debug only: the node re-validates on send_raw_transaction anyway,
+            # and a dry run is stale by the time the tx is broadcast)
+            if settings.DEBUG:
+                await w3.eth.call({**tx_data, "from": self.address})
 
             # 2. Sign & Send
-            signed_tx = w3.eth.account.sign_transaction(tx_data, self.account.key)
-            tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-
-            print(f"[Veritas] Attestation submitted: {w3.to_hex(tx_hash)}")
-            return w3.to_hex(tx_hash)
+            try:
+                tx_hash = await self._sign_and_send(tx_data)
+            except Exception as e:
+                if not _is_stale_nonce(e):
+                    raise
+                # Something else moved the account's nonce; resync and retry once
+                self._next_nonce = None
+                tx_data["nonce"] = await self._reserve_nonce()
+                tx_hash = await self._sign_and_send(tx_data)
+
+            tx_hash_hex = w3.to_hex(tx_hash)
+            logger.info("Attestation submitted: %s", tx_hash_hex)
+            return tx_hash_hex
 
         except Exception as e:
-            print(f"[Veritas] Attestation failed: {e}")
+            # The reserved nonce may be unused now; resync on the next attestation
+            self._next_nonce = None
+            logger.error("Attestation failed: %s", e)
             raise e
+
+    async def _sign_and_send(self, tx_data: dict) -> bytes:
+        signed_tx = await asyncio.to_thread(
+            self.w3.eth.account.sign_transaction, tx_data, self.account.key
+        )
+        return await self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+
+
+def _is_stale_nonce(error: Exception) -> bool:
+    message = str(error).lower()
+    return "nonce too low" in message or "already known" in message
@@ -1,7 +1,12 @@
+import asyncio
 import os
 import httpx
 from typing import Any, Optional
 
+# Transient statuses retried with exponential backoff (0.2s, 0.4s)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 2
+
 
 class MiniMaxBrain:
     """
@@ -15,12 +20,35 @@ class MiniMaxBrain:
         if not self.api_key:
             raise ValueError("MINIMAX_API_KEY is required for MiniMaxBrain")
 
+        # Created on first use so it binds to the running event loop; reused across calls
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                timeout=30.0,
+                # Bounded keep-alive pool; connect failures retried at the transport level
+                transport=httpx.AsyncHTTPTransport(
+                    limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+                    retries=MAX_RETRIES,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def think(self, system_prompt: str, user_prompt: str) -> str:
         """
         Send a prompt to MiniMax and return the reasoned decision asynchronously.
         """
-        headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
-
         payload = {
             "model": "MiniMax-M2.1",
             "messages": [
@@ -31,19 +59,19 @@ class MiniMaxBrain:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.base_url, headers=headers, json=payload, timeout=30.0
-                )
-                response.raise_for_status()
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
-
-                # Strip thinking blocks if present
-                if "</think>" in content:
-                    content = content.split("</think>")[-1].strip()
+            client = self._get_client()
+            for attempt in range(MAX_RETRIES + 1):
+                response = await client.post(self.base_url, json=payload)
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    break
+                await asyncio.sleep(0.2 * 2**attempt)
+            response.raise_for_status()
+            data = response.json()
+            content = data["choices"][0]["message"]["content"]
 
-                return content.strip()
+            # Strip thinking blocks if present: keep only what follows the last </think>
+            _, sep, tail = content.rpartition("</think>")
+            return (tail if sep else content).strip()
         except httpx.TimeoutException:
             raise TimeoutError("MiniMax API timeout after 30s")
         except httpx.HTTPStatusError as e:
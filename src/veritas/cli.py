@@ -1,8 +1,10 @@
 import typer
 import json
+import mmap
 import os
 import re
 import ast
+import orjson
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -11,6 +13,19 @@ from .verifier import VeritasVerifier
 app = typer.Typer(help="Veritas: AI Agent Audit Verification Tool")
 console = Console()
 
+_LOG_IDX_RE = re.compile(r"Log #(\d+)")
+_STATUS_RE = re.compile(r"FAILURE|TAMPER|Warning|[Vv]erified")
+# Checked in precedence order: any failure marker beats a warning, which beats a pass
+_STATUS_TAGS = (
+    ("FAILURE", "[red]FAIL[/red]"),
+    ("TAMPER", "[red]FAIL[/red]"),
+    ("Warning", "[yellow]WARN[/yellow]"),
+    ("Verified", "[green]PASS[/green]"),
+    ("verified", "[green]PASS[/green]"),
+)
+MAX_PRETTY_CONTENT = 100_000  # larger outputs are shown raw rather than parsed
+MMAP_THRESHOLD = 10 * 1024 * 1024  # proof files above this are parsed from a mapping
+
 
 @app.command()
 def verify(
@@ -27,8 +42,13 @@ def verify(
         raise typer.Exit(code=1)
 
     try:
-        with open(proof_file, "r") as f:
-            proof_data = json.load(f)
+        with open(proof_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        proof_data = orjson.loads(view)
+            else:
+                proof_data = orjson.loads(f.read())
     except Exception as e:
         console.print(f"[red]Error:[/red] Failed to parse JSON: {e}")
         raise typer.Exit(code=1)
@@ -52,29 +72,31 @@ def verify(
     table.add_column("Check")
 
     for i, detail in enumerate(details):
-        status = (
-            "[green]PASS[/green]"
-            if "Verified" in detail or "verified" in detail
-            else "[yellow]INFO[/yellow]"
+        markers = set(_STATUS_RE.findall(detail))
+        status = next(
+            (tag for marker, tag in _STATUS_TAGS if marker in markers), "[yellow]INFO[/yellow]"
         )
-        if "Warning" in detail:
-            status = "[yellow]WARN[/yellow]"
-        if "FAILURE" in detail or "TAMPER" in detail:
-            status = "[red]FAIL[/red]"
         table.add_row(status, detail)
 
         # Verbose: Show log content if this is a log verification line
         if verbose and "Log #" in detail:
-            match = re.search(r"Log #(\d+)", detail)
+            match = _LOG_IDX_RE.search(detail)
             if match:
                 try:
                     idx = int(match.group(1))
                     content = proof_data["logs"][idx]["output_result"]
 
-                    # Try to parse python dict string representation to JSON
+                    # Pretty-print dict output: JSON first, python repr as a fallback
                     try:
-                        if isinstance(content, str) and content.strip().startswith("{"):
-                            parsed = ast.literal_eval(content)
+                        if (
+                            isinstance(content, str)
+                            and len(content) < MAX_PRETTY_CONTENT
+                            and content.strip().startswith("{")
+                        ):
+                            try:
+                                parsed = orjson.loads(content)
+                            except orjson.JSONDecodeError:
+                                parsed = ast.literal_eval(content)
                             pretty = json.dumps(parsed, indent=2)
                             table.add_row("", f"[dim]{pretty}[/dim]")
                         else:
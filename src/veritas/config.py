@@ -25,8 +25,17 @@ class Settings(BaseSettings):
     NETWORK: str = "base-sepolia"
     ENABLE_MAINNET: bool = False
 
+    # Max concurrent tool executions per agent; RPC connection pools are sized to match
+    RPC_CONCURRENCY: int = 16
+
+    # Directory for per-agent audit log spill files; empty keeps every entry in memory
+    LOG_SPILL_DIR: str = ""
+
     # Database Configuration
     DATABASE_URL: str = "sqlite+aiosqlite:///./veritas.db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds
 
     # Redis Configuration
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -34,6 +43,7 @@ class Settings(BaseSettings):
     # EAS Configuration
     EAS_CONTRACT_ADDRESS: str = "0xC2679fBD37d54388Ce493F1DB75320D236e1815e"
     SCHEMA_UID: str = ""
+    EAS_SCHEMA_UID: str = ""  # empty uses the attestor's default Veritas schema
 
     # Security
     SECRET_KEY: str = "change-this-in-production"
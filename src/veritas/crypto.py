@@ -6,12 +6,13 @@ stored in the database, specifically for private keys.
 
 import os
 import base64
+import hashlib
 import logging
-from typing import Optional
+import threading
+from functools import lru_cache
+from typing import List, Optional, Union
 
 from cryptography.fernet import Fernet, InvalidToken
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +25,8 @@ def derive_fernet_key(key_material: str, salt: Optional[bytes] = None) -> tuple[
     """Derive a Fernet-compatible key from arbitrary key material.
 
     Fernet requires a 32-byte base64-encoded key. This function uses PBKDF2
-    to derive a secure key from the provided key material.
+    (hashlib's OpenSSL-backed implementation) to derive a secure key from the
+    provided key material.
 
     Args:
         key_material: The raw key material (e.g., from environment variable)
@@ -38,14 +40,8 @@ def derive_fernet_key(key_material: str, salt: Optional[bytes] = None) -> tuple[
         # In production, you might want to store salt with encrypted data
         salt = b"veritas_salt_fixed_v1"
 
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=100000,
-    )
-
-    key = base64.urlsafe_b64encode(kdf.derive(key_material.encode()))
+    derived = hashlib.pbkdf2_hmac("sha256", key_material.encode(), salt, 100000, dklen=32)
+    key = base64.urlsafe_b64encode(derived)
     return key, salt
 
 
@@ -75,6 +71,7 @@ def get_encryption_key() -> bytes:
 
 # Initialize Fernet cipher with the derived key
 _fernet: Optional[Fernet] = None
+_fernet_lock = threading.Lock()
 
 
 def get_fernet() -> Fernet:
@@ -85,10 +82,30 @@ def get_fernet() -> Fernet:
     """
     global _fernet
     if _fernet is None:
-        _fernet = Fernet(get_encryption_key())
+        # Double-checked so concurrent first callers derive the key only once
+        with _fernet_lock:
+            if _fernet is None:
+                _fernet = Fernet(get_encryption_key())
     return _fernet
 
 
+def clear_key_cache() -> None:
+    """Drop the cached Fernet instance and decrypted keys (e.g. after ENCRYPTION_KEY changes)."""
+    global _fernet
+    with _fernet_lock:
+        _fernet = None
+    _decrypt_cached.cache_clear()
+
+
+def warmup() -> None:
+    """Derive the key and build the Fernet instance ahead of the first request.
+
+    Key derivation runs 100k PBKDF2 iterations; call this at startup so the
+    first encrypt/decrypt does not pay for it.
+    """
+    get_fernet()
+
+
 def encrypt_private_key(private_key: Optional[str]) -> Optional[str]:
     """Encrypt a private key for database storage.
 
@@ -130,9 +147,7 @@ def decrypt_private_key(encrypted_key: Optional[str]) -> Optional[str]:
         return None
 
     try:
-        fernet = get_fernet()
-        decrypted_bytes = fernet.decrypt(encrypted_key.encode("utf-8"))
-        return decrypted_bytes.decode("utf-8")
+        return _decrypt_cached(encrypted_key)
     except InvalidToken:
         logger.warning("Failed to decrypt private key: Invalid token (wrong key or corrupted data)")
         return None
@@ -141,28 +156,82 @@ def decrypt_private_key(encrypted_key: Optional[str]) -> Optional[str]:
         return None
 
 
-def rotate_encryption_key(encrypted_data: str, old_key_material: str, new_key_material: str) -> str:
+@lru_cache(maxsize=256)
+def _decrypt_cached(encrypted_key: str) -> str:
+    # Agent keys are decrypted every time their row is loaded; memoize per ciphertext.
+    # Failures raise, so lru_cache never stores them and a later call retries
+    fernet = get_fernet()
+    return fernet.decrypt(encrypted_key.encode("utf-8")).decode("utf-8")
+
+
+def _encode_key(value: str) -> bytes:
+    # Private keys are hex and Fernet tokens are base64, so the ASCII codec is the usual path
+    return value.encode("ascii") if value.isascii() else value.encode("utf-8")
+
+
+def encrypt_many(private_keys: List[str]) -> List[str]:
+    """Encrypt several private keys with one Fernet lookup.
+
+    Args:
+        private_keys: Plaintext private keys
+
+    Returns:
+        Encrypted strings, in the same order
+    """
+    fernet = get_fernet()
+    return [fernet.encrypt(_encode_key(key)).decode("ascii") for key in private_keys]
+
+
+def decrypt_many(encrypted_keys: List[str]) -> List[Optional[str]]:
+    """Decrypt several private keys with one Fernet lookup.
+
+    Args:
+        encrypted_keys: Encrypted private keys
+
+    Returns:
+        Decrypted keys in the same order; None for entries that fail to decrypt
+    """
+    fernet = get_fernet()
+    decrypted: List[Optional[str]] = []
+    for encrypted_key in encrypted_keys:
+        try:
+            decrypted.append(fernet.decrypt(_encode_key(encrypted_key)).decode("utf-8"))
+        except InvalidToken:
+            logger.warning(
+                "Failed to decrypt private key: Invalid token (wrong key or corrupted data)"
+            )
+            decrypted.append(None)
+    return decrypted
+
+
+def rotate_encryption_key(
+    encrypted_data: Union[str, List[str]], old_key_material: str, new_key_material: str
+) -> Union[str, List[str]]:
     """Re-encrypt data with a new encryption key.
 
     Args:
-        encrypted_data: The current encrypted data
+        encrypted_data: The current encrypted data, or a list of it for bulk rotation
         old_key_material: The current key material used for encryption
         new_key_material: The new key material to use
 
     Returns:
-        Re-encrypted data with the new key
+        Re-encrypted data with the new key (a list if a list was given)
     """
-    # Derive old key and decrypt
+    # Cached plaintexts are keyed by ciphertext; start clean once data is re-encrypted
+    _decrypt_cached.cache_clear()
+
+    # Derive both keys once, however many values are rotated
     old_key, _ = derive_fernet_key(old_key_material)
     old_fernet = Fernet(old_key)
-    decrypted = old_fernet.decrypt(encrypted_data.encode("utf-8"))
-
-    # Derive new key and encrypt
     new_key, _ = derive_fernet_key(new_key_material)
     new_fernet = Fernet(new_key)
-    encrypted = new_fernet.encrypt(decrypted)
 
-    return encrypted.decode("utf-8")
+    def rotate(item: str) -> str:
+        return new_fernet.encrypt(old_fernet.decrypt(_encode_key(item))).decode("ascii")
+
+    if isinstance(encrypted_data, str):
+        return rotate(encrypted_data)
+    return [rotate(item) for item in encrypted_data]
 
 
 def generate_secure_key() -> str:
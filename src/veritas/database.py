@@ -1,7 +1,8 @@
 """Database models and utilities for Veritas."""
 
 from datetime import datetime
-from typing import AsyncGenerator, Optional
+import os
+from typing import AsyncGenerator, Iterable, Optional
 from contextlib import asynccontextmanager
 
 from sqlalchemy import (
@@ -13,7 +14,10 @@ from sqlalchemy import (
     DateTime,
     JSON,
     ForeignKey,
+    Index,
     TypeDecorator,
+    event,
+    insert,
 )
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -21,7 +25,7 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
 )
 from sqlalchemy.orm import declarative_base, relationship
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, StaticPool
 
 from .config import settings
 from .crypto import encrypt_private_key, decrypt_private_key
@@ -87,13 +91,19 @@ class AgentModel(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    sessions = relationship("SessionModel", back_populates="agent", cascade="all, delete-orphan")
+    # Relationships never lazy-load: under asyncio an implicit load can't await, so queries
+    # must ask for them explicitly (selectinload) and a missed one fails loudly
+    sessions = relationship(
+        "SessionModel", back_populates="agent", cascade="all, delete-orphan", lazy="raise_on_sql"
+    )
 
 
 class SessionModel(Base):
     """Database model for agent session persistence."""
 
     __tablename__ = "sessions"
+    # History/status lookups filter by agent; SQLite does not index foreign keys itself
+    __table_args__ = (Index("ix_sessions_agent_status", "agent_id", "status"),)
 
     id = Column(String(36), primary_key=True)
     agent_id = Column(String(36), ForeignKey("agents.id"), nullable=False)
@@ -107,14 +117,18 @@ class SessionModel(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    agent = relationship("AgentModel", back_populates="sessions")
-    logs = relationship("LogModel", back_populates="session", cascade="all, delete-orphan")
+    agent = relationship("AgentModel", back_populates="sessions", lazy="raise_on_sql")
+    logs = relationship(
+        "LogModel", back_populates="session", cascade="all, delete-orphan", lazy="raise_on_sql"
+    )
 
 
 class LogModel(Base):
     """Database model for action logs with Merkle chaining."""
 
     __tablename__ = "logs"
+    # A session's logs are loaded by session_id and read in timestamp order
+    __table_args__ = (Index("ix_logs_session_ts", "session_id", "timestamp"),)
 
     id = Column(String(36), primary_key=True)
     session_id = Column(String(36), ForeignKey("sessions.id"), nullable=False)
@@ -127,7 +141,7 @@ class LogModel(Base):
     merkle_leaf = Column(String(66), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
-    session = relationship("SessionModel", back_populates="logs")
+    session = relationship("SessionModel", back_populates="logs", lazy="raise_on_sql")
 
 
 # Database engine configuration
@@ -137,12 +151,41 @@ DATABASE_URL = (
     else "sqlite+aiosqlite:///./veritas.db"
 )
 
+
+def _engine_pool_kwargs(url: str) -> dict:
+    """Pick the pool explicitly; a sync QueuePool under an async engine can deadlock."""
+    if url.startswith("sqlite"):
+        if ":memory:" in url or url.rstrip("/").endswith(":"):
+            # An in-memory database lives on its connection, so every session must share one
+            return {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+        # File databases are cheap to open, and a shared connection would mix transactions
+        return {"poolclass": NullPool}
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+
 engine = create_async_engine(
     DATABASE_URL,
     echo=settings.DEBUG if hasattr(settings, "DEBUG") else False,
-    poolclass=NullPool if "sqlite" in DATABASE_URL else None,
+    **_engine_pool_kwargs(DATABASE_URL),
 )
 
+if DATABASE_URL.startswith("sqlite"):
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL lets readers run during writes; NORMAL syncs at checkpoints, not every commit."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -179,10 +222,45 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+@asynccontextmanager
+async def get_db_ro() -> AsyncGenerator[AsyncSession, None]:
+    """Context manager for read-only work: no commit/rollback round trip on exit."""
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def insert_logs(db: AsyncSession, session_id: str, logs: Iterable) -> None:
+    """Insert a session's ActionLogs with one executemany INSERT instead of a row per add()."""
+    rows = [
+        {
+            "id": os.urandom(16).hex(),
+            "session_id": session_id,
+            "basis_id": log.basis_id,
+            "event_type": log.event_type,
+            "tool_name": log.tool_name,
+            "input_params": {},
+            "output_result": str(log.output_result) if log.output_result else None,
+            "timestamp": log.timestamp,
+            "merkle_leaf": log.merkle_leaf,
+        }
+        for log in logs
+    ]
+    if rows:
+        await db.execute(insert(LogModel), rows)
+
+
 async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # create_all only indexes tables it creates; add indexes missing from older databases
+        await conn.run_sync(_create_missing_indexes)
+
+
+def _create_missing_indexes(sync_conn) -> None:
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
 
 
 async def close_db():
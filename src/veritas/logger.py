@@ -1,16 +1,47 @@
-from typing import Any, Callable, Dict, List, Optional
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
 import time
 import json
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from .merkle import MerkleTree
-import uuid
+import os
 import inspect
+import reprlib
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+# Bounded formatting for wrapped-call arguments: large RPC dicts/lists are summarised
+# instead of str()'d in full on every call
+_PARAM_REPR = reprlib.Repr()
+_PARAM_REPR.maxstring = 256
+_PARAM_REPR.maxother = 256
+_PARAM_REPR.maxdict = 8
+_PARAM_REPR.maxlist = 8
+_PARAM_REPR.maxtuple = 8
+_PARAM_REPR.maxset = 8
+_MAX_PARAM_STR = 256
+
+# With a spill file, entries are written out in blocks of this size once twice as many
+# are held, so the most recent SPILL_BATCH entries always stay in memory
+SPILL_BATCH = 256
+
+
+def _param_str(value: Any) -> str:
+    """str(value) for logged call parameters, bounded for large strings and containers."""
+    if isinstance(value, str):
+        return value if len(value) <= _MAX_PARAM_STR else value[:_MAX_PARAM_STR] + "..."
+    if isinstance(value, (dict, list, tuple, set, frozenset)):
+        return _PARAM_REPR.repr(value)
+    return str(value)
 
 
 class ActionLog(BaseModel):
     """Immutable record of a single agent action."""
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: os.urandom(16).hex())  # 128 random bits
     basis_id: Optional[str] = None  # ID of the observation/action that justifies this
     timestamp: float = Field(default_factory=time.time)
     event_type: str = "ACTION"  # "OBSERVATION" or "ACTION"
@@ -19,9 +50,23 @@ class ActionLog(BaseModel):
     output_result: Any
     merkle_leaf: str = ""  # Merkle leaf hash for this log entry
 
+    _payload: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _hashable: Optional[str] = PrivateAttr(default=None)
+
     def to_hashable_json(self) -> str:
-        """Deterministic JSON serialization for hashing."""
-        return json.dumps(self.model_dump(mode="json"), sort_keys=True)
+        """Deterministic JSON serialization for hashing.
+
+        For logged entries this is the exact string hashed into the Merkle leaf.
+        """
+        if self._hashable is None:
+            return json.dumps(self.model_dump(mode="json"), sort_keys=True)
+        return self._hashable
+
+    def to_payload(self) -> Dict[str, Any]:
+        """JSON-mode dict of this entry, computed once and shared by all consumers."""
+        if self._payload is None:
+            self._payload = self.model_dump(mode="json")
+        return self._payload
 
 
 class VeritasLogger:
@@ -30,9 +75,14 @@ class VeritasLogger:
     Captures actions, logs them, and builds a real-time Merkle Tree.
     """
 
-    def __init__(self):
-        self._logs: List[ActionLog] = []
+    def __init__(self, spill_path: Optional[str] = None):
+        self._logs: Deque[ActionLog] = deque()
         self._merkle_tree = MerkleTree()
+        # Older entries are appended to spill_path as JSONL leaf preimages and evicted
+        self.spill_path = spill_path
+        self._spilled = 0
+        if spill_path:
+            open(spill_path, "w").close()
         self.last_event_id: Optional[str] = None
         self.listeners: List[Callable[[ActionLog], None]] = []
 
@@ -52,12 +102,24 @@ class VeritasLogger:
             event_type=event_type,
             basis_id=basis_id,
         )
-        self._merkle_tree.add_leaf(entry.to_hashable_json())
-        leaf_hash = self._merkle_tree.get_leaf_hash(len(self._logs))
-        entry.merkle_leaf = leaf_hash or ""
+        # One model_dump feeds both the leaf hash and the cached WS/API payload
+        payload = entry.model_dump(mode="json")
+        entry._hashable = json.dumps(payload, sort_keys=True)
+        entry.merkle_leaf = self._merkle_tree.add_leaf(entry._hashable)
+        payload["merkle_leaf"] = entry.merkle_leaf
+        entry._payload = payload
 
         self._logs.append(entry)
         self.last_event_id = entry.id
+        if self.spill_path and len(self._logs) >= 2 * SPILL_BATCH:
+            self._spill(SPILL_BATCH)
+
+        # Trace only when enabled (the API enables DEBUG via settings.DEBUG and ships
+        # records through its QueueHandler, so no stdout I/O happens here)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Recorded %s: %s | Root: %s...", event_type, tool_name, self.get_current_root()[:8]
+            )
 
         for listener in self.listeners:
             try:
@@ -67,12 +129,65 @@ class VeritasLogger:
 
         return entry
 
+    def _spill(self, count: int) -> None:
+        """Append the oldest `count` entries to the spill file and drop them from memory."""
+        with open(self.spill_path, "a") as f:
+            f.writelines(self._logs.popleft().to_hashable_json() + "\n" for _ in range(count))
+        self._spilled += count
+
+    def _iter_spilled(self) -> Iterator[str]:
+        if not self._spilled:
+            return
+        with open(self.spill_path, "r") as f:
+            for line in f:
+                yield line.rstrip("\n")
+
+    def iter_logs(self) -> Iterator[ActionLog]:
+        """Every entry in order, streaming spilled ones back from disk."""
+        for index, line in enumerate(self._iter_spilled()):
+            entry = ActionLog.model_validate_json(line)
+            entry.merkle_leaf = self._merkle_tree.get_leaf_hash(index)
+            entry._hashable = line
+            yield entry
+        yield from self._logs
+
     def get_logs(self) -> List[ActionLog]:
-        return self._logs
+        return list(self.iter_logs())
+
+    def recent_logs(self, n: int) -> List[ActionLog]:
+        """The last n entries, without touching the spill file."""
+        return list(islice(self._logs, max(len(self._logs) - n, 0), None))
 
     def get_current_root(self) -> str:
         return self._merkle_tree.get_root() or "0x0"
 
+    def export_proofs(self, filename: str, include_proofs: bool = False) -> None:
+        """Write a proof file that `veritas verify` / VeritasVerifier can check.
+
+        Logs are written as the cached leaf preimages, so nothing is re-serialized;
+        spilled entries are copied through from the spill file. With include_proofs,
+        each leaf's inclusion proof is added under "proofs" so single entries can be
+        checked against the root without rebuilding the tree.
+        """
+        tree = self._merkle_tree
+        export = {
+            "session_root": self.get_current_root(),
+            "leaf_hashes": [tree.get_leaf_hash(i) for i in range(self._spilled + len(self._logs))],
+        }
+        if include_proofs:
+            export["proofs"] = tree.all_proofs()
+        header = json.dumps(export)
+        with open(filename, "w") as f:
+            f.write(f'{header[:-1]}, "logs": [')
+            sep = ""
+            for line in self._iter_spilled():
+                f.write(sep + line)
+                sep = ","
+            for log in self._logs:
+                f.write(sep + log.to_hashable_json())
+                sep = ","
+            f.write("]}")
+
     def wrap(
         self, func: Optional[Callable] = None, *, tool_name: str = None, event_type: str = "ACTION"
     ):
@@ -90,8 +205,8 @@ class VeritasLogger:
                     basis_id = kwargs.pop("basis_id", self.last_event_id)
                     # Convert args/kwargs to serializable format
                     params = {
-                        "args": [str(a) for a in args],
-                        "kwargs": {k: str(v) for k, v in kwargs.items()},
+                        "args": [_param_str(a) for a in args],
+                        "kwargs": {k: _param_str(v) for k, v in kwargs.items()},
                     }
 
                     result = await f(*args, **kwargs)
@@ -108,8 +223,8 @@ class VeritasLogger:
                 def sync_wrapper(*args, **kwargs):
                     basis_id = kwargs.pop("basis_id", self.last_event_id)
                     params = {
-                        "args": [str(a) for a in args],
-                        "kwargs": {k: str(v) for k, v in kwargs.items()},
+                        "args": [_param_str(a) for a in args],
+                        "kwargs": {k: _param_str(v) for k, v in kwargs.items()},
                     }
 
                     result = f(*args, **kwargs)
@@ -1,62 +1,141 @@
 import hashlib
-from typing import List, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Union
+
+# Width of one node in a level slab: the ASCII hex of a SHA-256 digest
+NODE = 64
+
+# hashlib only releases the GIL for inputs over 2 KiB, so a thread pool only pays off
+# for large batches of large leaves (internal nodes are always 128 bytes)
+PARALLEL_MIN_LEAVES = 1024
+PARALLEL_MIN_LEAF_SIZE = 2048
+
+
+def _hash_leaves(leaves: Sequence[Union[str, bytes]]) -> bytes:
+    """Concatenated ASCII-hex SHA-256 of each leaf."""
+    return b"".join(
+        hashlib.sha256(leaf.encode("utf-8") if isinstance(leaf, str) else leaf)
+        .hexdigest()
+        .encode("ascii")
+        for leaf in leaves
+    )
+
+
+def _parallel_hash(leaves: Sequence[Union[str, bytes]], workers: int) -> bytes:
+    """_hash_leaves split into one contiguous slice per worker."""
+    size = -(-len(leaves) // workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return b"".join(
+            pool.map(_hash_leaves, [leaves[i : i + size] for i in range(0, len(leaves), size)])
+        )
 
 
 class MerkleTree:
     """
     A simple, pure-Python Merkle Tree implementation using SHA256.
-    """
 
-    def __init__(self, leaves: Optional[List[str]] = None):
-        self.leaves = leaves or []
-        self.tree = []
-        if self.leaves:
-            self._build()
+    Each level is one contiguous bytearray of 64-byte ASCII-hex nodes. Internal nodes
+    hash the hex text of their two children, so a pair is hashed straight from a
+    128-byte slice of the level below. Leaf preimages are not kept: proofs only need
+    the level-0 hashes, so memory grows by 64 bytes per leaf however large the leaf.
+    """
 
-    def add_leaf(self, data: str):
-        """Add a leaf (string) and rebuild the tree."""
-        self.leaves.append(data)
-        self._build()
+    def __init__(self, leaves: Optional[List[Union[str, bytes]]] = None):
+        self.tree: List[bytearray] = []
+        if leaves:
+            self._build(leaves)
 
-    def _hash(self, data: str) -> str:
-        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+    @property
+    def leaf_count(self) -> int:
+        return len(self.tree[0]) // NODE if self.tree else 0
 
-    def _build(self):
-        """Build the tree from current leaves."""
-        if not self.leaves:
-            self.tree = []
-            return
+    def add_leaf(self, data: Union[str, bytes]) -> str:
+        """Add a leaf, updating only the tree's right edge (O(log N) hashes).
 
+        Leaves may be str or already-encoded UTF-8 bytes; both hash identically.
+        Returns the new leaf's hex hash.
+        """
+        leaf_hex = self._hash(data)
+        leaf_hash = leaf_hex.encode("ascii")
+        if not self.tree:
+            self.tree = [bytearray(leaf_hash)]
+            return leaf_hex
+
+        self.tree[0] += leaf_hash
+        tree = self.tree
+        level = 0
+        # Only the last node of each level changes; stop once a level is the root
+        while len(tree[level]) > NODE:
+            nodes = tree[level]
+            last = len(nodes) // NODE - 1
+            if last % 2:
+                pair = nodes[-2 * NODE :]
+            else:
+                pair = nodes[-NODE:] * 2  # Duplicate if odd
+            parent = hashlib.sha256(pair).hexdigest().encode("ascii")
+
+            level += 1
+            if level == len(tree):
+                tree.append(bytearray(parent))
+                break
+            upper = tree[level]
+            offset = (last // 2) * NODE
+            upper[offset : offset + NODE] = parent
+
+        return leaf_hex
+
+    def _hash(self, data: Union[str, bytes]) -> str:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return hashlib.sha256(data).hexdigest()
+
+    def _hash_pair(self, left: str, right: str) -> str:
+        # Nodes are hashed over their hex text, which is what existing roots commit to
+        return hashlib.sha256((left + right).encode("ascii")).hexdigest()
+
+    def _build(self, leaves: Sequence[Union[str, bytes]]):
+        """Build the tree from a full list of leaves."""
         # Hash all leaves
-        current_level = [self._hash(leaf) for leaf in self.leaves]
+        workers = os.cpu_count() or 1
+        if (
+            workers > 1
+            and len(leaves) >= PARALLEL_MIN_LEAVES
+            and sum(map(len, leaves)) >= len(leaves) * PARALLEL_MIN_LEAF_SIZE
+        ):
+            current_level = bytearray(_parallel_hash(leaves, workers))
+        else:
+            current_level = bytearray(_hash_leaves(leaves))
         self.tree = [current_level]
 
-        while len(current_level) > 1:
-            next_level = []
-            for i in range(0, len(current_level), 2):
-                left = current_level[i]
-                if i + 1 < len(current_level):
-                    right = current_level[i + 1]
-                else:
-                    right = left  # Duplicate last if odd
-
-                # Hash combined
-                combined = self._hash(left + right)
-                next_level.append(combined)
+        sha256 = hashlib.sha256
+        while len(current_level) > NODE:
+            if len(current_level) % (2 * NODE):
+                current_level = current_level + current_level[-NODE:]  # Duplicate last if odd
+            with memoryview(current_level) as view:
+                next_level = bytearray(
+                    b"".join(
+                        sha256(view[i : i + 2 * NODE]).hexdigest().encode("ascii")
+                        for i in range(0, len(current_level), 2 * NODE)
+                    )
+                )
 
             self.tree.append(next_level)
             current_level = next_level
 
+    def _node(self, level: int, index: int) -> str:
+        return self.tree[level][index * NODE : (index + 1) * NODE].decode("ascii")
+
     def get_root(self) -> Optional[str]:
         if not self.tree:
             return None
-        return self.tree[-1][0]
+        return self.tree[-1].decode("ascii")
 
     def get_leaf_hash(self, index: int) -> Optional[str]:
         """Get the hash of a leaf at a specific index."""
-        if not self.leaves or index >= len(self.leaves):
+        if index >= self.leaf_count:
             return None
-        return self._hash(self.leaves[index])
+        return self._node(0, index)
 
     def get_proof(self, index: int) -> List[dict]:
         """
@@ -67,18 +146,19 @@ class MerkleTree:
             return []
 
         proof = []
-        for level in self.tree[:-1]:  # Exclude root level
-            if index >= len(level):
+        for level in range(len(self.tree) - 1):  # Exclude root level
+            size = len(self.tree[level]) // NODE
+            if index >= size:
                 break  # Should not happen if tree is consistent
 
             is_right_child = index % 2 == 1
             sibling_index = index - 1 if is_right_child else index + 1
 
-            if sibling_index < len(level):
-                sibling_hash = level[sibling_index]
+            if sibling_index < size:
+                sibling_hash = self._node(level, sibling_index)
             else:
                 # If odd, the sibling is itself (duplicated)
-                sibling_hash = level[index]
+                sibling_hash = self._node(level, index)
 
             proof.append({"position": "left" if is_right_child else "right", "data": sibling_hash})
 
@@ -86,15 +166,39 @@ class MerkleTree:
 
         return proof
 
-    def verify_proof(self, leaf: str, proof: List[dict], root: str) -> bool:
+    def all_proofs(self) -> List[List[dict]]:
+        """
+        Proofs for every leaf, in get_proof's format, built level by level.
+        Leaves under the same node share that level's proof step instead of each
+        walking the tree.
+        """
+        if not self.tree:
+            return []
+
+        count = len(self.tree[0]) // NODE
+        proofs: List[List[dict]] = [[] for _ in range(count)]
+        for level in range(len(self.tree) - 1):
+            size = len(self.tree[level]) // NODE
+            steps = [
+                {
+                    "position": "left" if index % 2 else "right",
+                    "data": self._node(level, min(index ^ 1, size - 1)),
+                }
+                for index in range(size)
+            ]
+            for leaf, proof in enumerate(proofs):
+                proof.append(steps[leaf >> level])
+        return proofs
+
+    def verify_proof(self, leaf: Union[str, bytes], proof: List[dict], root: str) -> bool:
         """Verify a proof locally."""
         current_hash = self._hash(leaf)
 
         for node in proof:
             sibling = node["data"]
             if node["position"] == "left":
-                current_hash = self._hash(sibling + current_hash)
+                current_hash = self._hash_pair(sibling, current_hash)
             else:
-                current_hash = self._hash(current_hash + sibling)
+                current_hash = self._hash_pair(current_hash, sibling)
 
         return current_hash == root
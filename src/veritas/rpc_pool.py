@@ -0,0 +1,159 @@
+"""Shared Web3 clients, one per RPC endpoint, so agents reuse keep-alive connections."""
+
+import asyncio
+import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+import requests
+from aiohttp import ClientSession, TCPConnector
+from requests.adapters import HTTPAdapter
+from web3 import AsyncWeb3, Web3
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Tool-side reads (gas price, balances) are reused for this long, well inside a 2s Base block
+CHAIN_READ_TTL = 0.5  # seconds
+
+RPC_URLS = {
+    "base-sepolia": "https://sepolia.base.org",
+    "base-mainnet": "https://base-mainnet.public.blastapi.io",
+}
+
+# Connections per endpoint, sized to the tool calls an agent may run at once. Sync clients
+# are driven from asyncio.to_thread workers; extra callers wait for a free connection
+# rather than opening throwaway ones
+HTTP_POOL_MAXSIZE = settings.RPC_CONCURRENCY
+KEEPALIVE_TIMEOUT = 60  # seconds
+
+
+@lru_cache(maxsize=None)
+def web3_for_url(rpc_url: str) -> Web3:
+    """Return the process-wide Web3 client for an RPC endpoint."""
+    session = requests.Session()
+    session.headers["Connection"] = "keep-alive"
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE, pool_block=True)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return Web3(Web3.HTTPProvider(rpc_url, session=session))
+
+
+def get_web3(network: str) -> Web3:
+    """Return the process-wide Web3 client for a network (unknown networks use Sepolia)."""
+    return web3_for_url(RPC_URLS.get(network, RPC_URLS["base-sepolia"]))
+
+
+class KeepAliveAsyncHTTPProvider(AsyncWeb3.AsyncHTTPProvider):
+    """AsyncHTTPProvider whose aiohttp sessions reuse a bounded pool of connections.
+
+    web3's default session uses a force_close connector, i.e. a new TCP/TLS connection
+    for every request. One session is installed per thread and event loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # thread id -> (loop, session, task caching the session with web3)
+        self._sessions: Dict[int, Tuple[Any, ClientSession, asyncio.Task]] = {}
+
+    async def _ensure_session(self) -> None:
+        loop = asyncio.get_running_loop()
+        thread_id = threading.get_ident()
+        current = self._sessions.get(thread_id)
+        if current is None or current[0] is not loop or current[1].closed:
+            stale = None if current is None else current[1]
+            if stale is not None:
+                # web3 would replace a stale entry with its own force_close session
+                cache = self._request_session_manager.session_cache
+                for key, cached in cache.items():
+                    if cached is stale:
+                        cache.pop(key)
+            session = ClientSession(
+                raise_for_status=True,
+                connector=TCPConnector(
+                    limit=HTTP_POOL_MAXSIZE, keepalive_timeout=KEEPALIVE_TIMEOUT
+                ),
+            )
+            # Registered before the first await so concurrent callers share one session
+            current = (loop, session, loop.create_task(self.cache_async_session(session)))
+            self._sessions[thread_id] = current
+            if stale is not None and not stale.closed:
+                try:
+                    await stale.close()
+                except Exception:
+                    # Its connections belong to a loop that has since closed
+                    logger.debug("Could not close stale RPC session", exc_info=True)
+        await current[2]
+
+    async def make_request(self, method, params):
+        await self._ensure_session()
+        return await super().make_request(method, params)
+
+    async def make_batch_request(self, requests):
+        await self._ensure_session()
+        return await super().make_batch_request(requests)
+
+    async def disconnect(self) -> None:
+        self._sessions.clear()
+        await super().disconnect()
+
+
+_async_providers: List[KeepAliveAsyncHTTPProvider] = []
+
+
+@lru_cache(maxsize=None)
+def async_web3_for_url(rpc_url: str) -> AsyncWeb3:
+    """Return the process-wide AsyncWeb3 client (aiohttp-backed) for an RPC endpoint."""
+    provider = KeepAliveAsyncHTTPProvider(rpc_url)
+    _async_providers.append(provider)
+    return AsyncWeb3(provider)
+
+
+async def close_async_web3() -> None:
+    """Close the pooled connections of every AsyncWeb3 client (on app shutdown)."""
+    for provider in _async_providers:
+        await provider.disconnect()
+
+
+def get_async_web3(network: str) -> AsyncWeb3:
+    """Return the process-wide AsyncWeb3 client for a network (unknown networks use Sepolia)."""
+    return async_web3_for_url(RPC_URLS.get(network, RPC_URLS["base-sepolia"]))
+
+
+async def cached_call(
+    cache: Dict[str, Tuple[float, asyncio.Future]],
+    key: str,
+    ttl: float,
+    coro_factory: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Return a cached chain read, or fetch it once for all concurrent callers.
+
+    Only for reads that are safe to reuse for `ttl` seconds (never the nonce). Failed
+    fetches are not cached.
+    """
+    now = time.monotonic()
+    entry = cache.get(key)
+    if entry is not None and entry[0] > now:
+        return await entry[1]
+
+    # Drop expired entries (keys can embed a block number, so they don't repeat)
+    for stale in [k for k, (expiry, _) in cache.items() if expiry <= now]:
+        del cache[stale]
+
+    future = asyncio.get_running_loop().create_future()
+    cache[key] = (now + ttl, future)
+    try:
+        future.set_result(await coro_factory())
+    except asyncio.CancelledError:
+        cache.pop(key, None)
+        future.cancel()
+        raise
+    except Exception as e:
+        cache.pop(key, None)
+        future.set_exception(e)
+        future.exception()  # waiters re-raise it; don't warn if there are none
+        raise
+    return future.result()
@@ -1,28 +1,83 @@
+import importlib
+from collections.abc import Mapping
+
 from .base import VeritasTool, VeritasCapability, WalletCapability, TradeCapability
-from .token import TokenCapability
-from .nft import ERC721Capability, BasenameCapability
-from .defi import AaveCapability, CompoundCapability
-from .infra import PythCapability, OnrampCapability, ChainlinkCapability
-from .social import SocialCapability
-from .payments import PaymentCapability
-from .wow import CreatorCapability
-from .nillion import PrivacyCapability
+
+# Capability classes are imported on first use (PEP 562) so `import veritas.tools` only
+# pays for `base`; each entry maps a class name to the submodule that defines it
+_LAZY = {
+    "TokenCapability": ".token",
+    "ERC721Capability": ".nft",
+    "BasenameCapability": ".nft",
+    "AaveCapability": ".defi",
+    "CompoundCapability": ".defi",
+    "PythCapability": ".infra",
+    "OnrampCapability": ".infra",
+    "ChainlinkCapability": ".infra",
+    "MulticallCapability": ".multicall",
+    "SocialCapability": ".social",
+    "PaymentCapability": ".payments",
+    "CreatorCapability": ".wow",
+    "PrivacyCapability": ".nillion",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _CapabilityMap(Mapping):
+    """Read-only capability name -> class mapping that imports each class on lookup."""
+
+    def __init__(self, names):
+        self._names = names
+
+    def __getitem__(self, key):
+        name = self._names[key]
+        return globals().get(name) or __getattr__(name)
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+
+# Capability names accepted in agent configs
+CAP_MAP = _CapabilityMap(
+    {
+        "wallet": "WalletCapability",
+        "trading": "TradeCapability",
+        "token": "TokenCapability",
+        "erc20": "TokenCapability",  # Alias for token
+        "nft": "ERC721Capability",
+        "basename": "BasenameCapability",
+        "identity": "BasenameCapability",  # Alias for basename
+        "social": "SocialCapability",
+        "payments": "PaymentCapability",
+        "creator": "CreatorCapability",
+        "privacy": "PrivacyCapability",
+        "aave": "AaveCapability",
+        "defi": "AaveCapability",  # Alias for aave
+        "compound": "CompoundCapability",
+        "pyth": "PythCapability",
+        "onramp": "OnrampCapability",
+        "chainlink": "ChainlinkCapability",
+        "data": "ChainlinkCapability",  # Alias for chainlink
+        "portfolio": "MulticallCapability",
+        "multicall": "MulticallCapability",  # Alias for portfolio
+    }
+)
 
 __all__ = [
+    "CAP_MAP",
     "VeritasTool",
     "VeritasCapability",
     "WalletCapability",
     "TradeCapability",
-    "TokenCapability",
-    "ERC721Capability",
-    "BasenameCapability",
-    "AaveCapability",
-    "CompoundCapability",
-    "PythCapability",
-    "OnrampCapability",
-    "ChainlinkCapability",
-    "SocialCapability",
-    "PaymentCapability",
-    "CreatorCapability",
-    "PrivacyCapability",
+    *_LAZY,
 ]
@@ -1,18 +1,124 @@
 import asyncio
-from typing import Any, Callable, Dict, List
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
 from decimal import Decimal
 
+from eth_utils import to_checksum_address
 
-class VeritasTool(BaseModel):
+
+def chain_id_for(network: str) -> int:
+    """Chain id for a Base network name (Base Sepolia or Base mainnet)."""
+    return 84532 if "sepolia" in network else 8453
+
+
+async def sign_and_send(agent: Any, tx: Dict[str, Any]):
+    """Sign `tx` in a worker thread and send it, returning the tx hash.
+
+    The nonce comes from agent.next_tx_params(); if signing or sending fails it may be
+    unused, so the attestor's counter is resynced on the next transaction.
+    """
+    w3 = agent.async_w3
+    try:
+        signed = await asyncio.to_thread(w3.eth.account.sign_transaction, tx, agent.account.key)
+        return await w3.eth.send_raw_transaction(signed.raw_transaction)
+    except Exception:
+        agent.attestor.reset_nonce()
+        raise
+
+
+@lru_cache(maxsize=4096)
+def checksum_address(address: str) -> str:
+    """EIP-55 checksummed address; cached because checksumming keccak-hashes the hex."""
+    return to_checksum_address(address)
+
+
+@lru_cache(maxsize=256)
+def cached_contract(w3: Any, address: str, abi_name: str):
+    """Contract object for an address and a `constants` ABI name, built once per client.
+
+    Building a contract parses its ABI and creates the function proxies; the Web3 clients
+    are shared per network, so the result can be reused by every agent.
+    """
+    from . import constants
+
+    abi = getattr(constants, abi_name)
+    return w3.eth.contract(address=checksum_address(address), abi=abi)
+
+
+# Reads that never change for a deployed contract (ERC-20 decimals/symbol, price feed
+# decimals), shared by every agent: (chain id, checksummed address) -> {field: value}
+_CONTRACT_METADATA: Dict[Tuple[int, str], Dict[str, Any]] = {}
+
+
+def contract_metadata(chain_id: int, address: str) -> Dict[str, Any]:
+    """Cached immutable reads for a contract; empty until some are stored."""
+    return _CONTRACT_METADATA.get((chain_id, checksum_address(address)), {})
+
+
+def store_contract_metadata(chain_id: int, address: str, **values: Any) -> None:
+    _CONTRACT_METADATA.setdefault((chain_id, checksum_address(address)), {}).update(values)
+
+
+def clear_contract_metadata() -> None:
+    """Forget cached contract reads (e.g. between tests)."""
+    _CONTRACT_METADATA.clear()
+
+
+# JSON Schema type -> accepted Python types. Amounts are declared as strings, but LLMs often
+# emit bare numbers and the tools coerce them with Decimal/str, so numbers pass as strings
+_JSON_TYPES = {
+    "string": (str, int, float),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+}
+
+
+def _compile_validator(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], None]:
+    """Argument check for a tool's parameter schema (required keys and top-level types)."""
+    required = tuple(schema.get("required", ()))
+    typed = tuple(
+        (name, spec["type"], _JSON_TYPES[spec["type"]])
+        for name, spec in schema.get("properties", {}).items()
+        if spec.get("type") in _JSON_TYPES
+    )
+
+    def validate(args: Dict[str, Any]) -> None:
+        missing = [name for name in required if name not in args]
+        if missing:
+            raise ValueError(f"Missing required parameters: {', '.join(missing)}")
+        for name, type_name, types in typed:
+            value = args.get(name)
+            if value is None and name not in required:
+                continue
+            if not isinstance(value, types) or (
+                isinstance(value, bool) and type_name != "boolean"
+            ):
+                raise ValueError(f"Parameter {name!r} must be of type {type_name}")
+
+    return validate
+
+
+@dataclass(slots=True)
+class VeritasTool:
     """
     Definition of a single tool available to an agent.
     """
 
     name: str
     description: str
-    func: Callable = Field(exclude=True)  # The actual function to execute
+    func: Callable  # The actual function to execute
     parameters: Dict[str, Any]  # JSON Schema of parameters for the LLM
+    # Compiled once from `parameters`; raises ValueError for arguments that don't fit
+    validate_args: Callable[[Dict[str, Any]], None] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self.validate_args = _compile_validator(self.parameters)
 
 
 class VeritasCapability:
@@ -36,6 +142,7 @@ class WalletCapability(VeritasCapability):
     def __init__(self, agent: Any):
         super().__init__("wallet")
         self.agent = agent
+        self.chain_id = chain_id_for(getattr(agent, "network", "base-sepolia"))
 
         # Get Wallet Details
         self.tools.append(
@@ -88,37 +195,33 @@ class WalletCapability(VeritasCapability):
 - Native Balance: {bal} ETH"""
 
     async def get_balance(self) -> Dict[str, Any]:
-        wei = await asyncio.to_thread(self.agent.w3.eth.get_balance, self.agent.account.address)
+        address = self.agent.account.address
+        wei = await self.agent.chain_read(
+            f"balance:{address}", lambda: self.agent.async_w3.eth.get_balance(address)
+        )
         from web3 import Web3
 
         eth = Web3.from_wei(wei, "ether")
-        return {"balance_eth": float(eth), "address": self.agent.account.address}
+        return {"balance_eth": float(eth), "address": address}
 
     async def native_transfer(self, to: str, value: str) -> str:
         from web3 import Web3
 
-        w3 = self.agent.w3
         wei_value = Web3.to_wei(Decimal(value), "ether")
 
-        # Determine chainId from network string
-        network_id = getattr(self.agent, "network", "base-sepolia")
-        chain_id = 84532 if "sepolia" in network_id else 8453
-
-        gas_price = await asyncio.to_thread(w3.eth.gas_price)
-        nonce = await asyncio.to_thread(w3.eth.get_transaction_count, self.agent.account.address)
+        to_address = checksum_address(to)
+        gas_price, nonce = await self.agent.next_tx_params()
 
         tx = {
-            "to": Web3.to_checksum_address(to),
+            "to": to_address,
             "value": wei_value,
             "gas": 21000,
             "gasPrice": gas_price,
             "nonce": nonce,
-            "chainId": chain_id,
+            "chainId": self.chain_id,
         }
 
-        signed = w3.eth.account.sign_transaction(tx, self.agent.account.key)
-        tx_hash = await asyncio.to_thread(w3.eth.send_raw_transaction, signed.raw_transaction)
-
+        tx_hash = await sign_and_send(self.agent, tx)
         return f"Transferred {value} ETH to {to}. Hash: {Web3.to_hex(tx_hash)}"
 
 
@@ -131,7 +234,8 @@ class TradeCapability(VeritasCapability):
     def __init__(self, agent: Any):
         super().__init__("trading")
         self.agent = agent
-        from veritas.adapter import VeritasAdapter
+        # Deferred: adapter imports agent, which imports this package
+        from ..adapter import VeritasAdapter
 
         # 1. Price Quote Tool
         self.tools.append(
@@ -151,3 +255,18 @@ class TradeCapability(VeritasCapability):
                 },
             )
         )
+
+
+__all__ = [
+    "VeritasTool",
+    "VeritasCapability",
+    "WalletCapability",
+    "TradeCapability",
+    "cached_contract",
+    "chain_id_for",
+    "checksum_address",
+    "clear_contract_metadata",
+    "contract_metadata",
+    "sign_and_send",
+    "store_contract_metadata",
+]
@@ -1,25 +1,71 @@
 # Constants and ABIs for Veritas Tools
 
+import copy
+from functools import lru_cache
+from typing import Tuple
+
+from eth_abi import encode as abi_encode
+from eth_utils import function_signature_to_4byte_selector, to_checksum_address
+
+
+class _FrozenDict(dict):
+    """Read-only dict for the module's shared constants.
+
+    Copies come back as plain dicts: web3 copies ABI entries and edits the copies
+    (e.g. when aligning tuple[] components), which a MappingProxyType cannot do.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("constants are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {key: copy.deepcopy(item, memo) for key, item in self.items()}
+
+
+def _freeze(value):
+    """Read-only copy of nested dicts/lists, shared by every contract built from it."""
+    if isinstance(value, dict):
+        return _FrozenDict({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _addresses(value):
+    """Frozen copy of a (nested) address mapping, checksummed once at import."""
+    if isinstance(value, dict):
+        return _FrozenDict({key: _addresses(item) for key, item in value.items()})
+    return to_checksum_address(value)
+
+
 # --- Token Mappings ---
-TOKEN_ADDRESSES_BY_SYMBOLS = {
-    "base-mainnet": {
-        "USDC": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
-        "EURC": "0x60a3E35Cc302bFA44Cb288Bc5a4F316Fdb1adb42",
-        "CBBTC": "0xcbB7C0000aB88B473b1f5aFd9ef808440eed33Bf",
-        "CBETH": "0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22",
-        "WETH": "0x4200000000000000000000000000000000000006",
-        "ZORA": "0x1111111111166b7FE7bd91427724B487980aFc69",
-        "AERO": "0x940181a94a35a4569e4529a3cdfb74e38fd98631",
-        "BNKR": "0x22af33fe49fd1fa80c7149773dde5890d3c76f3b",
-        "CLANKER": "0x1bc0c42215582d5a085795f4badbac3ff36d1bcb",
-    },
-    "base-sepolia": {
-        "USDC": "0x036CbD53842c5426634e7929541eC2318f3dCF7e",
-        "EURC": "0x808456652fdb597867f38412077A9182bf77359F",
-        "CBBTC": "0xcbB7C0006F23900c38EB856149F799620fcb8A4a",
-        "WETH": "0x4200000000000000000000000000000000000006",
-    },
-}
+TOKEN_ADDRESSES_BY_SYMBOLS = _addresses(
+    {
+        "base-mainnet": {
+            "USDC": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+            "EURC": "0x60a3E35Cc302bFA44Cb288Bc5a4F316Fdb1adb42",
+            "CBBTC": "0xcbB7C0000aB88B473b1f5aFd9ef808440eed33Bf",
+            "CBETH": "0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22",
+            "WETH": "0x4200000000000000000000000000000000000006",
+            "ZORA": "0x1111111111166b7FE7bd91427724B487980aFc69",
+            "AERO": "0x940181a94a35a4569e4529a3cdfb74e38fd98631",
+            "BNKR": "0x22af33fe49fd1fa80c7149773dde5890d3c76f3b",
+            "CLANKER": "0x1bc0c42215582d5a085795f4badbac3ff36d1bcb",
+        },
+        "base-sepolia": {
+            "USDC": "0x036CbD53842c5426634e7929541eC2318f3dCF7e",
+            "EURC": "0x808456652fdb597867f38412077A9182bf77359F",
+            "CBBTC": "0xcbB7C0006F23900c38EB856149F799620fcb8A4a",
+            "WETH": "0x4200000000000000000000000000000000000006",
+        },
+    }
+)
 
 # --- Basename Constants ---
 BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_MAINNET = "0x4cCb0BB02FCABA27e82a56646E81d8c5bC4119a5"
@@ -30,341 +76,445 @@ REGISTRATION_DURATION = 31557600
 
 # --- ABIs ---
 
-ERC20_ABI = [
-    {
-        "type": "function",
-        "name": "balanceOf",
-        "stateMutability": "view",
-        "inputs": [{"name": "account", "type": "address"}],
-        "outputs": [{"type": "uint256"}],
-    },
-    {
-        "type": "function",
-        "name": "transfer",
-        "stateMutability": "nonpayable",
-        "inputs": [{"name": "recipient", "type": "address"}, {"name": "amount", "type": "uint256"}],
-        "outputs": [{"type": "bool"}],
-    },
-    {
-        "type": "function",
-        "name": "approve",
-        "inputs": [{"name": "spender", "type": "address"}, {"name": "amount", "type": "uint256"}],
-        "outputs": [{"type": "bool"}],
-    },
-    {
-        "type": "function",
-        "name": "decimals",
-        "stateMutability": "view",
-        "inputs": [],
-        "outputs": [{"type": "uint8"}],
-    },
-    {
-        "type": "function",
-        "name": "symbol",
-        "stateMutability": "view",
-        "inputs": [],
-        "outputs": [{"type": "string"}],
-    },
-    {
-        "type": "function",
-        "name": "name",
-        "stateMutability": "view",
-        "inputs": [],
-        "outputs": [{"type": "string"}],
-    },
-    {
-        "type": "function",
-        "name": "allowance",
-        "stateMutability": "view",
-        "inputs": [{"name": "owner", "type": "address"}, {"name": "spender", "type": "address"}],
-        "outputs": [{"type": "uint256"}],
-    },
-]
-
-WETH_ABI = [
-    {
-        "inputs": [],
-        "name": "deposit",
-        "outputs": [],
-        "stateMutability": "payable",
-        "type": "function",
-    },
-    {
-        "inputs": [{"name": "wad", "type": "uint256"}],
-        "name": "withdraw",
-        "outputs": [],
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-    {
-        "inputs": [{"name": "account", "type": "address"}],
-        "name": "balanceOf",
-        "outputs": [{"type": "uint256"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-]
-
-ERC721_ABI = [
-    {
-        "inputs": [
-            {"internalType": "address", "name": "to", "type": "address"},
-            {"internalType": "uint256", "name": "tokenId", "type": "uint256"},
-        ],
-        "name": "mint",
-        "outputs": [],
-        "payable": False,
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-    {
-        "inputs": [{"internalType": "address", "name": "owner", "type": "address"}],
-        "name": "balanceOf",
-        "outputs": [{"internalType": "uint256", "name": "balance", "type": "uint256"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-    {
-        "inputs": [{"internalType": "uint256", "name": "tokenId", "type": "uint256"}],
-        "name": "ownerOf",
-        "outputs": [{"internalType": "address", "name": "owner", "type": "address"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-    {
-        "inputs": [
-            {"internalType": "address", "name": "from", "type": "address"},
-            {"internalType": "address", "name": "to", "type": "address"},
-            {"internalType": "uint256", "name": "tokenId", "type": "uint256"},
-        ],
-        "name": "safeTransferFrom",
-        "outputs": [],
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-]
-
-L2_RESOLVER_ABI = [
-    {
-        "inputs": [
-            {"internalType": "bytes32", "name": "node", "type": "bytes32"},
-            {"internalType": "address", "name": "a", "type": "address"},
-        ],
-        "name": "setAddr",
-        "outputs": [],
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-    {
-        "inputs": [
-            {"internalType": "bytes32", "name": "node", "type": "bytes32"},
-            {"internalType": "string", "name": "newName", "type": "string"},
-        ],
-        "name": "setName",
-        "outputs": [],
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-]
-
-REGISTRAR_ABI = [
+ERC20_ABI = _freeze(
+    [
+        {
+            "type": "function",
+            "name": "balanceOf",
+            "stateMutability": "view",
+            "inputs": [{"name": "account", "type": "address"}],
+            "outputs": [{"type": "uint256"}],
+        },
+        {
+            "type": "function",
+            "name": "transfer",
+            "stateMutability": "nonpayable",
+            "inputs": [
+                {"name": "recipient", "type": "address"},
+                {"name": "amount", "type": "uint256"},
+            ],
+            "outputs": [{"type": "bool"}],
+        },
+        {
+            "type": "function",
+            "name": "approve",
+            "inputs": [
+                {"name": "spender", "type": "address"},
+                {"name": "amount", "type": "uint256"},
+            ],
+            "outputs": [{"type": "bool"}],
+        },
+        {
+            "type": "function",
+            "name": "decimals",
+            "stateMutability": "view",
+            "inputs": [],
+            "outputs": [{"type": "uint8"}],
+        },
+        {
+            "type": "function",
+            "name": "symbol",
+            "stateMutability": "view",
+            "inputs": [],
+            "outputs": [{"type": "string"}],
+        },
+        {
+            "type": "function",
+            "name": "name",
+            "stateMutability": "view",
+            "inputs": [],
+            "outputs": [{"type": "string"}],
+        },
+        {
+            "type": "function",
+            "name": "allowance",
+            "stateMutability": "view",
+            "inputs": [
+                {"name": "owner", "type": "address"},
+                {"name": "spender", "type": "address"},
+            ],
+            "outputs": [{"type": "uint256"}],
+        },
+    ]
+)
+
+WETH_ABI = _freeze(
+    [
+        {
+            "inputs": [],
+            "name": "deposit",
+            "outputs": [],
+            "stateMutability": "payable",
+            "type": "function",
+        },
+        {
+            "inputs": [{"name": "wad", "type": "uint256"}],
+            "name": "withdraw",
+            "outputs": [],
+            "stateMutability": "nonpayable",
+            "type": "function",
+        },
+        {
+            "inputs": [{"name": "account", "type": "address"}],
+            "name": "balanceOf",
+            "outputs": [{"type": "uint256"}],
+            "stateMutability": "view",
+            "type": "function",
+        },
+    ]
+)
+
+ERC721_ABI = _freeze(
+    [
+        {
+            "inputs": [
+                {"internalType": "address", "name": "to", "type": "address"},
+                {"internalType": "uint256", "name": "tokenId", "type": "uint256"},
+            ],
+            "name": "mint",
+            "outputs": [],
+            "payable": False,
+            "stateMutability": "nonpayable",
+            "type": "function",
+        },
+        {
+            "inputs": [{"internalType": "address", "name": "owner", "type": "address"}],
+            "name": "balanceOf",
+            "outputs": [{"internalType": "uint256", "name": "balance", "type": "uint256"}],
+            "stateMutability": "view",
+            "type": "function",
+        },
+        {
+            "inputs": [{"internalType": "uint256", "name": "tokenId", "type": "uint256"}],
+            "name": "ownerOf",
+            "outputs": [{"internalType": "address", "name": "owner", "type": "address"}],
+            "stateMutability": "view",
+            "type": "function",
+        },
+        {
+            "inputs": [
+                {"internalType": "address", "name": "from", "type": "address"},
+                {"internalType": "address", "name": "to", "type": "address"},
+                {"internalType": "uint256", "name": "tokenId", "type": "uint256"},
+            ],
+            "name": "safeTransferFrom",
+            "outputs": [],
+            "stateMutability": "nonpayable",
+            "type": "function",
+        },
+    ]
+)
+
+L2_RESOLVER_ABI = _freeze(
+    [
+        {
+            "inputs": [
+                {"internalType": "bytes32", "name": "node", "type": "bytes32"},
+                {"internalType": "address", "name": "a", "type": "address"},
+            ],
+            "name": "setAddr",
+            "outputs": [],
+            "stateMutability": "nonpayable",
+            "type": "function",
+        },
+        {
+            "inputs": [
+                {"internalType": "bytes32", "name": "node", "type": "bytes32"},
+                {"internalType": "string", "name": "newName", "type": "string"},
+            ],
+            "name": "setName",
+            "outputs": [],
+            "stateMutability": "nonpayable",
+            "type": "function",
+        },
+    ]
+)
+
+REGISTRAR_ABI = _freeze(
+    [
+        {
+            "inputs": [
+                {
+                    "components": [
+                        {"internalType": "string", "name": "name", "type": "string"},
+                        {"internalType": "address", "name": "owner", "type": "address"},
+                        {"internalType": "uint256", "name": "duration", "type": "uint256"},
+                        {"internalType": "address", "name": "resolver", "type": "address"},
+                        {"internalType": "bytes[]", "name": "data", "type": "bytes[]"},
+                        {"internalType": "bool", "name": "reverseRecord", "type": "bool"},
+                    ],
+                    "internalType": "struct RegistrarController.RegisterRequest",
+                    "name": "request",
+                    "type": "tuple",
+                }
+            ],
+            "name": "register",
+            "outputs": [],
+            "stateMutability": "payable",
+            "type": "function",
+        }
+    ]
+)
+
+PYTH_ABI = _freeze(
+    [
+        {
+            "inputs": [{"internalType": "bytes32", "name": "id", "type": "bytes32"}],
+            "name": "getPrice",
+            "outputs": [
+                {
+                    "components": [
+                        {"internalType": "int64", "name": "price", "type": "int64"},
+                        {"internalType": "uint64", "name": "conf", "type": "uint64"},
+                        {"internalType": "int32", "name": "expo", "type": "int32"},
+                        {"internalType": "uint256", "name": "publishTime", "type": "uint256"},
+                    ],
+                    "internalType": "struct PythStructs.Price",
+                    "name": "price",
+                    "type": "tuple",
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function",
+        },
+        {
+            "inputs": [{"internalType": "bytes32", "name": "id", "type": "bytes32"}],
+            "name": "getPriceUnsafe",
+            "outputs": [
+                {
+                    "components": [
+                        {"internalType": "int64", "name": "price", "type": "int64"},
+                        {"internalType": "uint64", "name": "conf", "type": "uint64"},
+                        {"internalType": "int32", "name": "expo", "type": "int32"},
+                        {"internalType": "uint256", "name": "publishTime", "type": "uint256"},
+                    ],
+                    "internalType": "struct PythStructs.Price",
+                    "name": "price",
+                    "type": "tuple",
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function",
+        },
+    ]
+)
+
+# --- Aave Constants ---
+AAVE_POOL_ADDRESSES = _addresses(
     {
-        "inputs": [
-            {
-                "components": [
-                    {"internalType": "string", "name": "name", "type": "string"},
-                    {"internalType": "address", "name": "owner", "type": "address"},
-                    {"internalType": "uint256", "name": "duration", "type": "uint256"},
-                    {"internalType": "address", "name": "resolver", "type": "address"},
-                    {"internalType": "bytes[]", "name": "data", "type": "bytes[]"},
-                    {"internalType": "bool", "name": "reverseRecord", "type": "bool"},
-                ],
-                "internalType": "struct RegistrarController.RegisterRequest",
-                "name": "request",
-                "type": "tuple",
-            }
-        ],
-        "name": "register",
-        "outputs": [],
-        "stateMutability": "payable",
-        "type": "function",
+        "base-mainnet": "0xa238dd80c259a72e81d7e4664a9801593f98d1c5",
+        "base-sepolia": "0x6Ae43d32719F6Eb210cE53c300eD29798E90C478",  # Aave V3 Pool on Base Sepolia
     }
-]
+)
 
-PYTH_ABI = [
-    {
-        "inputs": [{"internalType": "bytes32", "name": "id", "type": "bytes32"}],
-        "name": "getPrice",
-        "outputs": [
-            {
-                "components": [
-                    {"internalType": "int64", "name": "price", "type": "int64"},
-                    {"internalType": "uint64", "name": "conf", "type": "uint64"},
-                    {"internalType": "int32", "name": "expo", "type": "int32"},
-                    {"internalType": "uint256", "name": "publishTime", "type": "uint256"},
-                ],
-                "internalType": "struct PythStructs.Price",
-                "name": "price",
-                "type": "tuple",
-            }
-        ],
-        "stateMutability": "view",
-        "type": "function",
-    },
+AAVE_POOL_ABI = _freeze(
+    [
+        {
+            "inputs": [
+                {"internalType": "address", "name": "asset", "type": "address"},
+                {"internalType": "uint256", "name": "amount", "type": "uint256"},
+                {"internalType": "address", "name": "onBehalfOf", "type": "address"},
+                {"internalType": "uint16", "name": "referralCode", "type": "uint16"},
+            ],
+            "name": "supply",
+            "outputs": [],
+            "stateMutability": "nonpayable",
+            "type": "function",
+        },
+        {
+            "inputs": [
+                {"internalType": "address", "name": "asset", "type": "address"},
+                {"internalType": "uint256", "name": "amount", "type": "uint256"},
+                {"internalType": "address", "name": "to", "type": "address"},
+            ],
+            "name": "withdraw",
+            "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+            "stateMutability": "nonpayable",
+            "type": "function",
+        },
+        {
+            "inputs": [
+                {"internalType": "address", "name": "asset", "type": "address"},
+                {"internalType": "uint256", "name": "amount", "type": "uint256"},
+                {"internalType": "uint256", "name": "interestRateMode", "type": "uint256"},
+                {"internalType": "uint16", "name": "referralCode", "type": "uint16"},
+                {"internalType": "address", "name": "onBehalfOf", "type": "address"},
+            ],
+            "name": "borrow",
+            "outputs": [],
+            "stateMutability": "nonpayable",
+            "type": "function",
+        },
+        {
+            "inputs": [
+                {"internalType": "address", "name": "asset", "type": "address"},
+                {"internalType": "uint256", "name": "amount", "type": "uint256"},
+                {"internalType": "uint256", "name": "interestRateMode", "type": "uint256"},
+                {"internalType": "address", "name": "onBehalfOf", "type": "address"},
+            ],
+            "name": "repay",
+            "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+            "stateMutability": "nonpayable",
+            "type": "function",
+        },
+    ]
+)
+
+# --- Compound Constants ---
+COMET_ADDRESSES = _addresses(
     {
-        "inputs": [{"internalType": "bytes32", "name": "id", "type": "bytes32"}],
-        "name": "getPriceUnsafe",
-        "outputs": [
-            {
-                "components": [
-                    {"internalType": "int64", "name": "price", "type": "int64"},
-                    {"internalType": "uint64", "name": "conf", "type": "uint64"},
-                    {"internalType": "int32", "name": "expo", "type": "int32"},
-                    {"internalType": "uint256", "name": "publishTime", "type": "uint256"},
-                ],
-                "internalType": "struct PythStructs.Price",
-                "name": "price",
-                "type": "tuple",
-            }
-        ],
-        "stateMutability": "view",
-        "type": "function",
-    },
-]
+        "base-mainnet": "0xb125E6687d4313864e53df431d5425969c15Eb2F",
+        "base-sepolia": "0x571621Ce60Cebb0c1D442B5afb38B1663C6Bf017",
+    }
+)
 
-# --- Aave Constants ---
-AAVE_POOL_ADDRESSES = {
-    "base-mainnet": "0xa238dd80c259a72e81d7e4664a9801593f98d1c5",
-    "base-sepolia": "0x6Ae43d32719F6Eb210cE53c300eD29798E90C478",  # Aave V3 Pool on Base Sepolia
-}
+COMET_ABI = _freeze(
+    [
+        {
+            "inputs": [
+                {"internalType": "address", "name": "asset", "type": "address"},
+                {"internalType": "uint256", "name": "amount", "type": "uint256"},
+            ],
+            "name": "supply",
+            "outputs": [],
+            "stateMutability": "nonpayable",
+            "type": "function",
+        },
+        {
+            "inputs": [
+                {"internalType": "address", "name": "asset", "type": "address"},
+                {"internalType": "uint256", "name": "amount", "type": "uint256"},
+            ],
+            "name": "withdraw",
+            "outputs": [],
+            "stateMutability": "nonpayable",
+            "type": "function",
+        },
+        {
+            "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
+            "name": "borrowBalanceOf",
+            "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+            "stateMutability": "view",
+            "type": "function",
+        },
+    ]
+)
 
-AAVE_POOL_ABI = [
-    {
-        "inputs": [
-            {"internalType": "address", "name": "asset", "type": "address"},
-            {"internalType": "uint256", "name": "amount", "type": "uint256"},
-            {"internalType": "address", "name": "onBehalfOf", "type": "address"},
-            {"internalType": "uint16", "name": "referralCode", "type": "uint16"},
-        ],
-        "name": "supply",
-        "outputs": [],
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-    {
-        "inputs": [
-            {"internalType": "address", "name": "asset", "type": "address"},
-            {"internalType": "uint256", "name": "amount", "type": "uint256"},
-            {"internalType": "address", "name": "to", "type": "address"},
-        ],
-        "name": "withdraw",
-        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-    {
-        "inputs": [
-            {"internalType": "address", "name": "asset", "type": "address"},
-            {"internalType": "uint256", "name": "amount", "type": "uint256"},
-            {"internalType": "uint256", "name": "interestRateMode", "type": "uint256"},
-            {"internalType": "uint16", "name": "referralCode", "type": "uint16"},
-            {"internalType": "address", "name": "onBehalfOf", "type": "address"},
-        ],
-        "name": "borrow",
-        "outputs": [],
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
+# --- Chainlink Price Feeds ---
+CHAINLINK_FEED_ADDRESSES = _addresses(
     {
-        "inputs": [
-            {"internalType": "address", "name": "asset", "type": "address"},
-            {"internalType": "uint256", "name": "amount", "type": "uint256"},
-            {"internalType": "uint256", "name": "interestRateMode", "type": "uint256"},
-            {"internalType": "address", "name": "onBehalfOf", "type": "address"},
-        ],
-        "name": "repay",
-        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-]
+        "base-mainnet": {
+            "ETH/USD": "0x71099754BA84C2bF03C518b27dfDA49b638D592C",
+            "BTC/USD": "0x6c113dF1D5dDB89C51F1C9C9dD42F6f7d50A43E4",
+            "USDC/USD": "0x7e860098F58bB4C92dFf5d47c33A4C7f3A7aA6e6",
+        },
+        "base-sepolia": {
+            "ETH/USD": "0xE2E1CECaF186D44A4B01f46D6A7EcaE2B89c8076",
+            "BTC/USD": "0xd94e4C1C3bB697AAE92744FAA4E43B5c2Ef11f16",
+            "USDC/USD": "0x7e860098F58bB4C92dFf5d47c33A4C7f3A7aA6e6",
+        },
+    }
+)
 
-# --- Compound Constants ---
-COMET_ADDRESSES = {
-    "base-mainnet": "0xb125E6687d4313864e53df431d5425969c15Eb2F",
-    "base-sepolia": "0x571621Ce60Cebb0c1D442B5afb38B1663C6Bf017",
-}
+CHAINLINK_ABI = _freeze(
+    [
+        {
+            "inputs": [],
+            "name": "latestRoundData",
+            "outputs": [
+                {"internalType": "uint80", "name": "roundId", "type": "uint80"},
+                {"internalType": "int256", "name": "answer", "type": "int256"},
+                {"internalType": "uint256", "name": "startedAt", "type": "uint256"},
+                {"internalType": "uint256", "name": "updatedAt", "type": "uint256"},
+                {"internalType": "uint80", "name": "answeredInRound", "type": "uint80"},
+            ],
+            "stateMutability": "view",
+            "type": "function",
+        },
+        {
+            "inputs": [],
+            "name": "decimals",
+            "outputs": [{"internalType": "uint8", "name": "", "type": "uint8"}],
+            "stateMutability": "view",
+            "type": "function",
+        },
+        {
+            "inputs": [],
+            "name": "description",
+            "outputs": [{"internalType": "string", "name": "", "type": "string"}],
+            "stateMutability": "view",
+            "type": "function",
+        },
+    ]
+)
 
-COMET_ABI = [
-    {
-        "inputs": [
-            {"internalType": "address", "name": "asset", "type": "address"},
-            {"internalType": "uint256", "name": "amount", "type": "uint256"},
-        ],
-        "name": "supply",
-        "outputs": [],
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-    {
-        "inputs": [
-            {"internalType": "address", "name": "asset", "type": "address"},
-            {"internalType": "uint256", "name": "amount", "type": "uint256"},
-        ],
-        "name": "withdraw",
-        "outputs": [],
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-    {
-        "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
-        "name": "borrowBalanceOf",
-        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-]
+# --- Multicall3 (same address on every EVM chain, including Base and Base Sepolia) ---
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
 
-# --- Chainlink Price Feeds ---
-CHAINLINK_FEED_ADDRESSES = {
-    "base-mainnet": {
-        "ETH/USD": "0x71099754BA84C2bF03C518b27dfDA49b638D592C",
-        "BTC/USD": "0x6c113dF1D5dDB89C51F1C9C9dD42F6f7d50A43E4",
-        "USDC/USD": "0x7e860098F58bB4C92dFf5d47c33A4C7f3A7aA6e6",
-    },
-    "base-sepolia": {
-        "ETH/USD": "0xE2E1CECaF186D44A4B01f46D6A7EcaE2B89c8076",
-        "BTC/USD": "0xd94e4C1C3bB697AAE92744FAA4E43B5c2Ef11f16",
-        "USDC/USD": "0x7e860098F58bB4C92dFf5d47c33A4C7f3A7aA6e6",
-    },
+MULTICALL3_ABI = _freeze(
+    [
+        {
+            "inputs": [
+                {
+                    "components": [
+                        {"internalType": "address", "name": "target", "type": "address"},
+                        {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                        {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                    ],
+                    "internalType": "struct Multicall3.Call3[]",
+                    "name": "calls",
+                    "type": "tuple[]",
+                }
+            ],
+            "name": "aggregate3",
+            "outputs": [
+                {
+                    "components": [
+                        {"internalType": "bool", "name": "success", "type": "bool"},
+                        {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                    ],
+                    "internalType": "struct Multicall3.Result[]",
+                    "name": "returnData",
+                    "type": "tuple[]",
+                }
+            ],
+            "stateMutability": "payable",
+            "type": "function",
+        },
+    ]
+)
+
+# --- 4-byte selectors for hot-path calls, hashed once at import ---
+SELECTORS = {
+    signature: function_signature_to_4byte_selector(signature)
+    for signature in (
+        # ERC20
+        "balanceOf(address)",
+        "decimals()",
+        "symbol()",
+        "transfer(address,uint256)",
+        "approve(address,uint256)",
+        # Aave V3 pool
+        "supply(address,uint256,address,uint16)",
+        "withdraw(address,uint256,address)",
+        "borrow(address,uint256,uint256,uint16,address)",
+        "repay(address,uint256,uint256,address)",
+        # Compound V3 (Comet)
+        "supply(address,uint256)",
+        "withdraw(address,uint256)",
+        # Price feeds
+        "getPriceUnsafe(bytes32)",
+        "latestRoundData()",
+    )
 }
 
-CHAINLINK_ABI = [
-    {
-        "inputs": [],
-        "name": "latestRoundData",
-        "outputs": [
-            {"internalType": "uint80", "name": "roundId", "type": "uint80"},
-            {"internalType": "int256", "name": "answer", "type": "int256"},
-            {"internalType": "uint256", "name": "startedAt", "type": "uint256"},
-            {"internalType": "uint256", "name": "updatedAt", "type": "uint256"},
-            {"internalType": "uint80", "name": "answeredInRound", "type": "uint80"},
-        ],
-        "stateMutability": "view",
-        "type": "function",
-    },
-    {
-        "inputs": [],
-        "name": "decimals",
-        "outputs": [{"internalType": "uint8", "name": "", "type": "uint8"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-    {
-        "inputs": [],
-        "name": "description",
-        "outputs": [{"internalType": "string", "name": "", "type": "string"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-]
+
+@lru_cache(maxsize=None)
+def _arg_types(signature: str) -> Tuple[str, ...]:
+    args = signature[signature.index("(") + 1 : -1]
+    return tuple(args.split(",")) if args else ()
+
+
+def encode_call(signature: str, *args) -> str:
+    """Hex calldata for a SELECTORS signature, ABI-encoded without building a contract."""
+    return "0x" + (SELECTORS[signature] + abi_encode(_arg_types(signature), args)).hex()
@@ -1,13 +1,19 @@
 import asyncio
 from typing import Any, Dict
-from .base import VeritasCapability, VeritasTool
+from .base import (
+    VeritasCapability,
+    VeritasTool,
+    cached_contract,
+    chain_id_for,
+    contract_metadata,
+    sign_and_send,
+    store_contract_metadata,
+)
 from .constants import (
-    AAVE_POOL_ABI,
     AAVE_POOL_ADDRESSES,
-    COMET_ABI,
     COMET_ADDRESSES,
     TOKEN_ADDRESSES_BY_SYMBOLS,
-    ERC20_ABI,
+    encode_call,
 )
 from decimal import Decimal
 
@@ -20,32 +26,47 @@ class DeFiCapability(VeritasCapability):
     def __init__(self, name: str, agent: Any):
         super().__init__(name)
         self.agent = agent
+        self.network_id = getattr(agent, "network", "base-mainnet")
+        self.chain_id = chain_id_for(self.network_id)
+        # Fields shared by every protocol call; gas, gasPrice and nonce are added at send time
+        self._base_tx = {"from": agent.account.address, "chainId": self.chain_id, "value": 0}
 
     async def _get_decimals(self, token_address: str) -> int:
         """Fetch decimals from the ERC20 contract."""
-        try:
-            contract = self.agent.w3.eth.contract(
-                address=self.agent.w3.to_checksum_address(token_address), abi=ERC20_ABI
-            )
-            return await asyncio.to_thread(contract.functions.decimals().call)
-        except Exception:
-            return 18  # Fallback
+        decimals = contract_metadata(self.chain_id, token_address).get("decimals")
+        if decimals is None:
+            try:
+                contract = cached_contract(self.agent.async_w3, token_address, "ERC20_ABI")
+                decimals = await contract.functions.decimals().call()
+            except Exception:
+                return 18  # Fallback; not cached so the next call retries
+            store_contract_metadata(self.chain_id, token_address, decimals=decimals)
+        return decimals
+
+    def _get_asset_address(self, symbol: str) -> str:
+        tokens = TOKEN_ADDRESSES_BY_SYMBOLS.get(self.network_id, {})
+        addr = tokens.get(symbol.upper())
+        if not addr:
+            raise ValueError(f"Token {symbol} not found on {self.network_id}")
+        return addr
 
     async def _simulate_and_send(self, tx_params: dict) -> str:
         """Simulate a transaction and then sign/send if successful."""
-        w3 = self.agent.w3
+        w3 = self.agent.async_w3
 
-        # 1. Simulate
-        try:
-            await asyncio.to_thread(w3.eth.call, tx_params)
-        except Exception as e:
-            raise Exception(f"Transaction simulation failed: {e}")
+        # 1. Simulate, overlapping the gas price / nonce fetch with the eth_call round trip
+        simulated, tx_fields = await asyncio.gather(
+            w3.eth.call(tx_params), self.agent.next_tx_params(), return_exceptions=True
+        )
+        if isinstance(simulated, Exception):
+            if not isinstance(tx_fields, BaseException):
+                self.agent.attestor.reset_nonce()  # the reserved nonce won't be used
+            raise Exception(f"Transaction simulation failed: {simulated}")
+        if isinstance(tx_fields, BaseException):
+            raise tx_fields
 
         # 2. Build remaining params
-        gas_price = await asyncio.to_thread(w3.eth.gas_price)
-        nonce = await asyncio.to_thread(
-            w3.eth.get_transaction_count, self.agent.account.address
-        )
+        gas_price, nonce = tx_fields
 
         tx_params.update(
             {
@@ -56,10 +77,7 @@ class DeFiCapability(VeritasCapability):
         )
 
         # 3. Sign and Send
-        signed = w3.eth.account.sign_transaction(tx_params, self.agent.account.key)
-        tx_hash = await asyncio.to_thread(
-            w3.eth.send_raw_transaction, signed.raw_transaction
-        )
+        tx_hash = await sign_and_send(self.agent, tx_params)
         return w3.to_hex(tx_hash)
 
 
@@ -70,6 +88,7 @@ class AaveCapability(DeFiCapability):
 
     def __init__(self, agent: Any):
         super().__init__("aave", agent)
+        self.pool_address = AAVE_POOL_ADDRESSES.get(self.network_id)
 
         self.tools.append(
             VeritasTool(
@@ -103,59 +122,50 @@ class AaveCapability(DeFiCapability):
             )
         )
 
-    def _get_pool_contract(self):
-        network_id = getattr(self.agent, "network", "base-mainnet")
-        address = AAVE_POOL_ADDRESSES.get(network_id)
-        if not address:
-            raise ValueError(f"Aave not supported on {network_id}")
-        return self.agent.w3.eth.contract(
-            address=self.agent.w3.to_checksum_address(address), abi=AAVE_POOL_ABI
-        )
-
-    def _get_asset_address(self, symbol: str) -> str:
-        network_id = getattr(self.agent, "network", "base-mainnet")
-        tokens = TOKEN_ADDRESSES_BY_SYMBOLS.get(network_id, {})
-        addr = tokens.get(symbol.upper())
-        if not addr:
-            raise ValueError(f"Token {symbol} not found on {network_id}")
-        return addr
+    def _get_pool_address(self) -> str:
+        if not self.pool_address:
+            raise ValueError(f"Aave not supported on {self.network_id}")
+        return self.pool_address
 
     async def supply(self, asset_symbol: str, amount: str) -> Dict[str, Any]:
-        contract = self._get_pool_contract()
+        pool_address = self._get_pool_address()
         asset_addr = self._get_asset_address(asset_symbol)
         decimals = await self._get_decimals(asset_addr)
         raw_amount = int(Decimal(amount) * (10**decimals))
 
-        tx_params = contract.functions.supply(
-            self.agent.w3.to_checksum_address(asset_addr), raw_amount, self.agent.account.address, 0
-        ).build_transaction(
-            {
-                "from": self.agent.account.address,
-                "chainId": 84532 if "sepolia" in getattr(self.agent, "network", "") else 8453,
-            }
-        )
+        tx_params = {
+            **self._base_tx,
+            "to": pool_address,
+            "data": encode_call(
+                "supply(address,uint256,address,uint16)",
+                asset_addr,
+                raw_amount,
+                self.agent.account.address,
+                0,
+            ),
+        }
 
         tx_hash = await self._simulate_and_send(tx_params)
         return {"status": "success", "action": "supply", "tx_hash": tx_hash}
 
     async def borrow(self, asset_symbol: str, amount: str) -> Dict[str, Any]:
-        contract = self._get_pool_contract()
+        pool_address = self._get_pool_address()
         asset_addr = self._get_asset_address(asset_symbol)
         decimals = await self._get_decimals(asset_addr)
         raw_amount = int(Decimal(amount) * (10**decimals))
 
-        tx_params = contract.functions.borrow(
-            self.agent.w3.to_checksum_address(asset_addr),
-            raw_amount,
-            2,  # Variable interest rate mode
-            0,
-            self.agent.account.address,
-        ).build_transaction(
-            {
-                "from": self.agent.account.address,
-                "chainId": 84532 if "sepolia" in getattr(self.agent, "network", "") else 8453,
-            }
-        )
+        tx_params = {
+            **self._base_tx,
+            "to": pool_address,
+            "data": encode_call(
+                "borrow(address,uint256,uint256,uint16,address)",
+                asset_addr,
+                raw_amount,
+                2,  # Variable interest rate mode
+                0,
+                self.agent.account.address,
+            ),
+        }
 
         tx_hash = await self._simulate_and_send(tx_params)
         return {"status": "success", "action": "borrow", "tx_hash": tx_hash}
@@ -168,6 +178,7 @@ class CompoundCapability(DeFiCapability):
 
     def __init__(self, agent: Any):
         super().__init__("compound", agent)
+        self.comet_address = COMET_ADDRESSES.get(self.network_id)
 
         self.tools.append(
             VeritasTool(
@@ -186,27 +197,18 @@ class CompoundCapability(DeFiCapability):
         )
 
     async def supply(self, asset_symbol: str, amount: str) -> Dict[str, Any]:
-        network_id = getattr(self.agent, "network", "base-mainnet")
-        comet_addr = COMET_ADDRESSES.get(network_id)
-        if not comet_addr:
-            raise ValueError(f"Compound not supported on {network_id}")
+        if not self.comet_address:
+            raise ValueError(f"Compound not supported on {self.network_id}")
 
-        contract = self.agent.w3.eth.contract(
-            address=self.agent.w3.to_checksum_address(comet_addr), abi=COMET_ABI
-        )
-        tokens = TOKEN_ADDRESSES_BY_SYMBOLS.get(network_id, {})
-        asset_addr = tokens.get(asset_symbol.upper())
+        asset_addr = self._get_asset_address(asset_symbol)
         decimals = await self._get_decimals(asset_addr)
         raw_amount = int(Decimal(amount) * (10**decimals))
 
-        tx_params = contract.functions.supply(
-            self.agent.w3.to_checksum_address(asset_addr), raw_amount
-        ).build_transaction(
-            {
-                "from": self.agent.account.address,
-                "chainId": 84532 if "sepolia" in network_id else 8453,
-            }
-        )
+        tx_params = {
+            **self._base_tx,
+            "to": self.comet_address,
+            "data": encode_call("supply(address,uint256)", asset_addr, raw_amount),
+        }
 
         tx_hash = await self._simulate_and_send(tx_params)
         return {"status": "success", "protocol": "Compound", "tx_hash": tx_hash}
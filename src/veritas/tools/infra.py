@@ -1,6 +1,27 @@
+import asyncio
+from functools import lru_cache
 from typing import Any, Dict
-from .base import VeritasCapability, VeritasTool
-from .constants import PYTH_ABI, CHAINLINK_ABI, CHAINLINK_FEED_ADDRESSES
+from .base import (
+    VeritasCapability,
+    VeritasTool,
+    cached_contract,
+    chain_id_for,
+    contract_metadata,
+    store_contract_metadata,
+)
+from .constants import CHAINLINK_FEED_ADDRESSES
+
+# Pyth Contract on Base Sepolia
+PYTH_ADDRESS = "0xA2aa501b19aff244D90cc15a4Cf739D2725B5729"
+
+
+@lru_cache(maxsize=256)
+def _pyth_id_bytes(price_feed_id: str) -> bytes:
+    """bytes32 feed id from its hex string (with or without 0x)."""
+    clean_id = price_feed_id.strip()
+    if clean_id.startswith("0x"):
+        clean_id = clean_id[2:]
+    return bytes.fromhex(clean_id[:64])  # Force 32 bytes
 
 
 class PythCapability(VeritasCapability):
@@ -30,23 +51,17 @@ class PythCapability(VeritasCapability):
             )
         )
 
-    def get_price(self, price_feed_id: str) -> Dict[str, Any]:
-        # Pyth Contract on Base Sepolia
-        raw_address = "0xA2aa501b19aff244D90cc15a4Cf739D2725B5729"
-        contract_address = self.agent.w3.to_checksum_address(raw_address)
-        contract = self.agent.w3.eth.contract(address=contract_address, abi=PYTH_ABI)
+    async def get_price(self, price_feed_id: str) -> Dict[str, Any]:
+        contract = cached_contract(self.agent.async_w3, PYTH_ADDRESS, "PYTH_ABI")
 
         # Use getPriceUnsafe to bypass staleness checks common on testnets
         # Convert hex string to bytes32 for contract
         if isinstance(price_feed_id, str):
-            clean_id = price_feed_id.strip()
-            if clean_id.startswith("0x"):
-                clean_id = clean_id[2:]
-            feed_id_bytes = bytes.fromhex(clean_id[:64])  # Force 32 bytes
+            feed_id_bytes = _pyth_id_bytes(price_feed_id)
         else:
             feed_id_bytes = price_feed_id
 
-        price_data = contract.functions.getPriceUnsafe(feed_id_bytes).call()
+        price_data = await contract.functions.getPriceUnsafe(feed_id_bytes).call()
         # Struct: price, conf, expo, publishTime
         price = price_data[0]
         expo = price_data[2]
@@ -101,6 +116,8 @@ class ChainlinkCapability(VeritasCapability):
     def __init__(self, agent: Any):
         super().__init__("chainlink")
         self.agent = agent
+        self.network_id = getattr(agent, "network", "base-sepolia")
+        self.chain_id = chain_id_for(self.network_id)
 
         self.tools.append(
             VeritasTool(
@@ -120,10 +137,9 @@ class ChainlinkCapability(VeritasCapability):
             )
         )
 
-    def get_price(self, pair: str) -> Dict[str, Any]:
-        network_id = getattr(self.agent, "network", "base-sepolia")
+    async def get_price(self, pair: str) -> Dict[str, Any]:
         feeds = CHAINLINK_FEED_ADDRESSES.get(
-            network_id, CHAINLINK_FEED_ADDRESSES.get("base-sepolia")
+            self.network_id, CHAINLINK_FEED_ADDRESSES.get("base-sepolia")
         )
 
         if pair not in feeds:
@@ -131,14 +147,17 @@ class ChainlinkCapability(VeritasCapability):
             raise ValueError(f"Pair {pair} not available. Available pairs: {available}")
 
         raw_address = feeds[pair]
-        contract_address = self.agent.w3.to_checksum_address(raw_address)
-        contract = self.agent.w3.eth.contract(
-            address=contract_address, abi=CHAINLINK_ABI
-        )
+        contract = cached_contract(self.agent.async_w3, raw_address, "CHAINLINK_ABI")
 
-        round_data = contract.functions.latestRoundData().call()
+        decimals = contract_metadata(self.chain_id, raw_address).get("decimals")
+        if decimals is None:
+            round_data, decimals = await asyncio.gather(
+                contract.functions.latestRoundData().call(), contract.functions.decimals().call()
+            )
+            store_contract_metadata(self.chain_id, raw_address, decimals=decimals)
+        else:
+            round_data = await contract.functions.latestRoundData().call()
         price = round_data[1]  # answer
-        decimals = contract.functions.decimals().call()
         updated_at = round_data[3]
 
         real_price = price / (10**decimals)
@@ -0,0 +1,99 @@
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from web3 import Web3
+
+from .base import VeritasCapability, VeritasTool, cached_contract
+from .constants import MULTICALL3_ADDRESS, TOKEN_ADDRESSES_BY_SYMBOLS, encode_call
+
+
+async def aggregate(w3, calls: List[Tuple[str, str]]) -> List[Optional[bytes]]:
+    """
+    Run (target, calldata) read calls in one aggregate3 eth_call.
+    Entries are None for calls that reverted or returned nothing.
+    """
+    multicall = cached_contract(w3, MULTICALL3_ADDRESS, "MULTICALL3_ABI")
+    results = await multicall.functions.aggregate3(
+        [(target, True, data) for target, data in calls]
+    ).call()
+    # Calls to an address without code succeed with empty return data
+    return [data if ok and data else None for ok, data in results]
+
+
+async def get_balances(w3, owner: str, tokens: List[str]) -> List[Optional[Tuple[int, int]]]:
+    """
+    (raw balance, decimals) of `owner` for each token, read in one aggregate3 eth_call.
+    Entries are None for tokens whose calls reverted or returned nothing.
+    """
+    balance_of = encode_call("balanceOf(address)", owner)
+    decimals_of = encode_call("decimals()")
+    calls = []
+    for token in tokens:
+        calls.append((token, balance_of))
+        calls.append((token, decimals_of))
+    results = await aggregate(w3, calls)
+
+    balances = []
+    for balance_data, decimals_data in zip(results[::2], results[1::2]):
+        if balance_data is None or decimals_data is None:
+            balances.append(None)
+            continue
+        (raw,) = w3.codec.decode(["uint256"], balance_data)
+        (decimals,) = w3.codec.decode(["uint8"], decimals_data)
+        balances.append((raw, decimals))
+    return balances
+
+
+class MulticallCapability(VeritasCapability):
+    """
+    Batched read-only queries through Multicall3 (e.g. every known token balance at once).
+    """
+
+    def __init__(self, agent: Any):
+        super().__init__("portfolio")
+        self.agent = agent
+        self.network_id = getattr(agent, "network", "base-sepolia")
+
+        self.tools.append(
+            VeritasTool(
+                name="get_portfolio_balances",
+                description=(
+                    "Get balances of all known tokens (or the given symbols) on the current "
+                    "network in a single call."
+                ),
+                func=self.get_portfolio_balances,
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "address": {
+                            "type": "string",
+                            "description": "Address to check (defaults to agent's wallet)",
+                        },
+                        "symbols": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Token symbols to include (defaults to all)",
+                        },
+                    },
+                },
+            )
+        )
+
+    async def get_portfolio_balances(
+        self, address: Optional[str] = None, symbols: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        tokens = TOKEN_ADDRESSES_BY_SYMBOLS.get(self.network_id, {})
+        if symbols:
+            unknown = [s for s in symbols if s.upper() not in tokens]
+            if unknown:
+                raise ValueError(f"Tokens {unknown} not found on {self.network_id}")
+            tokens = {s.upper(): tokens[s.upper()] for s in symbols}
+
+        owner = Web3.to_checksum_address(address) if address else self.agent.account.address
+        results = await get_balances(self.agent.async_w3, owner, list(tokens.values()))
+
+        balances = {
+            symbol: None if result is None else float(Decimal(result[0]) / Decimal(10 ** result[1]))
+            for symbol, result in zip(tokens, results)
+        }
+        return {"address": owner, "network": self.network_id, "balances": balances}
@@ -1,10 +1,14 @@
 import asyncio
 from typing import Any, Dict, Optional
-from .base import VeritasCapability, VeritasTool
+from .base import (
+    VeritasCapability,
+    VeritasTool,
+    cached_contract,
+    chain_id_for,
+    checksum_address,
+    sign_and_send,
+)
 from .constants import (
-    ERC721_ABI,
-    L2_RESOLVER_ABI,
-    REGISTRAR_ABI,
     BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_MAINNET,
     BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_TESTNET,
     L2_RESOLVER_ADDRESS_MAINNET,
@@ -21,6 +25,7 @@ class ERC721Capability(VeritasCapability):
     def __init__(self, agent: Any):
         super().__init__("nft")
         self.agent = agent
+        self.chain_id = chain_id_for(getattr(agent, "network", "base-sepolia"))
 
         self.tools.append(
             VeritasTool(
@@ -63,42 +68,32 @@ class ERC721Capability(VeritasCapability):
 
     async def get_balance(self, contract_address: str, address: Optional[str] = None) -> Dict[str, Any]:
         target = address if address else self.agent.account.address
-        contract = self.agent.w3.eth.contract(
-            address=self.agent.w3.to_checksum_address(contract_address), abi=ERC721_ABI
-        )
+        contract = cached_contract(self.agent.w3, contract_address, "ERC721_ABI")
         balance = await asyncio.to_thread(
-            contract.functions.balanceOf(self.agent.w3.to_checksum_address(target)).call
+            contract.functions.balanceOf(checksum_address(target)).call
         )
         return {"contract": contract_address, "balance": balance, "owner": target}
 
     async def transfer(self, contract_address: str, to_address: str, token_id: int) -> Dict[str, Any]:
         w3 = self.agent.w3
-        contract = w3.eth.contract(address=w3.to_checksum_address(contract_address), abi=ERC721_ABI)
-
-        network_id = getattr(self.agent, "network", "base-sepolia")
-        chain_id = 84532 if "sepolia" in network_id else 8453
-
-        gas_price = await asyncio.to_thread(w3.eth.gas_price)
-        nonce = await asyncio.to_thread(
-            w3.eth.get_transaction_count, self.agent.account.address
-        )
-
-        tx = contract.functions.safeTransferFrom(
-            self.agent.account.address, w3.to_checksum_address(to_address), token_id
-        ).build_transaction(
-            {
-                "chainId": chain_id,
-                "gas": 150000,
-                "gasPrice": gas_price,
-                "nonce": nonce,
-                "from": self.agent.account.address,
-            }
+        contract = cached_contract(w3, contract_address, "ERC721_ABI")
+        data = contract.encode_abi(
+            "safeTransferFrom",
+            args=[self.agent.account.address, checksum_address(to_address), token_id],
         )
 
-        signed = w3.eth.account.sign_transaction(tx, self.agent.account.key)
-        tx_hash = await asyncio.to_thread(
-            w3.eth.send_raw_transaction, signed.raw_transaction
-        )
+        gas_price, nonce = await self.agent.next_tx_params()
+        tx = {
+            "to": contract.address,
+            "data": data,
+            "value": 0,
+            "chainId": self.chain_id,
+            "gas": 150000,
+            "gasPrice": gas_price,
+            "nonce": nonce,
+            "from": self.agent.account.address,
+        }
+        tx_hash = await sign_and_send(self.agent, tx)
 
         return {"status": "success", "tx_hash": w3.to_hex(tx_hash), "token_id": token_id}
 
@@ -111,6 +106,17 @@ class BasenameCapability(VeritasCapability):
     def __init__(self, agent: Any):
         super().__init__("basename")
         self.agent = agent
+        self.chain_id = chain_id_for(getattr(agent, "network", "base-sepolia"))
+        self.is_mainnet = self.chain_id == 8453
+        self.suffix = ".base.eth" if self.is_mainnet else ".basetest.eth"
+        self.registrar_address = (
+            BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_MAINNET
+            if self.is_mainnet
+            else BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_TESTNET
+        )
+        self.resolver_address = (
+            L2_RESOLVER_ADDRESS_MAINNET if self.is_mainnet else L2_RESOLVER_ADDRESS_TESTNET
+        )
 
         self.tools.append(
             VeritasTool(
@@ -136,23 +142,11 @@ class BasenameCapability(VeritasCapability):
 
     async def register(self, basename: str, amount: str = "0.00001") -> Dict[str, Any]:
         w3 = self.agent.w3
-        network_id = getattr(self.agent, "network", "base-sepolia")
-        is_mainnet = "sepolia" not in network_id
-
-        suffix = ".base.eth" if is_mainnet else ".basetest.eth"
+        suffix = self.suffix
         full_name = basename if basename.endswith(suffix) else f"{basename}{suffix}"
 
-        registrar_addr = (
-            BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_MAINNET
-            if is_mainnet
-            else BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_TESTNET
-        )
-        resolver_addr = L2_RESOLVER_ADDRESS_MAINNET if is_mainnet else L2_RESOLVER_ADDRESS_TESTNET
-
-        resolver_contract = w3.eth.contract(abi=L2_RESOLVER_ABI)
-        registrar_contract = w3.eth.contract(
-            address=w3.to_checksum_address(registrar_addr), abi=REGISTRAR_ABI
-        )
+        resolver_contract = cached_contract(w3, self.resolver_address, "L2_RESOLVER_ABI")
+        registrar_contract = cached_contract(w3, self.registrar_address, "REGISTRAR_ABI")
 
         name_hash = w3.ens.namehash(full_name)
         address_data = resolver_contract.encode_abi(
@@ -164,30 +158,24 @@ class BasenameCapability(VeritasCapability):
             "name": full_name.replace(suffix, ""),
             "owner": self.agent.account.address,
             "duration": int(REGISTRATION_DURATION),
-            "resolver": w3.to_checksum_address(resolver_addr),
+            "resolver": resolver_contract.address,
             "data": [address_data, name_data],
             "reverseRecord": True,
         }
 
-        gas_price = await asyncio.to_thread(w3.eth.gas_price)
-        nonce = await asyncio.to_thread(
-            w3.eth.get_transaction_count, self.agent.account.address
-        )
-
-        tx = registrar_contract.functions.register(register_request).build_transaction(
-            {
-                "chainId": 84532 if not is_mainnet else 8453,
-                "value": w3.to_wei(amount, "ether"),
-                "gas": 300000,
-                "gasPrice": gas_price,
-                "nonce": nonce,
-                "from": self.agent.account.address,
-            }
-        )
-
-        signed = w3.eth.account.sign_transaction(tx, self.agent.account.key)
-        tx_hash = await asyncio.to_thread(
-            w3.eth.send_raw_transaction, signed.raw_transaction
-        )
+        data = registrar_contract.encode_abi("register", args=[register_request])
+
+        gas_price, nonce = await self.agent.next_tx_params()
+        tx = {
+            "to": registrar_contract.address,
+            "data": data,
+            "value": w3.to_wei(amount, "ether"),
+            "chainId": self.chain_id,
+            "gas": 300000,
+            "gasPrice": gas_price,
+            "nonce": nonce,
+            "from": self.agent.account.address,
+        }
+        tx_hash = await sign_and_send(self.agent, tx)
 
         return {"status": "success", "basename": full_name, "tx_hash": w3.to_hex(tx_hash)}
@@ -6,7 +6,7 @@ import base64
 import time
 import hashlib
 from eth_account import Account
-from .base import VeritasCapability, VeritasTool
+from .base import VeritasCapability, VeritasTool, chain_id_for
 
 USDC_ADDRESSES = {
     "base-mainnet": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
@@ -49,6 +49,9 @@ class PaymentCapability(VeritasCapability):
     def __init__(self, agent: Any):
         super().__init__("payments")
         self.agent = agent
+        self.network_id = getattr(agent, "network", "base-sepolia")
+        self.chain_id = chain_id_for(self.network_id)
+        self.usdc_address = USDC_ADDRESSES.get(self.network_id, USDC_ADDRESSES.get("base-sepolia"))
 
         self.tools.append(
             VeritasTool(
@@ -175,13 +178,6 @@ class PaymentCapability(VeritasCapability):
             )
         )
 
-    def _get_network(self) -> str:
-        return getattr(self.agent, "network", "base-sepolia")
-
-    def _get_usdc_address(self) -> str:
-        network = self._get_network()
-        return USDC_ADDRESSES.get(network, USDC_ADDRESSES.get("base-sepolia"))
-
     async def _is_smart_wallet(self) -> bool:
         try:
             w3 = self.agent.w3
@@ -218,7 +214,7 @@ class PaymentCapability(VeritasCapability):
         try:
             w3 = self.agent.w3
             from_address = self.agent.account.address
-            usdc_address = self._get_usdc_address()
+            usdc_address = self.usdc_address
 
             amount_wei = int(amount_usdc * 10**6)
 
@@ -226,7 +222,7 @@ class PaymentCapability(VeritasCapability):
             valid_before = valid_after + 3600
             nonce = hashlib.sha256(f"{from_address}{time.time()}".encode()).digest()
 
-            chain_id = 84532 if self._get_network() == "base-sepolia" else 8453
+            chain_id = self.chain_id
 
             eip712_domain_hash = w3.keccak(
                 text="EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
@@ -310,7 +306,7 @@ class PaymentCapability(VeritasCapability):
         try:
             w3 = self.agent.w3
             sender = self.agent.account.address
-            usdc_address = self._get_usdc_address()
+            usdc_address = self.usdc_address
             amount_wei = int(amount_usdc * 10**6)
 
             nonce = 1
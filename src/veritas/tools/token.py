@@ -1,8 +1,18 @@
 import asyncio
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from decimal import Decimal
-from .base import VeritasCapability, VeritasTool
-from .constants import ERC20_ABI, WETH_ABI, TOKEN_ADDRESSES_BY_SYMBOLS
+from .base import (
+    VeritasCapability,
+    VeritasTool,
+    cached_contract,
+    chain_id_for,
+    checksum_address,
+    contract_metadata,
+    sign_and_send,
+    store_contract_metadata,
+)
+from .constants import TOKEN_ADDRESSES_BY_SYMBOLS, encode_call
+from .multicall import aggregate
 
 
 class TokenCapability(VeritasCapability):
@@ -13,6 +23,8 @@ class TokenCapability(VeritasCapability):
     def __init__(self, agent: Any):
         super().__init__("token")
         self.agent = agent
+        self.network_id = getattr(agent, "network", "base-sepolia")
+        self.chain_id = chain_id_for(self.network_id)
 
         # --- ERC20 Tools ---
         self.tools.append(
@@ -151,85 +163,98 @@ class TokenCapability(VeritasCapability):
             )
         )
 
-    def _get_contract(self, address: str, abi: list):
-        return self.agent.w3.eth.contract(
-            address=self.agent.w3.to_checksum_address(address), abi=abi
-        )
+    async def _read_token(
+        self, token_address: str, owner: Optional[str] = None
+    ) -> Tuple[Optional[int], Tuple[int, str]]:
+        """decimals, symbol and (if `owner` is given) balanceOf in one Multicall3 eth_call."""
+        w3 = self.agent.async_w3
+        token = checksum_address(token_address)
+        calls = [(token, encode_call("decimals()")), (token, encode_call("symbol()"))]
+        if owner is not None:
+            calls.append((token, encode_call("balanceOf(address)", owner)))
+        results = await aggregate(w3, calls)
+        if results[0] is None or (owner is not None and results[2] is None):
+            raise ValueError(f"Token {token_address} did not answer decimals()/balanceOf()")
+
+        (decimals,) = w3.codec.decode(["uint8"], results[0])
+        balance = w3.codec.decode(["uint256"], results[2])[0] if owner is not None else None
+        try:
+            (symbol,) = w3.codec.decode(["string"], results[1])
+        except Exception:
+            # Symbol not cached so the next call retries it
+            store_contract_metadata(self.chain_id, token, decimals=decimals)
+            return balance, (decimals, "")
+        store_contract_metadata(self.chain_id, token, decimals=decimals, symbol=symbol)
+        return balance, (decimals, symbol)
+
+    def _cached_metadata(self, token_address: str) -> Optional[Tuple[int, str]]:
+        cached = contract_metadata(self.chain_id, token_address)
+        if "decimals" in cached and "symbol" in cached:
+            return cached["decimals"], cached["symbol"]
+        return None
+
+    async def _get_metadata(self, token_address: str) -> Tuple[int, str]:
+        """(decimals, symbol) of a token, read from the chain once per network."""
+        metadata = self._cached_metadata(token_address)
+        if metadata is None:
+            _, metadata = await self._read_token(token_address)
+        return metadata
 
     async def get_balance(self, token_address: str, address: Optional[str] = None) -> Dict[str, Any]:
         target_address = address if address else self.agent.account.address
-        contract = self._get_contract(token_address, ERC20_ABI)
+        owner = checksum_address(target_address)
 
-        balance = await asyncio.to_thread(
-            contract.functions.balanceOf(
-                self.agent.w3.to_checksum_address(target_address)
-            ).call
-        )
-        decimals = await asyncio.to_thread(contract.functions.decimals().call)
-        symbol = await asyncio.to_thread(contract.functions.symbol().call)
+        metadata = self._cached_metadata(token_address)
+        if metadata is None:
+            balance, (decimals, symbol) = await self._read_token(token_address, owner)
+        else:
+            contract = cached_contract(self.agent.w3, token_address, "ERC20_ABI")
+            balance = await asyncio.to_thread(contract.functions.balanceOf(owner).call)
+            decimals, symbol = metadata
 
         readable = Decimal(balance) / Decimal(10**decimals)
         return {"symbol": symbol, "balance": float(readable), "address": target_address}
 
+    def _tx(self, to: str, data: str, gas: int, gas_price: int, nonce: int, value: int = 0):
+        return {
+            "to": to,
+            "data": data,
+            "value": value,
+            "chainId": self.chain_id,
+            "gas": gas,
+            "gasPrice": gas_price,
+            "nonce": nonce,
+            "from": self.agent.account.address,
+        }
+
     async def transfer(self, token_address: str, to_address: str, amount: str) -> Dict[str, Any]:
         w3 = self.agent.w3
-        contract = self._get_contract(token_address, ERC20_ABI)
-        decimals = await asyncio.to_thread(contract.functions.decimals().call)
+        decimals, _ = await self._get_metadata(token_address)
 
         # Convert to raw units
         raw_amount = int(Decimal(amount) * (10**decimals))
-
-        gas_price = await asyncio.to_thread(w3.eth.gas_price)
-        nonce = await asyncio.to_thread(
-            w3.eth.get_transaction_count, self.agent.account.address
+        data = encode_call(
+            "transfer(address,uint256)", checksum_address(to_address), raw_amount
         )
 
-        tx = contract.functions.transfer(
-            w3.to_checksum_address(to_address), raw_amount
-        ).build_transaction(
-            {
-                "chainId": 84532,  # TODO: Dynamic Chain ID from agent.network
-                "gas": 100000,  # Basic estimation, ideally simulate
-                "gasPrice": gas_price,
-                "nonce": nonce,
-                "from": self.agent.account.address,
-            }
-        )
-
-        signed = w3.eth.account.sign_transaction(tx, self.agent.account.key)
-        tx_hash = await asyncio.to_thread(
-            w3.eth.send_raw_transaction, signed.raw_transaction
-        )
+        gas_price, nonce = await self.agent.next_tx_params()
+        # Basic estimation, ideally simulate
+        tx = self._tx(checksum_address(token_address), data, 100000, gas_price, nonce)
+        tx_hash = await sign_and_send(self.agent, tx)
 
         return {"status": "success", "tx_hash": w3.to_hex(tx_hash), "amount": amount}
 
     async def approve(self, token_address: str, spender_address: str, amount: str) -> Dict[str, Any]:
         w3 = self.agent.w3
-        contract = self._get_contract(token_address, ERC20_ABI)
-        decimals = await asyncio.to_thread(contract.functions.decimals().call)
+        decimals, _ = await self._get_metadata(token_address)
         raw_amount = int(Decimal(amount) * (10**decimals))
-
-        gas_price = await asyncio.to_thread(w3.eth.gas_price)
-        nonce = await asyncio.to_thread(
-            w3.eth.get_transaction_count, self.agent.account.address
+        data = encode_call(
+            "approve(address,uint256)", checksum_address(spender_address), raw_amount
         )
 
-        tx = contract.functions.approve(
-            w3.to_checksum_address(spender_address), raw_amount
-        ).build_transaction(
-            {
-                "chainId": 84532,
-                "gas": 100000,
-                "gasPrice": gas_price,
-                "nonce": nonce,
-                "from": self.agent.account.address,
-            }
-        )
-
-        signed = w3.eth.account.sign_transaction(tx, self.agent.account.key)
-        tx_hash = await asyncio.to_thread(
-            w3.eth.send_raw_transaction, signed.raw_transaction
-        )
+        gas_price, nonce = await self.agent.next_tx_params()
+        tx = self._tx(checksum_address(token_address), data, 100000, gas_price, nonce)
+        tx_hash = await sign_and_send(self.agent, tx)
 
         return {
             "status": "success",
@@ -239,13 +264,12 @@ class TokenCapability(VeritasCapability):
         }
 
     async def get_allowance(self, token_address: str, spender_address: str) -> Dict[str, Any]:
-        w3 = self.agent.w3
-        contract = self._get_contract(token_address, ERC20_ABI)
-        decimals = await asyncio.to_thread(contract.functions.decimals().call)
+        contract = cached_contract(self.agent.w3, token_address, "ERC20_ABI")
+        decimals, _ = await self._get_metadata(token_address)
 
         allowance = await asyncio.to_thread(
             contract.functions.allowance(
-                self.agent.account.address, w3.to_checksum_address(spender_address)
+                self.agent.account.address, checksum_address(spender_address)
             ).call
         )
 
@@ -253,19 +277,15 @@ class TokenCapability(VeritasCapability):
         return {"allowance": float(readable), "token": token_address, "spender": spender_address}
 
     def get_token_address(self, symbol: str) -> str:
-        # Check network ID from agent (defaulting to base-sepolia for now if not set)
-        network_id = getattr(self.agent, "network", "base-sepolia")
-        tokens = TOKEN_ADDRESSES_BY_SYMBOLS.get(network_id, {})
+        tokens = TOKEN_ADDRESSES_BY_SYMBOLS.get(self.network_id, {})
         address = tokens.get(symbol.upper())
         if not address:
             available = list(tokens.keys())
-            return f"Error: Token {symbol} not found on {network_id}. Available: {available}"
+            return f"Error: Token {symbol} not found on {self.network_id}. Available: {available}"
         return address
 
     def _get_weth_address(self) -> Optional[str]:
-        network_id = getattr(self.agent, "network", "base-sepolia")
-        tokens = TOKEN_ADDRESSES_BY_SYMBOLS.get(network_id, {})
-        return tokens.get("WETH")
+        return TOKEN_ADDRESSES_BY_SYMBOLS.get(self.network_id, {}).get("WETH")
 
     async def wrap_eth(self, amount: str) -> Dict[str, Any]:
         w3 = self.agent.w3
@@ -275,28 +295,11 @@ class TokenCapability(VeritasCapability):
 
         wei_amount = w3.to_wei(Decimal(amount), "ether")
 
-        contract = self._get_contract(weth_address, WETH_ABI)
-
-        gas_price = await asyncio.to_thread(w3.eth.gas_price)
-        nonce = await asyncio.to_thread(
-            w3.eth.get_transaction_count, self.agent.account.address
-        )
-
-        tx = contract.functions.deposit().build_transaction(
-            {
-                "chainId": 84532,
-                "value": wei_amount,
-                "gas": 100000,
-                "gasPrice": gas_price,
-                "nonce": nonce,
-                "from": self.agent.account.address,
-            }
-        )
+        data = cached_contract(w3, weth_address, "WETH_ABI").encode_abi("deposit")
 
-        signed = w3.eth.account.sign_transaction(tx, self.agent.account.key)
-        tx_hash = await asyncio.to_thread(
-            w3.eth.send_raw_transaction, signed.raw_transaction
-        )
+        gas_price, nonce = await self.agent.next_tx_params()
+        tx = self._tx(weth_address, data, 100000, gas_price, nonce, value=wei_amount)
+        tx_hash = await sign_and_send(self.agent, tx)
 
         return {"status": "success", "tx_hash": w3.to_hex(tx_hash), "wrapped_amount": amount}
 
@@ -308,26 +311,11 @@ class TokenCapability(VeritasCapability):
 
         wei_amount = w3.to_wei(Decimal(amount), "ether")
 
-        contract = self._get_contract(weth_address, WETH_ABI)
-
-        gas_price = await asyncio.to_thread(w3.eth.gas_price)
-        nonce = await asyncio.to_thread(
-            w3.eth.get_transaction_count, self.agent.account.address
-        )
-
-        tx = contract.functions.withdraw(wei_amount).build_transaction(
-            {
-                "chainId": 84532,
-                "gas": 100000,
-                "gasPrice": gas_price,
-                "nonce": nonce,
-                "from": self.agent.account.address,
-            }
-        )
+        weth = cached_contract(w3, weth_address, "WETH_ABI")
+        data = weth.encode_abi("withdraw", args=[wei_amount])
 
-        signed = w3.eth.account.sign_transaction(tx, self.agent.account.key)
-        tx_hash = await asyncio.to_thread(
-            w3.eth.send_raw_transaction, signed.raw_transaction
-        )
+        gas_price, nonce = await self.agent.next_tx_params()
+        tx = self._tx(weth_address, data, 100000, gas_price, nonce)
+        tx_hash = await sign_and_send(self.agent, tx)
 
         return {"status": "success", "tx_hash": w3.to_hex(tx_hash), "unwrapped_amount": amount}
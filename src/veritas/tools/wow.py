@@ -1,7 +1,13 @@
 import os
+from itertools import count
 from typing import Any, Dict
 from .base import VeritasCapability, VeritasTool
 
+# Dry-run token addresses: a 0xdead prefix keeps them clear of the precompiles at 0x01..,
+# a per-process salt keeps runs apart, and a counter avoids a urandom syscall per call
+_MOCK_PREFIX = "dead" + os.urandom(14).hex()
+_mock_addresses = count(1)
+
 
 class CreatorCapability(VeritasCapability):
     """
@@ -30,13 +36,14 @@ class CreatorCapability(VeritasCapability):
         )
 
     def launch_token(self, name: str, symbol: str, description: str = "") -> Dict[str, Any]:
-        # Wraps the Zora Wow factory contract interaction
-        print(f"[Wow] Launching token: {name} ({symbol})...")
+        # Launches are simulated; there is no Zora Wow factory integration yet
+        print(f"[Wow] Simulating token launch: {name} ({symbol})...")
 
         return {
             "status": "launched",
             "name": name,
             "symbol": symbol,
-            "token_address": f"0x{os.urandom(20).hex()}",
+            "token_address": f"0x{_MOCK_PREFIX}{next(_mock_addresses):08x}",
             "platform": "zora_wow",
+            "dry_run": True,
         }
@@ -23,16 +23,13 @@ class VeritasVerifier:
             return False, "No logs found in proof file", details
 
         # 1. Re-calculate Merkle Tree and Verify Individual Rows
-        tree = MerkleTree()
+        # Deterministic serialization; the tree is built in one pass over all rows
+        tree = MerkleTree([json.dumps(log_entry, sort_keys=True) for log_entry in logs])
         row_integrity_failed = False
 
         for i, log_entry in enumerate(logs):
-            # Deterministic serialization check
-            hashable_data = json.dumps(log_entry, sort_keys=True)
-
             # Calculate what the hash SHOULD be based on this content
-            calculated_leaf = tree._hash(hashable_data)
-            tree.add_leaf(hashable_data)
+            calculated_leaf = tree.get_leaf_hash(i)
 
             # Row-Level Verification
             if claimed_leaves and i < len(claimed_leaves):
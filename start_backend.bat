@@ -1,4 +1,4 @@
 @echo off
 cd veritas
-uv run uvicorn veritas.api.main:app --reload
+uv run uvicorn veritas.api.main:app --reload --ws-per-message-deflate true
 pause
\ No newline at end of file
@@ -1,6 +1,9 @@
+import asyncio
 import unittest
-from unittest.mock import MagicMock, patch
-from veritas.attestor import VeritasAttestor
+from unittest.mock import AsyncMock, MagicMock, patch
+from eth_abi import encode
+from web3 import Web3
+from veritas.attestor import EAS_CONTRACT_ADDRESS, VeritasAttestor, _load_eas_abi
 
 
 class TestAttestor(unittest.IsolatedAsyncioTestCase):
@@ -12,19 +15,17 @@ class TestAttestor(unittest.IsolatedAsyncioTestCase):
 
         self.attestor = VeritasAttestor(self.mock_client, self.mock_account)
 
-    @patch("veritas.attestor.Web3")
-    async def test_attest_root_success(self, MockWeb3):
-        # Setup Mock Web3
+    async def test_attest_root_success(self):
+        # Setup Mock Web3 (built once in __init__, so swap it on the instance)
         mock_w3 = MagicMock()
-        MockWeb3.return_value = mock_w3
-        MockWeb3.HTTPProvider.return_value = MagicMock()
+        self.attestor.w3 = mock_w3
 
-        # Mock Connection
-        mock_w3.is_connected.return_value = True
-
-        # Mock Gas/Nonce
-        mock_w3.eth.gas_price = 1000000000
-        mock_w3.eth.get_transaction_count.return_value = 5
+        # Mock Nonce/Block/Fees
+        mock_w3.eth.get_transaction_count = AsyncMock(return_value=5)
+        mock_w3.eth.block_number = AsyncMock(return_value=100)()
+        mock_w3.eth.fee_history = AsyncMock(
+            return_value={"baseFeePerGas": [1000000000], "reward": [[1000], [2000], [3000]]}
+        )
 
         # Mock Signing
         mock_signed_tx = MagicMock()
@@ -32,14 +33,98 @@ class TestAttestor(unittest.IsolatedAsyncioTestCase):
         mock_w3.eth.account.sign_transaction.return_value = mock_signed_tx
 
         # Mock Broadcast
-        mock_w3.eth.send_raw_transaction.return_value = b"tx_hash_bytes"
+        mock_w3.eth.send_raw_transaction = AsyncMock(return_value=b"tx_hash_bytes")
         mock_w3.to_hex.return_value = "0xTransactionHash"
 
         # Execute
-        result = await self.attestor.attest_root("0x" + "00" * 32, "schema_uid")
+        schema_uid = "0x" + "11" * 32
+        with patch("veritas.attestor.time.time", return_value=1700000000):
+            result = await self.attestor.attest_root("0x" + "00" * 32, schema_uid, "agent-1")
 
         # Verify - just check it returns something and doesn't raise
         self.assertIsNotNone(result)
+        mock_w3.eth.send_raw_transaction.assert_awaited_once_with(b"raw_tx_bytes")
+
+        # Hand-encoded calldata must match what the EAS contract wrapper would produce
+        tx_data = mock_w3.eth.account.sign_transaction.call_args.args[0]
+        payload = encode(["bytes32", "string", "uint256"], [bytes(32), "agent-1", 1700000000])
+        zero_address = "0x0000000000000000000000000000000000000000"
+        request = (bytes.fromhex(schema_uid[2:]), (zero_address, 0, True, bytes(32), payload, 0))
+        eas = Web3().eth.contract(address=EAS_CONTRACT_ADDRESS, abi=_load_eas_abi())
+        self.assertEqual("0x" + tx_data["data"].hex(), eas.encode_abi("attest", [request]))
+        self.assertEqual(tx_data["to"], EAS_CONTRACT_ADDRESS)
+
+    async def test_nonce_counted_locally_and_resynced_on_stale_nonce(self):
+        mock_w3 = MagicMock()
+        mock_w3.eth.get_transaction_count = AsyncMock(side_effect=[5, 9])
+        mock_w3.eth.send_raw_transaction = AsyncMock(
+            side_effect=[ValueError("nonce too low"), b"tx_hash_bytes"]
+        )
+        self.attestor.w3 = mock_w3
+
+        self.assertEqual(await self.attestor._reserve_nonce(), 5)
+        self.assertEqual(await self.attestor._reserve_nonce(), 6)
+        self.assertEqual(mock_w3.eth.get_transaction_count.await_count, 1)
+
+        sent_nonces = []
+        sign_and_send = self.attestor._sign_and_send
+
+        async def record_and_send(tx_data):
+            sent_nonces.append(tx_data["nonce"])
+            return await sign_and_send(tx_data)
+
+        self.attestor._sign_and_send = record_and_send
+        mock_w3.eth.block_number = AsyncMock(return_value=100)()
+        mock_w3.eth.fee_history = AsyncMock(return_value={"baseFeePerGas": [1], "reward": [[1]]})
+
+        await self.attestor.attest_root("0x" + "00" * 32)
+
+        self.assertEqual(sent_nonces, [7, 9])
+        self.assertEqual(self.attestor._next_nonce, 10)
+
+    async def test_fees_cached_per_block(self):
+        mock_w3 = MagicMock()
+        mock_w3.eth.fee_history = AsyncMock(
+            return_value={"baseFeePerGas": [100, 200], "reward": [[10], [30], [20]]}
+        )
+        self.attestor.w3 = mock_w3
+
+        self.assertEqual(await self.attestor._fees(1), (420, 20))
+        self.assertEqual(await self.attestor._fees(1), (420, 20))
+        self.assertEqual(mock_w3.eth.fee_history.await_count, 1)
+
+        await self.attestor._fees(2)
+        self.assertEqual(mock_w3.eth.fee_history.await_count, 2)
+
+    async def test_cached_rpc_coalesces_concurrent_calls(self):
+        fetch = AsyncMock(return_value=100)
+        results = await asyncio.gather(
+            *[self.attestor._cached_rpc("block_number", 1.0, fetch) for _ in range(3)]
+        )
+        self.assertEqual(results, [100, 100, 100])
+        self.assertEqual(fetch.await_count, 1)
+
+        # Failures are not cached
+        failing = AsyncMock(side_effect=[ConnectionError("rpc down"), 7])
+        with self.assertRaises(ConnectionError):
+            await self.attestor._cached_rpc("gas", 1.0, failing)
+        self.assertEqual(await self.attestor._cached_rpc("gas", 1.0, failing), 7)
+
+    def test_encode_payload_matches_abi_encode(self):
+        root = bytes(range(32))
+        agent_ids = ["veritas-agent", "an agent name longer than thirty-two bytes", "x" * 32, ""]
+        for agent_id in agent_ids:
+            expected = encode(["bytes32", "string", "uint256"], [root, agent_id, 1700000000])
+            self.assertEqual(self.attestor._encode_payload(root, agent_id, 1700000000), expected)
+
+        # Template is reused; a second call must not leak the previous root/timestamp
+        other = b"\xff" * 32
+        expected = encode(["bytes32", "string", "uint256"], [other, "veritas-agent", 1])
+        self.assertEqual(self.attestor._encode_payload(other, "veritas-agent", 1), expected)
+
+    def test_encode_payload_rejects_short_root(self):
+        with self.assertRaises(ValueError):
+            self.attestor._encode_payload(b"\x00" * 31, "veritas-agent", 0)
 
 
 if __name__ == "__main__":
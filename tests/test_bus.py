@@ -0,0 +1,153 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import fakeredis
+
+from veritas.api import bus as bus_module
+from veritas.api.bus import OWNER_TTL, RedisBus
+
+
+async def _until(condition, timeout: float = 2.0):
+    """Wait for a condition set by the bus's background tasks."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestRedisBus(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # One fake server shared by two "workers"
+        self.server = fakeredis.FakeServer()
+        self.events = {"a": [], "b": []}
+        self.controls = {"a": [], "b": []}
+        self.buses = {}
+        for name in ("a", "b"):
+            with patch.object(
+                bus_module.redis,
+                "from_url",
+                return_value=fakeredis.FakeAsyncRedis(server=self.server),
+            ):
+                self.buses[name] = RedisBus(
+                    "redis://fake",
+                    on_event=lambda agent_id, data, name=name: self.events[name].append(
+                        (agent_id, data)
+                    ),
+                    on_control=self._control_handler(name),
+                )
+                await self.buses[name].start()
+
+    async def asyncTearDown(self):
+        for bus in self.buses.values():
+            await bus.close()
+
+    def _control_handler(self, name):
+        async def handler(agent_id, message):
+            self.controls[name].append((agent_id, message))
+
+        return handler
+
+    async def test_publish_fans_out_to_every_worker(self):
+        """Test an event published by one worker reaches every worker's WS clients."""
+        self.buses["a"].publish_event("agent1", b'{"type": "log"}')
+
+        await _until(lambda: self.events["a"] and self.events["b"])
+        self.assertEqual(self.events["b"], [("agent1", b'{"type": "log"}')])
+        self.assertEqual(self.events["a"], [("agent1", b'{"type": "log"}')])
+
+    async def test_ownership_ttl_and_heartbeat(self):
+        """Test ownership is exclusive, expires without heartbeats and is released."""
+        bus_a, bus_b = self.buses["a"], self.buses["b"]
+        self.assertTrue(await bus_a.claim("agent1"))
+        self.assertFalse(await bus_b.claim("agent1"))
+
+        key = "agent:agent1:owner"
+        self.assertLessEqual(await bus_a._redis.ttl(key), OWNER_TTL)
+        await bus_a._redis.expire(key, 1)
+        await bus_a.refresh_ownership()
+        self.assertGreater(await bus_a._redis.ttl(key), 1)
+
+        # Another worker's release leaves the key alone; the owner's deletes it
+        await bus_b.release("agent1")
+        self.assertEqual(await bus_a._redis.get(key), bus_a.worker_id.encode())
+        await bus_a.release("agent1")
+        self.assertIsNone(await bus_a._redis.get(key))
+        self.assertTrue(await bus_b.claim("agent1"))
+
+    async def test_control_routed_to_owner_only(self):
+        """Test control messages are handled by the owning worker and not elsewhere."""
+        self.assertFalse(await self.buses["b"].send_control("agent1", {"action": "stop"}))
+
+        await self.buses["a"].claim("agent1")
+        self.assertTrue(await self.buses["b"].send_control("agent1", {"action": "stop"}))
+
+        await _until(lambda: self.controls["a"])
+        self.assertEqual(self.controls["a"], [("agent1", {"action": "stop"})])
+        self.assertEqual(self.controls["b"], [])
+
+    async def test_slow_control_does_not_block_events(self):
+        """Test events keep flowing while a control handler is still running."""
+        release = asyncio.Event()
+
+        async def slow_handler(agent_id, message):
+            await release.wait()
+
+        self.buses["a"]._on_control = slow_handler
+        await self.buses["a"].claim("agent1")
+        await self.buses["b"].send_control("agent1", {"action": "stop"})
+        await _until(lambda: self.buses["a"]._control_tasks)
+
+        self.buses["b"].publish_event("agent1", b"{}")
+        await _until(lambda: self.events["a"])
+        release.set()
+
+    async def test_reader_resubscribes_after_connection_loss(self):
+        """Test a dropped subscription is logged and re-established."""
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        client = fakeredis.FakeAsyncRedis(server=self.server)
+        real_pubsub = client.pubsub
+
+        class DroppedPubSub:
+            async def psubscribe(self, *patterns):
+                pass
+
+            async def listen(self):
+                raise RedisConnectionError("connection reset")
+                yield
+
+            async def aclose(self):
+                pass
+
+        opened = []
+
+        def pubsub():
+            opened.append(DroppedPubSub() if not opened else real_pubsub())
+            return opened[-1]
+
+        client.pubsub = pubsub
+        received = []
+        with (
+            patch.object(bus_module.redis, "from_url", return_value=client),
+            patch.object(bus_module, "RECONNECT_DELAY", 0),
+            self.assertLogs("veritas.api.bus", "WARNING"),
+        ):
+            self.buses["c"] = RedisBus(
+                "redis://fake", on_event=lambda *args: received.append(args), on_control=None
+            )
+            await self.buses["c"].start()
+            await _until(lambda: len(opened) == 2)
+
+        # The second subscription is live once it sees events again
+        def republish():
+            self.buses["a"].publish_event("agent1", b"{}")
+            return received
+
+        await _until(republish)
+        self.assertFalse(self.buses["c"]._tasks[0].done())
+
+
+if __name__ == "__main__":
+    unittest.main()
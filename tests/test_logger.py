@@ -82,6 +82,75 @@ class TestLogger(unittest.TestCase):
         # Cleanup
         os.remove(filename)
 
+    def test_payload_cached(self):
+        """Test the cached JSON payload matches the model and carries the leaf hash."""
+        entry = self.logger.log_action("tool_a", {"param": 1}, "ok")
+
+        payload = entry.to_payload()
+        self.assertEqual(payload, entry.model_dump(mode="json"))
+        self.assertEqual(payload["merkle_leaf"], entry.merkle_leaf)
+        self.assertIs(entry.to_payload(), payload)
+
+    def test_export_proofs_verifies(self):
+        """Test exported proofs verify and the cached leaf preimage matches the leaf hash."""
+        from veritas.verifier import VeritasVerifier
+
+        filename = "test_export_proofs.json"
+        entry = self.logger.log_action("tool_a", {"param": "ü"}, 1.5)
+        self.logger.log_action("tool_b", {}, "ok", basis_id=entry.id)
+        self.assertEqual(
+            self.logger._merkle_tree._hash(entry.to_hashable_json()), entry.merkle_leaf
+        )
+
+        self.logger.export_proofs(filename, include_proofs=True)
+        try:
+            with open(filename, "r") as f:
+                proof_data = json.load(f)
+        finally:
+            os.remove(filename)
+
+        self.assertEqual(proof_data["session_root"], self.logger.get_current_root())
+        is_valid, _, _ = VeritasVerifier.verify_session(proof_data)
+        self.assertTrue(is_valid)
+        tree = self.logger._merkle_tree
+        self.assertTrue(
+            tree.verify_proof(
+                entry.to_hashable_json(), proof_data["proofs"][0], proof_data["session_root"]
+            )
+        )
+
+    def test_spill_keeps_logs_and_proofs(self):
+        """Test spilled entries are evicted from memory but still returned and exported."""
+        import tempfile
+        from veritas.logger import SPILL_BATCH
+        from veritas.verifier import VeritasVerifier
+
+        with tempfile.TemporaryDirectory() as tmp:
+            spilling = VeritasLogger(spill_path=os.path.join(tmp, "spill.jsonl"))
+            count = 2 * SPILL_BATCH + 5
+            for i in range(count):
+                spilling.log_action(f"tool_{i}", {"i": i}, "ok")
+
+            self.assertLess(len(spilling._logs), count)
+            # Only leaf hashes stay in the tree, not the spilled preimages
+            self.assertEqual(spilling._merkle_tree.leaf_count, count)
+            self.assertFalse(hasattr(spilling._merkle_tree, "leaves"))
+            logs = spilling.get_logs()
+            self.assertEqual([log.tool_name for log in logs], [f"tool_{i}" for i in range(count)])
+            self.assertEqual(logs[0].merkle_leaf, spilling._merkle_tree.get_leaf_hash(0))
+            self.assertEqual(
+                [log.tool_name for log in spilling.recent_logs(3)],
+                [f"tool_{i}" for i in range(count - 3, count)],
+            )
+
+            filename = os.path.join(tmp, "proofs.json")
+            spilling.export_proofs(filename)
+            with open(filename, "r") as f:
+                proof_data = json.load(f)
+            self.assertEqual(len(proof_data["logs"]), count)
+            is_valid, _, _ = VeritasVerifier.verify_session(proof_data)
+            self.assertTrue(is_valid)
+
     def test_wrapper_decorator_sync(self):
         """Test the @wrap decorator for sync functions."""
 
@@ -97,6 +166,20 @@ class TestLogger(unittest.TestCase):
         self.assertEqual(logs[0].tool_name, "wrapped_tool")
         self.assertIn("3", logs[0].output_result)
 
+    def test_wrapper_bounds_large_params(self):
+        """Test wrapped-call params keep str() for small values and are bounded for big ones."""
+
+        @self.logger.wrap(tool_name="rpc_tool")
+        def rpc_call(small, big, name="x"):
+            return "ok"
+
+        rpc_call({"a": 1}, {str(i): "v" * 1000 for i in range(100)}, name="abc")
+
+        params = self.logger.get_logs()[0].input_params
+        self.assertEqual(params["args"][0], str({"a": 1}))
+        self.assertEqual(params["kwargs"], {"name": "abc"})
+        self.assertLess(len(params["args"][1]), 4000)
+
     def test_wrapper_decorator_async(self):
         """Test the @wrap decorator for async functions."""
         import asyncio
@@ -33,5 +33,44 @@ class TestMerkleTree(unittest.TestCase):
         # Should fail if data is different
         self.assertFalse(tree.verify_proof("fake_data", proof, root))
 
+    def test_incremental_matches_full_build(self):
+        tree = MerkleTree()
+        for n in range(1, 34):
+            leaf_hash = tree.add_leaf(f"tx{n}")
+            self.assertEqual(leaf_hash, tree.get_leaf_hash(n - 1))
+            rebuilt = MerkleTree([f"tx{i}" for i in range(1, n + 1)])
+            self.assertEqual(tree.tree, rebuilt.tree)
+            self.assertEqual(tree.get_root(), rebuilt.get_root())
+
+        root = tree.get_root()
+        for index in (0, 16, 32):
+            self.assertTrue(tree.verify_proof(f"tx{index + 1}", tree.get_proof(index), root))
+
+    def test_bytes_leaves_match_str_leaves(self):
+        data = ["tx1", "tx2", "ünïcode"]
+        tree = MerkleTree(data)
+        bytes_tree = MerkleTree()
+        for leaf in data:
+            bytes_tree.add_leaf(leaf.encode("utf-8"))
+        self.assertEqual(bytes_tree.get_root(), tree.get_root())
+        self.assertTrue(tree.verify_proof(b"tx2", tree.get_proof(1), tree.get_root()))
+
+    def test_all_proofs_match_get_proof(self):
+        for n in range(1, 20):
+            tree = MerkleTree([f"tx{i}" for i in range(n)])
+            self.assertEqual(tree.all_proofs(), [tree.get_proof(i) for i in range(n)])
+        self.assertEqual(MerkleTree().all_proofs(), [])
+
+    def test_parallel_leaf_hashing_matches_serial(self):
+        from unittest import mock
+
+        leaves = [f"{i:04d}" * 600 for i in range(1100)]
+        with mock.patch("veritas.merkle.os.cpu_count", return_value=1):
+            serial = MerkleTree(leaves[:])
+        with mock.patch("veritas.merkle.os.cpu_count", return_value=4):
+            parallel = MerkleTree(leaves[:])
+        self.assertEqual(parallel.tree, serial.tree)
+
+
 if __name__ == "__main__":
     unittest.main()
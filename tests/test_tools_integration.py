@@ -5,13 +5,23 @@ import os
 # Add src to path so we can import veritas
 sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 from veritas.tools.token import TokenCapability
 from veritas.tools.nft import ERC721Capability, BasenameCapability
 from veritas.tools.defi import AaveCapability, CompoundCapability
 from veritas.tools.infra import PythCapability, OnrampCapability
 from veritas.tools.base import WalletCapability
-from decimal import Decimal
+from veritas.tools.multicall import MulticallCapability
+from veritas.tools.base import clear_contract_metadata, store_contract_metadata
+from veritas.tools.constants import (
+    AAVE_POOL_ADDRESSES,
+    BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_TESTNET,
+    COMET_ADDRESSES,
+    TOKEN_ADDRESSES_BY_SYMBOLS,
+    encode_call,
+)
+from web3 import Web3
 
 
 class TestVeritasTools(unittest.TestCase):
@@ -25,8 +35,6 @@ class TestVeritasTools(unittest.TestCase):
         self.mock_w3 = MagicMock()
         self.mock_agent.w3 = self.mock_w3
         self.mock_w3.to_checksum_address.side_effect = lambda x: x  # Identity for test
-        self.mock_w3.eth.gas_price = 1000000000
-        self.mock_w3.eth.get_transaction_count.return_value = 5
         self.mock_w3.to_hex.return_value = "0xhash"
 
         # Mock Contract
@@ -34,85 +42,114 @@ class TestVeritasTools(unittest.TestCase):
         self.mock_w3.eth.contract.return_value = self.mock_contract
 
         # Mock Contract Functions
-        self.mock_contract.functions.transfer.return_value.build_transaction.return_value = {
-            "data": "0x123"
-        }
-        self.mock_contract.functions.approve.return_value.build_transaction.return_value = {
-            "data": "0x456"
-        }
-        self.mock_contract.functions.deposit.return_value.build_transaction.return_value = {
-            "data": "0x789"
-        }
-        self.mock_contract.functions.withdraw.return_value.build_transaction.return_value = {
-            "data": "0xabc"
-        }
         self.mock_contract.functions.balanceOf.return_value.call.return_value = (
             1000000000000000000  # 1 ETH/Token
         )
         self.mock_contract.functions.decimals.return_value.call.return_value = 18
         self.mock_contract.functions.symbol.return_value.call.return_value = "TST"
 
-        # Mock Account Sign
-        self.mock_w3.eth.account.sign_transaction.return_value.raw_transaction = b"signed_tx"
+        # Transactions take gas price and nonce from the agent's shared counter
+        self.mock_agent.next_tx_params = AsyncMock(return_value=(1000000000, 7))
+        self.addCleanup(clear_contract_metadata)
+
+    def _run_and_capture_tx(self, module, coro_factory):
+        """Run a tool call with signing stubbed; returns its result and the tx it sent."""
+        with patch(
+            f"veritas.tools.{module}.sign_and_send", AsyncMock(return_value=b"\xab" * 32)
+        ) as send:
+            res = asyncio.run(coro_factory())
+        send.assert_awaited_once()
+        agent, tx = send.await_args[0]
+        self.assertIs(agent, self.mock_agent)
+        self.assertEqual((tx["chainId"], tx["nonce"], tx["gasPrice"]), (84532, 7, 1000000000))
+        return res, tx
 
     def test_wallet_capability(self):
         print("\nTesting Wallet Capability...")
         cap = WalletCapability(self.mock_agent)
 
         # Test Get Balance
-        self.mock_w3.eth.get_balance.return_value = 5000000000000000000  # 5 ETH
-        self.mock_w3.from_wei.return_value = Decimal("5.0")
-        bal = cap.get_balance()
+        self.mock_agent.chain_read = AsyncMock(return_value=5000000000000000000)  # 5 ETH
+        bal = asyncio.run(cap.get_balance())
         self.assertEqual(bal["balance_eth"], 5.0)
         print("OK: Wallet Balance")
 
     def test_token_capability(self):
         print("\nTesting Token Capability (ERC20/WETH)...")
+        self.mock_agent.w3 = Web3()
         cap = TokenCapability(self.mock_agent)
+        token, recipient = Web3.to_checksum_address("0x" + "22" * 20), "0x" + "33" * 20
+        store_contract_metadata(84532, token, decimals=18, symbol="TST")
 
         # Test ERC20 Transfer
-        res = cap.transfer("0xtoken", "0xrecipient", "1.0")
+        res, tx = self._run_and_capture_tx("token", lambda: cap.transfer(token, recipient, "1.0"))
         self.assertEqual(res["status"], "success")
-        self.mock_contract.functions.transfer.assert_called()
+        self.assertEqual(tx["to"], token)
+        self.assertEqual(
+            tx["data"],
+            encode_call("transfer(address,uint256)", Web3.to_checksum_address(recipient), 10**18),
+        )
         print("OK: ERC20 Transfer")
 
         # Test WETH Wrap
-        res = cap.wrap_eth("0.5")
+        res, tx = self._run_and_capture_tx("token", lambda: cap.wrap_eth("0.5"))
         self.assertEqual(res["status"], "success")
-        self.mock_contract.functions.deposit.return_value.build_transaction.assert_called()
+        self.assertEqual(tx["to"], TOKEN_ADDRESSES_BY_SYMBOLS["base-sepolia"]["WETH"])
+        self.assertEqual((tx["data"], tx["value"]), ("0xd0e30db0", 5 * 10**17))  # deposit()
         print("OK: WETH Wrap")
 
     def test_nft_capability(self):
         print("\nTesting NFT Capability...")
+        self.mock_agent.w3 = Web3()
         cap = ERC721Capability(self.mock_agent)
+        nft = Web3.to_checksum_address("0x" + "44" * 20)
 
         # Test Transfer
-        cap.transfer("0xnft", "0xrecipient", 1)
-        self.mock_contract.functions.safeTransferFrom.assert_called()
+        res, tx = self._run_and_capture_tx("nft", lambda: cap.transfer(nft, "0x" + "55" * 20, 1))
+        self.assertEqual(res["token_id"], 1)
+        self.assertEqual(tx["to"], nft)
+        self.assertEqual(tx["data"][:10], "0x42842e0e")  # safeTransferFrom(address,address,uint256)
         print("OK: NFT Transfer")
 
     def test_basename_capability(self):
         print("\nTesting Basename Capability...")
+        w3 = Web3()
+        w3.ens = MagicMock()  # ENS name normalization is not needed for the calldata checks
+        w3.ens.namehash.return_value = b"\x00" * 32
+        self.mock_agent.w3 = w3
         cap = BasenameCapability(self.mock_agent)
 
         # Test Register
-        res = cap.register("myname")
+        res, tx = self._run_and_capture_tx("nft", lambda: cap.register("myname"))
         self.assertEqual(res["basename"], "myname.basetest.eth")  # Sepolia defaults
-        self.mock_contract.functions.register.assert_called()
+        self.assertEqual(tx["to"], BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_TESTNET)
+        self.assertEqual(tx["value"], Web3.to_wei("0.00001", "ether"))
+        selector = Web3.keccak(text="register((string,address,uint256,address,bytes[],bool))")
+        self.assertEqual(tx["data"][:10], Web3.to_hex(selector[:4]))
         print("OK: Basename Register")
 
     def test_defi_capability(self):
         print("\nTesting DeFi Capability (Aave)...")
         cap = AaveCapability(self.mock_agent)
+        usdc = TOKEN_ADDRESSES_BY_SYMBOLS["base-sepolia"]["USDC"]
+        store_contract_metadata(84532, usdc, decimals=6)
+        self.mock_agent.async_w3.eth.call = AsyncMock(return_value=b"")
 
-        # Mock Supply
-        self.mock_contract.functions.supply.return_value.build_transaction.return_value = {
-            "data": "0xsupply"
-        }
-
-        res = cap.supply("USDC", "100")
+        # Test Supply
+        res, tx = self._run_and_capture_tx("defi", lambda: cap.supply("USDC", "100"))
         self.assertEqual(res["status"], "success")
-        self.mock_contract.functions.supply.assert_called()
+        self.assertEqual(tx["to"], AAVE_POOL_ADDRESSES["base-sepolia"])
+        self.assertEqual(
+            tx["data"],
+            encode_call(
+                "supply(address,uint256,address,uint16)",
+                usdc,
+                100 * 10**6,
+                self.mock_agent.account.address,
+                0,
+            ),
+        )
+        self.mock_agent.async_w3.eth.call.assert_awaited_once()
         print("OK: Aave Supply")
 
     def test_infra_capability(self):
@@ -120,31 +157,174 @@ class TestVeritasTools(unittest.TestCase):
         cap = PythCapability(self.mock_agent)
 
         # Mock Pyth Price - just verify it doesn't crash
-        self.mock_contract.functions.getPrice.return_value.call.return_value = (
-            200000000000,
-            100,
-            -8,
-            1234567890,
+        async_contract = self.mock_agent.async_w3.eth.contract.return_value
+        async_contract.functions.getPriceUnsafe.return_value.call = AsyncMock(
+            return_value=(200000000000, 100, -8, 1234567890)
         )
 
-        res = cap.get_price("0x" + "feed" * 16)
+        res = asyncio.run(cap.get_price("0x" + "feed" * 16))
         self.assertIn("price", res)
         print("OK: Pyth Price")
 
     def test_compound_capability(self):
         print("\nTesting Compound Capability...")
         cap = CompoundCapability(self.mock_agent)
+        usdc = TOKEN_ADDRESSES_BY_SYMBOLS["base-sepolia"]["USDC"]
+        store_contract_metadata(84532, usdc, decimals=6)
+        self.mock_agent.async_w3.eth.call = AsyncMock(return_value=b"")
 
-        # Mock Supply
-        self.mock_contract.functions.supply.return_value.build_transaction.return_value = {
-            "data": "0xcompound_supply"
-        }
-
-        res = cap.supply("USDC", "100")
+        # Test Supply
+        res, tx = self._run_and_capture_tx("defi", lambda: cap.supply("USDC", "100"))
         self.assertEqual(res["status"], "success")
-        self.mock_contract.functions.supply.assert_called()
+        self.assertEqual(tx["to"], COMET_ADDRESSES["base-sepolia"])
+        self.assertEqual(tx["data"], encode_call("supply(address,uint256)", usdc, 100 * 10**6))
         print("OK: Compound Supply")
 
+    def test_native_transfer_resets_nonce_on_failed_send(self):
+        cap = WalletCapability(self.mock_agent)
+        self.mock_agent.next_tx_params = AsyncMock(return_value=(1000000000, 7))
+        async_w3 = self.mock_agent.async_w3
+        async_w3.eth.account.sign_transaction.return_value.raw_transaction = b"signed_tx"
+        async_w3.eth.send_raw_transaction = AsyncMock(side_effect=ValueError("rejected"))
+
+        with self.assertRaises(ValueError):
+            asyncio.run(cap.native_transfer("0x" + "11" * 20, "0.1"))
+        tx = async_w3.eth.account.sign_transaction.call_args[0][0]
+        self.assertEqual((tx["nonce"], tx["gasPrice"]), (7, 1000000000))
+        self.mock_agent.attestor.reset_nonce.assert_called_once()
+
+    def test_tx_params_release_nonce_when_gas_read_fails(self):
+        from veritas.agent import VeritasAgent
+
+        agent = MagicMock()
+        agent.chain_read = AsyncMock(side_effect=ConnectionError("gas price unavailable"))
+        agent.attestor.reserve_nonce = AsyncMock(return_value=7)
+
+        with self.assertRaises(ConnectionError):
+            asyncio.run(VeritasAgent.next_tx_params(agent))
+        agent.attestor.reset_nonce.assert_called_once()
+
+        # Nothing was reserved, so the counter is left alone
+        agent.attestor.reset_nonce.reset_mock()
+        agent.attestor.reserve_nonce = AsyncMock(side_effect=ConnectionError("node down"))
+        with self.assertRaises(ConnectionError):
+            asyncio.run(VeritasAgent.next_tx_params(agent))
+        agent.attestor.reset_nonce.assert_not_called()
+
+    def test_token_metadata_read_once(self):
+        from web3 import AsyncHTTPProvider, AsyncWeb3
+        from veritas.tools.base import clear_contract_metadata
+
+        clear_contract_metadata()
+        w3 = AsyncWeb3(AsyncHTTPProvider("http://127.0.0.1:8545"))  # eth.call is mocked
+        encode = lambda typ, value: (True, w3.codec.encode([typ], [value]))
+        results = [encode("uint8", 6), encode("string", "USDC"), encode("uint256", 2500000)]
+        w3.eth.call = AsyncMock(return_value=w3.codec.encode(["(bool,bytes)[]"], [results]))
+        self.mock_agent.async_w3 = w3
+        cap = TokenCapability(self.mock_agent)
+
+        # Cold: balanceOf, decimals and symbol share one Multicall3 eth_call
+        res = asyncio.run(cap.get_balance("0x" + "22" * 20))
+        self.assertEqual((res["symbol"], res["balance"]), ("USDC", 2.5))
+        # Warm: only balanceOf is read
+        res = asyncio.run(cap.get_balance("0x" + "22" * 20))
+        self.assertEqual((res["symbol"], res["balance"]), ("USDC", 1e12))
+        self.mock_contract.functions.allowance.return_value.call.return_value = 0
+        asyncio.run(cap.get_allowance("0x" + "22" * 20, "0x" + "33" * 20))
+
+        w3.eth.call.assert_awaited_once()
+        self.mock_contract.functions.decimals.assert_not_called()
+        self.mock_contract.functions.symbol.assert_not_called()
+        clear_contract_metadata()
+
+    def test_failed_simulation_releases_nonce(self):
+        cap = AaveCapability(self.mock_agent)
+        self.mock_agent.next_tx_params = AsyncMock(return_value=(1000000000, 7))
+        async_w3 = self.mock_agent.async_w3
+        async_w3.eth.call = AsyncMock(side_effect=ValueError("execution reverted"))
+        async_w3.eth.send_raw_transaction = AsyncMock()
+
+        with self.assertRaisesRegex(Exception, "simulation failed"):
+            asyncio.run(cap._simulate_and_send({"to": "0x" + "11" * 20, "data": "0x"}))
+        self.mock_agent.next_tx_params.assert_awaited_once()
+        self.mock_agent.attestor.reset_nonce.assert_called_once()
+        async_w3.eth.send_raw_transaction.assert_not_awaited()
+
+    def test_portfolio_balances_single_call(self):
+        from web3 import AsyncHTTPProvider, AsyncWeb3
+
+        w3 = AsyncWeb3(AsyncHTTPProvider("http://127.0.0.1:8545"))  # eth.call is mocked
+        ok = lambda typ, value: (True, w3.codec.encode([typ], [value]))
+        results = [ok("uint256", 1500000), ok("uint8", 6), (False, b""), ok("uint8", 6)]
+        w3.eth.call = AsyncMock(return_value=w3.codec.encode(["(bool,bytes)[]"], [results]))
+        self.mock_agent.async_w3 = w3
+        cap = MulticallCapability(self.mock_agent)
+
+        res = asyncio.run(cap.get_portfolio_balances(symbols=["usdc", "EURC"]))
+        self.assertEqual(res["balances"], {"USDC": 1.5, "EURC": None})
+        w3.eth.call.assert_awaited_once()
+
+    def test_tool_argument_validation(self):
+        tool = MulticallCapability(self.mock_agent).tools[0]
+        tool.validate_args({"symbols": ["USDC"], "address": None})
+        with self.assertRaises(ValueError):
+            tool.validate_args({"symbols": "USDC"})
+
+        transfer = TokenCapability(self.mock_agent).tools[0]
+        transfer.validate_args({"token_address": "0xa", "to_address": "0xb", "amount": 1.5})
+        with self.assertRaisesRegex(ValueError, "to_address"):
+            transfer.validate_args({"token_address": "0xa", "amount": "1"})
+
+    def test_selector_calldata_matches_contract_encoding(self):
+        from web3 import Web3
+        from veritas.tools import constants
+
+        w3 = Web3()
+        asset = constants.TOKEN_ADDRESSES_BY_SYMBOLS["base-mainnet"]["USDC"]
+        pool = w3.eth.contract(address=asset, abi=constants.AAVE_POOL_ABI)
+        self.assertEqual(
+            constants.encode_call("supply(address,uint256,address,uint16)", asset, 5, asset, 0),
+            pool.encode_abi("supply", args=[asset, 5, asset, 0]),
+        )
+        comet = w3.eth.contract(address=asset, abi=constants.COMET_ABI)
+        self.assertEqual(
+            constants.encode_call("supply(address,uint256)", asset, 5),
+            comet.encode_abi("supply", args=[asset, 5]),
+        )
+
+    def test_constants_frozen_and_checksummed(self):
+        from web3 import Web3
+        from veritas.tools import constants
+
+        for abi in (constants.ERC20_ABI, constants.MULTICALL3_ABI):
+            self.assertIsInstance(abi, tuple)
+            with self.assertRaises(TypeError):
+                abi[0]["name"] = "other"
+        pool = constants.AAVE_POOL_ADDRESSES["base-mainnet"]
+        self.assertEqual(pool, Web3.to_checksum_address(pool))
+        with self.assertRaises(TypeError):
+            constants.TOKEN_ADDRESSES_BY_SYMBOLS["base-mainnet"]["FOO"] = pool
+
+    def test_mock_launch_addresses(self):
+        from veritas.tools.wow import CreatorCapability
+
+        creator = CreatorCapability(self.mock_agent)
+        first = creator.launch_token("A", "A")["token_address"]
+        second = creator.launch_token("B", "B")["token_address"]
+        self.assertNotEqual(first, second)
+        self.assertTrue(first.startswith("0xdead") and len(first) == 42)
+        self.assertTrue(creator.launch_token("C", "C")["dry_run"])
+
+    def test_cached_contract_reused(self):
+        from web3 import Web3
+        from veritas.tools.base import cached_contract, checksum_address
+
+        w3 = Web3()
+        pool = "0xa238dd80c259a72e81d7e4664a9801593f98d1c5"
+        self.assertEqual(checksum_address(pool), Web3.to_checksum_address(pool))
+        contract = cached_contract(w3, pool, "AAVE_POOL_ABI")
+        self.assertEqual(contract.address, Web3.to_checksum_address(pool))
+        self.assertIs(cached_contract(w3, pool, "AAVE_POOL_ABI"), contract)
 
 if __name__ == "__main__":
     unittest.main()